@@ -0,0 +1,103 @@
+"""
+Benchmark: per-trace vs batch resampling and statistics in SParameterAnalyzer
+
+Loop  = interpolate_data-style np.interp + calculate_gain_statistics per trace
+Batch = interpolate_batch + calculate_gain_statistics_batch on concatenated traces
+
+Traces have different lengths and frequency ranges (ragged), all covering a common band.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prototype.utils.sparameter import SParameterAnalyzer
+
+
+def make_ragged_traces(num_traces: int, num_points: int = 1601, seed: int = 0):
+    """(freqs, gains) lists with +/-20% length and slightly different start/stop per trace"""
+    rng = np.random.default_rng(seed)
+    freqs, gains = [], []
+    for _ in range(num_traces):
+        n = int(num_points * rng.uniform(0.8, 1.2))
+        freq = np.sort(rng.uniform(2490, 2700, n))
+        freq[0], freq[-1] = rng.uniform(2480, 2496), rng.uniform(2690, 2710)
+        gain = 15 + 2 * np.sin(freq / 20 + rng.uniform(0, np.pi)) + rng.normal(0, 0.2, n)
+        freqs.append(freq)
+        gains.append(gain)
+    return freqs, gains
+
+
+def resample_loop(freqs, gains, freq_grid):
+    matrix = np.vstack([np.interp(freq_grid, freq, gain) for freq, gain in zip(freqs, gains)])
+    stats = [SParameterAnalyzer.calculate_gain_statistics(gain) for gain in gains]
+    return matrix, stats
+
+
+def resample_batch(freq, gain, offsets, freq_grid):
+    _, matrix = SParameterAnalyzer.interpolate_batch(freq, gain, offsets, freq_grid=freq_grid)
+    stats = SParameterAnalyzer.calculate_gain_statistics_batch(gain, offsets)
+    return matrix, stats
+
+
+def benchmark_batch_resampling(trace_counts=(10, 100, 500), num_points: int = 1601,
+                               grid_points: int = 1000, repeats: int = 5):
+    """
+    Args:
+        trace_counts: Numbers of traces to resample
+        num_points: Mean points per trace
+        grid_points: Points on the common grid
+        repeats: Runs per size
+    """
+    print("=" * 70)
+    print("Batch Resampling Benchmark")
+    print("=" * 70)
+    print(f"\nPoints per trace: ~{num_points}, grid points: {grid_points}, repeats: {repeats}\n")
+
+    print(f"  {'traces':>7} {'loop':>9} {'batch':>9} {'speedup':>8} {'max |diff|':>11}")
+    results = {}
+    for num_traces in trace_counts:
+        freqs, gains = make_ragged_traces(num_traces, num_points)
+        freq, offsets = SParameterAnalyzer.concat_traces(freqs)
+        gain, _ = SParameterAnalyzer.concat_traces(gains)
+        freq_grid = np.linspace(2496, 2690, grid_points)
+
+        timings = {'loop': [], 'batch': []}
+        for _ in range(repeats):
+            start = time.perf_counter()
+            loop_matrix, loop_stats = resample_loop(freqs, gains, freq_grid)
+            timings['loop'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            batch_matrix, batch_stats = resample_batch(freq, gain, offsets, freq_grid)
+            timings['batch'].append(time.perf_counter() - start)
+
+        diff = np.abs(loop_matrix - batch_matrix).max()
+        for key in ('mean', 'max', 'min', 'std'):
+            diff = max(diff, np.abs(np.array([s[key] for s in loop_stats]) - batch_stats[key]).max())
+
+        loop_ms = min(timings['loop']) * 1000
+        batch_ms = min(timings['batch']) * 1000
+        results[num_traces] = {'loop_ms': loop_ms, 'batch_ms': batch_ms, 'max_diff': diff}
+        print(f"  {num_traces:7} {loop_ms:7.1f}ms {batch_ms:7.1f}ms {loop_ms / batch_ms:7.1f}x {diff:11.2e}")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark batch resampling and statistics")
+    parser.add_argument('--traces', '-t', type=int, nargs='+', default=[10, 100, 500], help='Trace counts')
+    parser.add_argument('--points', '-p', type=int, default=1601, help='Mean points per trace')
+    parser.add_argument('--grid', '-g', type=int, default=1000, help='Common grid points')
+    parser.add_argument('--repeats', '-n', type=int, default=5, help='Runs per size')
+
+    args = parser.parse_args()
+
+    benchmark_batch_resampling(trace_counts=args.traces, num_points=args.points,
+                               grid_points=args.grid, repeats=args.repeats)
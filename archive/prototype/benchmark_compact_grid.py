@@ -0,0 +1,69 @@
+"""
+Benchmark: ChartGenerator.create_compact_grid() figure construction time
+
+Measures building the Plotly figure only (no rendering) for 4 x N grids.
+Construction should grow linearly with the number of cells.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prototype.benchmark_renderer_pool import make_synthetic_grid
+from prototype.utils.chart_generator import ChartGenerator
+
+
+def benchmark_compact_grid(columns=(5, 20, 60), repeats: int = 5, num_points: int = 1601):
+    """
+    Args:
+        columns: Grid column counts (CA combinations) to measure, 4 rows each
+        repeats: Constructions per grid size
+        num_points: Points per trace
+    """
+    print("=" * 70)
+    print("Compact Grid Construction Benchmark")
+    print("=" * 70)
+    print(f"\nPoints per trace: {num_points}, repeats: {repeats}\n")
+
+    # First figure pays plotly's one-time validator imports
+    ChartGenerator.create_compact_grid(make_synthetic_grid(1, 10), band='B41', lna_gain_state='G0_H', input_port='ANT1')
+
+    print(f"  {'grid':8} {'cells':>6} {'mean':>9} {'min':>9} {'per cell':>10}")
+    results = {}
+    for num_ca in columns:
+        grid_data = make_synthetic_grid(num_ca, num_points)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            ChartGenerator.create_compact_grid(
+                grid_data=grid_data,
+                band='B41',
+                lna_gain_state='G0_H',
+                input_port='ANT1'
+            )
+            timings.append(time.perf_counter() - start)
+
+        cells = 4 * num_ca
+        timings = np.array(timings)
+        results[num_ca] = timings
+        print(f"  4 x {num_ca:<4} {cells:6} {timings.mean() * 1000:7.0f}ms {timings.min() * 1000:7.0f}ms "
+              f"{timings.mean() * 1000 / cells:8.2f}ms")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark compact grid figure construction")
+    parser.add_argument('--columns', '-c', type=int, nargs='+', default=[5, 20, 60], help='Grid columns to measure')
+    parser.add_argument('--repeats', '-n', type=int, default=5, help='Constructions per grid size')
+    parser.add_argument('--points', '-p', type=int, default=1601, help='Points per trace')
+
+    args = parser.parse_args()
+
+    benchmark_compact_grid(columns=args.columns, repeats=args.repeats, num_points=args.points)
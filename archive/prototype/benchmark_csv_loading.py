@@ -0,0 +1,151 @@
+"""
+Benchmark: full read_csv vs column-pruned, typed loading of the consolidated CSV
+
+Full   = pd.read_csv() on all 89 columns with inferred dtypes (the previous load_consolidated)
+Pruned = CsvParser.load_consolidated(): 8 columns, categorical labels, float32 gain
+Chunks = CsvParser.iter_consolidated(): same columns, constant memory
+
+Each loader runs in a fresh process; memory is the peak RSS growth during the load.
+"""
+
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prototype.parsers.csv_parser import CsvParser
+
+TOTAL_COLUMNS = 89
+
+
+def make_synthetic_csv(path: Path, rows: int = 2_000_000, block: int = 200_000) -> Path:
+    """Consolidated-format CSV with CsvParser.CONSOLIDATED_COLUMNS plus filler up to 89 columns"""
+    rng = np.random.default_rng(0)
+    bands = ['B1', 'B3', 'B7', 'B41', 'n77', 'n78', 'n79']
+    ports_in = {'ANT1': '06', 'ANT2': '05', 'ANTL': '02'}
+    ports_out = {'RXOUT1': '07', 'RXOUT2': '03', 'RXOUT3': '08', 'RXOUT4': '04'}
+    filler = TOTAL_COLUMNS - len(CsvParser.CONSOLIDATED_COLUMNS) - 2
+
+    for start in range(0, rows, block):
+        n = min(block, rows - start)
+        port_1 = rng.choice(list(ports_in), n)
+        port_2 = rng.choice(list(ports_out), n)
+        band = rng.choice(bands, n)
+        df = pd.DataFrame({
+            'Freq Type': 'IB',
+            'RAT': np.where(np.char.startswith(band, 'n'), 'NR', 'LTE'),
+            'Cfg Band': band,
+            'Frequency': rng.uniform(600, 6000, n).round(3),
+            'Active RF Path': ['S' + ports_out[o] + ports_in[i] for i, o in zip(port_1, port_2)],
+            'Gain (dB)': rng.normal(15, 2, n).round(3),
+            'cfg-active_port_1': port_1,
+            'cfg-active_port_2': port_2,
+            'cfg-lna_gain_state': rng.choice(['G0_H', 'G0_L', 'G1', 'G2', 'G3', 'G4', 'G5'], n),
+            'debug-nplexer_bank': rng.choice(['B1', 'B3', 'B1+B3', 'B41', 'B41+n77', 'n77+n79'], n),
+        })
+        for idx in range(filler):
+            df[f'Param {idx}'] = rng.normal(0, 1, n).round(4) if idx % 3 else 'N/A'
+        df.to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+    return path
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def _run_loader(args) -> dict:
+    """Load once in this (fresh) process and report time, memory and rows"""
+    mode, path, engine = args
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+
+    if mode == 'full':
+        df = pd.read_csv(path)
+        rows, frame_mb = len(df), df.memory_usage(deep=True).sum() / 2**20
+    elif mode == 'pruned':
+        parser = CsvParser(path)
+        parser.load_consolidated(engine=engine)
+        rows, frame_mb = len(parser.data), parser.data.memory_usage(deep=True).sum() / 2**20
+    else:
+        rows, frame_mb = 0, 0.0
+        for chunk in CsvParser(path).iter_consolidated():
+            rows += len(chunk)
+            frame_mb = max(frame_mb, chunk.memory_usage(deep=True).sum() / 2**20)
+
+    return {
+        'seconds': time.perf_counter() - start,
+        'peak_mb': _peak_rss_mb() - baseline,
+        'frame_mb': frame_mb,
+        'rows': rows,
+    }
+
+
+def measure(mode: str, path: Path, engine: str = None) -> dict:
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        return pool.apply(_run_loader, ((mode, str(path), engine),))
+
+
+def benchmark_csv_loading(rows: int = 2_000_000, csv_path: str = None):
+    """
+    Args:
+        rows: Synthetic file rows
+        csv_path: Existing consolidated CSV to load instead of a synthetic one
+    """
+    print("=" * 70)
+    print("Consolidated CSV Loading Benchmark")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if csv_path:
+            path = Path(csv_path)
+        else:
+            path = Path(tmp) / 'synthetic_consolidated.csv'
+            start = time.perf_counter()
+            make_synthetic_csv(path, rows)
+            print(f"\nGenerated {rows:,} rows x {TOTAL_COLUMNS} columns in {time.perf_counter() - start:.1f}s")
+
+        print(f"File: {path.name} ({path.stat().st_size / 2**20:,.0f} MB)\n")
+
+        runs = [('full', 'full read_csv', None), ('pruned', 'pruned (c)', 'c')]
+        try:
+            import pyarrow  # noqa: F401
+            runs.append(('pruned', 'pruned (pyarrow)', 'pyarrow'))
+        except ImportError:
+            print("  (pyarrow not installed: skipping engine='pyarrow')")
+        runs.append(('chunks', 'iter_consolidated', None))
+
+        results = {}
+        print(f"  {'loader':20} {'time':>8} {'peak RSS':>10} {'frame':>10} {'rows':>12}")
+        for mode, label, engine in runs:
+            result = measure(mode, path, engine)
+            results[label] = result
+            print(f"  {label:20} {result['seconds']:7.2f}s {result['peak_mb']:8.0f}MB "
+                  f"{result['frame_mb']:8.0f}MB {result['rows']:12,}")
+
+    full, pruned = results['full read_csv'], results['pruned (c)']
+    print(f"\n  Load time:  {full['seconds'] / pruned['seconds']:.1f}x faster")
+    print(f"  Peak RSS:   {full['peak_mb'] / max(pruned['peak_mb'], 1):.1f}x lower")
+    print(f"  DataFrame:  {full['frame_mb'] / pruned['frame_mb']:.1f}x smaller")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark consolidated CSV loading")
+    parser.add_argument('--rows', '-n', type=int, default=2_000_000, help='Synthetic file rows')
+    parser.add_argument('--csv', help='Existing consolidated CSV (skips generation)')
+
+    args = parser.parse_args()
+
+    benchmark_csv_loading(rows=args.rows, csv_path=args.csv)
@@ -0,0 +1,111 @@
+"""
+Benchmark: cold vs warm kaleido rendering per grid page
+
+Cold = a fresh kaleido process per page (the cost each export paid before the pool)
+Warm = one RendererPool, warmed once and reused for every page
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prototype.utils.chart_generator import ChartGenerator
+from prototype.utils.renderer_pool import RendererPool
+
+
+def make_synthetic_grid(num_ca: int = 8, num_points: int = 1601) -> dict:
+    """Grid data shaped like CsvParser.get_grid_data() output"""
+    rng = np.random.default_rng(0)
+    freq = np.linspace(2496, 2690, num_points)
+
+    grid_data = {}
+    for ca_idx in range(num_ca):
+        grid_data[f'CA_{ca_idx}'] = {}
+        for rx_port in ['RXOUT1', 'RXOUT2', 'RXOUT3', 'RXOUT4']:
+            gain = 15 + np.sin(freq / 20 + ca_idx) + rng.normal(0, 0.2, num_points)
+            grid_data[f'CA_{ca_idx}'][rx_port] = {
+                'frequency': freq,
+                'gain_db': gain,
+                'count': num_points
+            }
+    return grid_data
+
+
+def summarize(label: str, timings: list) -> None:
+    timings = np.array(timings)
+    print(f"  {label:5} mean={timings.mean():.3f}s  p50={np.median(timings):.3f}s  "
+          f"min={timings.min():.3f}s  max={timings.max():.3f}s")
+
+
+def benchmark_renderer_pool(pages: int = 10, num_ca: int = 8, image_format: str = 'pdf'):
+    """
+    Render the same grid page `pages` times, cold and warm
+
+    Args:
+        pages: Number of pages per mode
+        num_ca: Grid columns (CA combinations)
+        image_format: 'pdf' or 'png'
+    """
+    print("=" * 70)
+    print("Renderer Pool Benchmark")
+    print("=" * 70)
+
+    if not RendererPool.is_available():
+        print("[ERROR] kaleido scope API not available: pip install kaleido==0.2.1")
+        return False
+
+    fig = ChartGenerator.create_compact_grid(
+        grid_data=make_synthetic_grid(num_ca),
+        band='B41',
+        lna_gain_state='G0_H',
+        input_port='ANT1'
+    )
+    print(f"\nGrid: 4 x {num_ca}, format: {image_format.upper()}, pages per mode: {pages}")
+
+    # Cold: new kaleido process for every page
+    cold = []
+    for _ in range(pages):
+        pool = RendererPool(size=1)
+        start = time.perf_counter()
+        pool.render(fig, format=image_format, width=1920, height=1200)
+        cold.append(time.perf_counter() - start)
+        pool.shutdown()
+
+    # Warm: one pool, started before the first page
+    pool = RendererPool(size=1)
+    warm_start = time.perf_counter()
+    pool.warm()
+    warm_up_time = time.perf_counter() - warm_start
+
+    warm = []
+    for _ in range(pages):
+        start = time.perf_counter()
+        pool.render(fig, format=image_format, width=1920, height=1200)
+        warm.append(time.perf_counter() - start)
+    pool.shutdown()
+
+    print("\nPer-page latency:")
+    summarize('cold', cold)
+    summarize('warm', warm)
+    print(f"\n  One-time warm-up: {warm_up_time:.3f}s")
+    print(f"  Speedup (mean):   {np.mean(cold) / np.mean(warm):.1f}x")
+    print(f"  Pool stats:       {pool.get_stats()}")
+
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark cold vs warm kaleido rendering")
+    parser.add_argument('--pages', '-n', type=int, default=10, help='Pages per mode')
+    parser.add_argument('--columns', '-c', type=int, default=8, help='Grid columns (CA combinations)')
+    parser.add_argument('--format', '-f', choices=['pdf', 'png'], default='pdf', help='Image format')
+
+    args = parser.parse_args()
+
+    benchmark_renderer_pool(pages=args.pages, num_ca=args.columns, image_format=args.format)
@@ -1,9 +1,14 @@
 """
 Batch generation script for all grid combinations
-Generates 462 grid charts (22 bands × 7 LNA states × 3 input ports)
+Generates one grid chart per band × LNA state × input port combination that has data
+(up to 462: 22 bands × 7 LNA states × 3 input ports)
 """
 
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from datetime import datetime
 import time
@@ -12,22 +17,259 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from prototype.parsers.csv_parser import CsvParser
 from prototype.utils.chart_generator import ChartGenerator
+from prototype.utils.pdf_exporter import PDFExporter, PdfPageWriter
+
+# Per-output data hash and mtime of the last generation (see _is_up_to_date)
+MANIFEST_NAME = '.grid_manifest.json'
+
+COMPACT_SIZE = (250, 150)
+PNG_SIZE = (1200, 800)  # ChartGenerator.export_to_image() default
+
+# One file per grid vs. one report over all grids (built from in-memory PNGs)
+FILE_FORMATS = ('html', 'png')
+REPORT_FORMATS = ('pdf', 'pptx')
+FORMAT_SETS = {
+    'html': ('html',),
+    'png': ('png',),
+    'pdf': ('pdf',),
+    'pptx': ('pptx',),
+    'all': FILE_FORMATS + REPORT_FORMATS,
+}
+REPORT_NAME = 'grid_report'
+
+
+def grid_data_hash(grid_data: dict, file_format: str, plotlyjs: str = 'directory') -> str:
+    """Hash of a grid's CA/RXOUT cells (labels and arrays) and the output options"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{file_format}|{COMPACT_SIZE}".encode())
+    if file_format == 'html':
+        digest.update(f"|{plotlyjs}".encode())
+    for ca_combo, cells in grid_data.items():
+        for rx_port, cell in cells.items():
+            digest.update(f"|{ca_combo}|{rx_port}|{cell['count']}|".encode())
+            digest.update(cell['frequency'].tobytes())
+            digest.update(cell['gain_db'].tobytes())
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir: Path, manifest: dict) -> None:
+    path = output_dir / MANIFEST_NAME
+    temp_path = path.with_suffix('.tmp')
+    temp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def _is_up_to_date(filepath: Path, entry: dict, data_hash: str) -> bool:
+    """
+    Output exists, was generated from the same data, and was not touched since
+
+    The recorded mtime must match, so a file replaced or edited by hand is regenerated.
+    """
+    if not entry or entry.get('hash') != data_hash:
+        return False
+    try:
+        return filepath.stat().st_mtime_ns == entry.get('mtime_ns')
+    except OSError:
+        return False
+
+
+def render_grid(task: dict) -> dict:
+    """
+    Render one grid to every requested output (runs in a worker process)
+
+    The figure is built once and rasterized once by the worker's persistent
+    kaleido renderer (RendererPool); the same PNG bytes are written as the
+    .png file and returned for the PPT slide, and the PDF page is JPEG-encoded
+    here so the parent only appends pages. When the .png file is up to date
+    and only report images are needed, its bytes are read instead of rendering.
+
+    Args:
+        task: {'index', 'stem', 'output_dir', 'band', 'lna', 'port', 'grid_data',
+               'write': file formats to write ('html', 'png'), 'reuse_png',
+               'slide': return PNG bytes, 'page': return a JPEG PDF page, 'plotlyjs'}
+
+    Returns:
+        {'index', 'stem', 'seconds', 'files': {filename: {'bytes', 'mtime_ns'}},
+         'png': bytes or None, 'page': (jpeg, width, height) or None}, or
+        {'index', 'stem', 'error'}
+    """
+    stem = task['stem']
+    output_dir = Path(task['output_dir'])
+    write = task['write']
+    start = time.perf_counter()
+
+    try:
+        fig = None
+        needs_png = 'png' in write or task['slide'] or task['page']
+
+        if 'html' in write or (needs_png and not task['reuse_png']):
+            fig = ChartGenerator.create_compact_grid(
+                grid_data=task['grid_data'],
+                band=task['band'],
+                lna_gain_state=task['lna'],
+                input_port=task['port'],
+                compact_size=COMPACT_SIZE
+            )
+
+        files = {}
+        if 'html' in write:
+            filepath = output_dir / f"{stem}.html"
+            ChartGenerator.export_to_html(fig, str(filepath), include_plotlyjs=task['plotlyjs'], auto_open=False)
+            files[filepath.name] = filepath
+
+        png_bytes = None
+        if needs_png:
+            png_path = output_dir / f"{stem}.png"
+            if task['reuse_png']:
+                png_bytes = png_path.read_bytes()
+            else:
+                png_bytes = ChartGenerator.render_image(fig, format='png', width=PNG_SIZE[0], height=PNG_SIZE[1])
+            if 'png' in write:
+                png_path.write_bytes(png_bytes)
+                files[png_path.name] = png_path
+
+        page = PDFExporter.encode_page(png_bytes) if task['page'] else None
+        if task['page'] and page is None:
+            raise ValueError("Rendered image could not be encoded as a PDF page")
+
+        stats = {name: path.stat() for name, path in files.items()}
+        return {
+            'index': task['index'],
+            'stem': stem,
+            'seconds': time.perf_counter() - start,
+            'files': {name: {'bytes': st.st_size, 'mtime_ns': st.st_mtime_ns} for name, st in stats.items()},
+            'png': png_bytes if task['slide'] else None,
+            'page': page,
+        }
+    except Exception as e:
+        return {'index': task['index'], 'stem': stem, 'error': str(e)}
+
+
+class _ReportWriter:
+    """
+    PDF/PPT reports fed from in-memory render results, in combination order
+
+    Results arrive in completion order; out-of-order ones wait in a small
+    buffer (bounded by the tasks in flight) until their predecessors arrive.
+    PDF pages are written to disk as they come; the PPT is saved on close().
+    """
+
+    def __init__(self, output_dir: Path, formats, template_path: Path = None):
+        self.next_index = 0
+        self.waiting = {}
+        self.pdf = None
+        self.ppt = None
+        self.pdf_path = output_dir / f"{REPORT_NAME}.pdf"
+        self.ppt_path = output_dir / f"{REPORT_NAME}.pptx"
+
+        if 'pdf' in formats:
+            self.pdf = PdfPageWriter(
+                self.pdf_path,
+                title=f"RF Analysis Report - {datetime.now().strftime('%Y-%m-%d')}",
+                author="RF Analyzer"
+            )
+        if 'pptx' in formats:
+            from prototype.utils.ppt_generator import PptGenerator  # python-pptx only needed for PPT output
+            self.ppt = PptGenerator(Path(template_path) if template_path else None)
+
+    def add(self, result: dict) -> None:
+        self.waiting[result['index']] = result
+        while self.next_index in self.waiting:
+            ready = self.waiting.pop(self.next_index)
+            self.next_index += 1
+            if 'error' in ready:
+                continue  # Grid failed: no page/slide
+            if self.pdf is not None:
+                self.pdf.add_jpeg_page(*ready['page'], dpi=PDFExporter.HIGH_QUALITY_DPI)
+            if self.ppt is not None:
+                self.ppt.add_slide_with_image(self.ppt.slide_title(ready['stem']), ready['png'])
+
+    def close(self) -> dict:
+        """Finish the reports; returns {path: pages}"""
+        written = {}
+        if self.pdf is not None:
+            if self.pdf.page_count:
+                self.pdf.close()
+                written[self.pdf_path] = self.pdf.page_count
+            else:
+                self.pdf.abort()
+        if self.ppt is not None and len(self.ppt.prs.slides):
+            self.ppt.save(self.ppt_path)
+            written[self.ppt_path] = len(self.ppt.prs.slides)
+        return written
+
+    def abort(self) -> None:
+        if self.pdf is not None:
+            self.pdf.abort()
+
+
+def _iter_rendered(tasks, workers: int):
+    """Yield render_grid() results as they finish, with at most 2 tasks queued per worker"""
+    if workers <= 1:
+        for task in tasks:
+            yield render_grid(task)
+        return
+
+    tasks = iter(tasks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for task in tasks:
+            pending.add(executor.submit(render_grid, task))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
 
 
 def generate_all_grids(
     output_dir: str = None,
     file_format: str = 'html',
-    dry_run: bool = False
+    dry_run: bool = False,
+    workers: int = None,
+    force: bool = False,
+    csv_path: str = None,
+    plotlyjs: str = 'directory',
+    template_path: str = None
 ):
     """
-    Generate all possible grid combinations
+    Generate all grid combinations that have data
+
+    Combinations come from the parser's grid index (one group-by at load
+    time), so empty band/LNA/port combinations are never queried. Grids are
+    rendered across a process pool; an output whose data hash and mtime
+    match the manifest is skipped.
+
+    PDF and PPT reports (one page/slide per grid) are built from the PNG
+    bytes the workers return, so 'all' writes HTML, PNG, PDF and PPT in one
+    pass over the data without reopening any image file.
 
     Args:
         output_dir: Output directory path (default: prototype/output_grids)
-        file_format: 'html' or 'png' (PNG requires kaleido)
+        file_format: 'html', 'png', 'pdf', 'pptx' or 'all' (images require kaleido)
         dry_run: If True, only show what would be generated without actually generating
+        workers: Render processes (default: CPU count, 1 = in-process)
+        force: Regenerate outputs even if they are up to date
+        csv_path: Consolidated CSV (default: data/Bellagio_POC_Rx.csv)
+        plotlyjs: HTML only - 'directory' (one shared plotly.js bundle in
+            output_dir, data-only pages), 'cdn' or 'inline' (bundle in every file)
+        template_path: PPT template for the pptx report (optional)
     """
 
+    if file_format not in FORMAT_SETS:
+        raise ValueError(f"Unsupported format: {file_format}")
+    formats = FORMAT_SETS[file_format]
+    file_formats = [fmt for fmt in formats if fmt in FILE_FORMATS]
+    report_formats = [fmt for fmt in formats if fmt in REPORT_FORMATS]
+
     # Setup output directory
     if output_dir is None:
         output_dir = Path(__file__).parent / "output_grids"
@@ -35,29 +277,37 @@ def generate_all_grids(
         output_dir = Path(output_dir)
 
     output_dir.mkdir(exist_ok=True)
+    workers = workers or os.cpu_count() or 1
 
     # Load CSV
     print("="*70)
     print("Batch Grid Generation")
     print("="*70)
     print(f"\nOutput directory: {output_dir}")
-    print(f"File format: {file_format.upper()}")
+    print(f"File format: {', '.join(fmt.upper() for fmt in formats)}")
+    if 'html' in formats:
+        print(f"plotly.js: {plotlyjs}")
     print(f"Mode: {'DRY RUN' if dry_run else 'FULL GENERATION'}")
+    print(f"Workers: {workers}")
 
-    csv_path = Path(__file__).parent.parent / "data" / "Bellagio_POC_Rx.csv"
+    if csv_path is None:
+        csv_path = Path(__file__).parent.parent / "data" / "Bellagio_POC_Rx.csv"
+    csv_path = Path(csv_path)
     print(f"\nLoading CSV: {csv_path.name}...")
 
+    load_start = time.time()
     parser = CsvParser(str(csv_path))
     parser.load_consolidated()
 
-    print(f"[OK] CSV loaded: {parser}")
+    print(f"[OK] CSV loaded in {time.time() - load_start:.1f}s: {parser}")
 
-    # Get all combinations
+    # Combinations with data (group keys of the grid index)
     bands = parser.get_available_bands()
     lna_states = parser.get_lna_gain_states()
     input_ports = parser.get_input_ports()
+    combinations = parser.get_grid_combinations()
 
-    total_combinations = len(bands) * len(lna_states) * len(input_ports)
+    cross_product = len(bands) * len(lna_states) * len(input_ports)
 
     print(f"\n{'='*70}")
     print("Generation Plan:")
@@ -67,94 +317,108 @@ def generate_all_grids(
     print(f"    {', '.join(lna_states)}")
     print(f"  Input Ports: {len(input_ports)}")
     print(f"    {', '.join(input_ports)}")
-    print(f"\n  Total combinations: {total_combinations}")
+    print(f"\n  Combinations with data: {len(combinations)} (of {cross_product} in the cross product)")
+
+    # Up-to-date check: data hash + mtime against the manifest.
+    # Reports need every grid's image, so with a report format every combination is a task.
+    manifest = {} if force else load_manifest(output_dir)
+    tasks = []
+    hashes = {}
+    up_to_date = 0
+    for band, lna, port in combinations:
+        stem = f"{band}_{lna}_{port}"
+        grid_data = parser.get_grid_data(band=band, lna_gain_state=lna, input_port=port)
+
+        write = []
+        for fmt in file_formats:
+            filename = f"{stem}.{fmt}"
+            data_hash = grid_data_hash(grid_data, fmt, plotlyjs)
+            if _is_up_to_date(output_dir / filename, manifest.get(filename), data_hash):
+                up_to_date += 1
+                continue
+            hashes[filename] = data_hash
+            write.append(fmt)
+
+        if not write and not report_formats:
+            continue
+
+        tasks.append({
+            'index': len(tasks),
+            'stem': stem,
+            'output_dir': str(output_dir),
+            'band': band,
+            'lna': lna,
+            'port': port,
+            'grid_data': grid_data,
+            'write': write,
+            'reuse_png': 'png' in file_formats and 'png' not in write,
+            'slide': 'pptx' in report_formats,
+            'page': 'pdf' in report_formats,
+            'plotlyjs': plotlyjs,
+        })
+
+    print(f"  Up to date: {up_to_date} files")
+    print(f"  To generate: {sum(len(task['write']) for task in tasks)} files")
+    if report_formats:
+        print(f"  Reports: {', '.join(f'{REPORT_NAME}.{fmt}' for fmt in report_formats)} ({len(tasks)} pages)")
     print(f"{'='*70}")
 
     if dry_run:
-        print("\n[DRY RUN] Showing first 10 files that would be generated:")
-        count = 0
-        for band in bands:
-            for lna in lna_states:
-                for port in input_ports:
-                    filename = f"{band}_{lna}_{port}.{file_format}"
-                    print(f"  {count+1:3}. {filename}")
-                    count += 1
-                    if count >= 10:
-                        break
-                if count >= 10:
-                    break
-            if count >= 10:
-                break
-        print(f"\n  ... and {total_combinations - 10} more files")
+        print("\n[DRY RUN] Showing first 10 grids that would be generated:")
+        for count, task in enumerate(tasks[:10], 1):
+            print(f"  {count:3}. {task['stem']} ({', '.join(task['write']) or 'report only'})")
+        if len(tasks) > 10:
+            print(f"\n  ... and {len(tasks) - 10} more grids")
         print("\n[DRY RUN] Use dry_run=False to actually generate files")
         return
 
-    # Generate all grids
+    # Generate grids
     print(f"\n{'='*70}")
     print("Starting generation...")
     print(f"{'='*70}\n")
 
     start_time = time.time()
+    if 'html' in formats and plotlyjs == 'directory' and any('html' in task['write'] for task in tasks):
+        bundle_path = ChartGenerator.write_plotlyjs_bundle(output_dir)
+        print(f"  Shared bundle: {bundle_path.name} ({bundle_path.stat().st_size / 2**20:.1f} MB)\n")
+
+    reports = _ReportWriter(output_dir, report_formats, template_path) if report_formats else None
+
     generated_count = 0
-    skipped_count = 0
     error_count = 0
-
-    for band_idx, band in enumerate(bands, 1):
-        print(f"\n[{band_idx}/{len(bands)}] Processing Band: {band}")
-
-        for lna_idx, lna in enumerate(lna_states, 1):
-            for port_idx, port in enumerate(input_ports, 1):
-
-                filename = f"{band}_{lna}_{port}.{file_format}"
-                filepath = output_dir / filename
-
-                try:
-                    # Get grid data
-                    grid_data = parser.get_grid_data(
-                        band=band,
-                        lna_gain_state=lna,
-                        input_port=port
-                    )
-
-                    # Check if data exists
-                    has_data = False
-                    for ca_combo in grid_data.values():
-                        for rx_port in ca_combo.values():
-                            if rx_port['count'] > 0:
-                                has_data = True
-                                break
-                        if has_data:
-                            break
-
-                    if not has_data:
-                        print(f"  [{lna_idx}/{len(lna_states)}][{port_idx}/{len(input_ports)}] SKIP: {filename} (no data)")
-                        skipped_count += 1
-                        continue
-
-                    # Generate chart
-                    fig = ChartGenerator.create_compact_grid(
-                        grid_data=grid_data,
-                        band=band,
-                        lna_gain_state=lna,
-                        input_port=port,
-                        compact_size=(250, 150)
-                    )
-
-                    # Save chart
-                    if file_format == 'html':
-                        ChartGenerator.export_to_html(fig, str(filepath), auto_open=False)
-                    elif file_format == 'png':
-                        ChartGenerator.export_to_image(fig, str(filepath))
-                    else:
-                        raise ValueError(f"Unsupported format: {file_format}")
-
-                    generated_count += 1
-                    print(f"  [{lna_idx}/{len(lna_states)}][{port_idx}/{len(input_ports)}] OK: {filename}")
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"  [{lna_idx}/{len(lna_states)}][{port_idx}/{len(input_ports)}] ERROR: {filename}")
-                    print(f"    {str(e)}")
+    render_seconds = 0.0
+    bytes_written = 0
+
+    try:
+        for idx, result in enumerate(_iter_rendered(tasks, min(workers, max(len(tasks), 1))), 1):
+            stem = result['stem']
+            if reports is not None:
+                reports.add(result)
+
+            if 'error' in result:
+                error_count += 1
+                for fmt in file_formats:
+                    manifest.pop(f"{stem}.{fmt}", None)
+                print(f"  [{idx}/{len(tasks)}] ERROR: {stem}")
+                print(f"    {result['error']}")
+                continue
+
+            render_seconds += result['seconds']
+            for filename, info in result['files'].items():
+                generated_count += 1
+                bytes_written += info['bytes']
+                manifest[filename] = {'hash': hashes[filename], 'mtime_ns': info['mtime_ns']}
+            print(f"  [{idx}/{len(tasks)}] OK: {stem} ({result['seconds']:.2f}s)")
+    except BaseException:
+        if reports is not None:
+            reports.abort()
+        raise
+    finally:
+        save_manifest(output_dir, manifest)
+
+    written_reports = reports.close() if reports is not None else {}
+    for report_path in written_reports:
+        bytes_written += report_path.stat().st_size
 
     # Summary
     elapsed_time = time.time() - start_time
@@ -162,12 +426,18 @@ def generate_all_grids(
     print(f"\n{'='*70}")
     print("Generation Complete!")
     print(f"{'='*70}")
-    print(f"  Total combinations: {total_combinations}")
-    print(f"  Generated: {generated_count}")
-    print(f"  Skipped (no data): {skipped_count}")
+    print(f"  Combinations with data: {len(combinations)} (skipped {cross_product - len(combinations)} empty)")
+    print(f"  Generated: {generated_count} files")
+    print(f"  Skipped (up to date): {up_to_date} files")
     print(f"  Errors: {error_count}")
-    print(f"  Time elapsed: {elapsed_time:.1f} seconds")
-    print(f"  Average: {elapsed_time/max(generated_count,1):.2f} sec/file")
+    for report_path, pages in written_reports.items():
+        print(f"  Report: {report_path.name} ({pages} pages, {report_path.stat().st_size / 2**20:.1f} MB)")
+    print(f"  Time elapsed: {elapsed_time:.1f} seconds ({workers} workers)")
+    if tasks and elapsed_time > 0:
+        print(f"  Throughput: {len(tasks) / elapsed_time:.2f} grids/sec, "
+              f"{bytes_written / 2**20 / elapsed_time:.1f} MB/sec")
+        print(f"  Render time: {render_seconds / len(tasks):.2f} sec/grid "
+              f"({render_seconds / elapsed_time:.1f}x render time overlapped in wall time)")
     print(f"\n  Output directory: {output_dir.absolute()}")
     print(f"{'='*70}")
 
@@ -175,6 +445,9 @@ def generate_all_grids(
 def generate_summary_index(output_dir: str = None):
     """
     Generate HTML index page listing all generated grids
+
+    When the grids reference a shared plotly.js bundle (plotlyjs='directory'),
+    the index prefetches it so the first chart opens from the browser cache.
     """
 
     if output_dir is None:
@@ -187,7 +460,7 @@ def generate_summary_index(output_dir: str = None):
         return
 
     # Find all HTML files
-    html_files = sorted(output_dir.glob("*.html"))
+    html_files = sorted(p for p in output_dir.glob("*.html") if p.name != "index.html")
 
     if not html_files:
         print(f"[ERROR] No HTML files found in {output_dir}")
@@ -200,9 +473,10 @@ def generate_summary_index(output_dir: str = None):
         parts = filename.split('_')
 
         if len(parts) >= 3:
+            # {band}_{lna}_{port}: LNA states contain '_' (G0_H)
             band = parts[0]
-            lna = parts[1]
-            port = parts[2]
+            lna = '_'.join(parts[1:-1])
+            port = parts[-1]
 
             if band not in grids_by_band:
                 grids_by_band[band] = []
@@ -213,6 +487,17 @@ def generate_summary_index(output_dir: str = None):
                 'port': port
             })
 
+    # Shared plotly.js bundle (plotlyjs='directory' exports)
+    bundle_path = output_dir / ChartGenerator.plotlyjs_bundle_name()
+    has_bundle = bundle_path.exists()
+    grids_size = sum(p.stat().st_size for p in html_files)
+
+    bundle_link = f'    <link rel="prefetch" href="{bundle_path.name}">\n' if has_bundle else ''
+    bundle_summary = (
+        f"<strong>Shared plotly.js:</strong> {bundle_path.name} ({bundle_path.stat().st_size / 2**20:.1f} MB)<br>\n        "
+        if has_bundle else ''
+    )
+
     # Generate index HTML
     index_path = output_dir / "index.html"
 
@@ -221,7 +506,7 @@ def generate_summary_index(output_dir: str = None):
 <head>
     <meta charset="UTF-8">
     <title>Grid Chart Index</title>
-    <style>
+{bundle_link}    <style>
         body {{ font-family: Arial, sans-serif; margin: 20px; }}
         h1 {{ color: #333; }}
         h2 {{ color: #666; margin-top: 30px; }}
@@ -240,7 +525,8 @@ def generate_summary_index(output_dir: str = None):
     <div class="summary">
         <strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
         <strong>Total Bands:</strong> {len(grids_by_band)}<br>
-        <strong>Total Grids:</strong> {len(html_files)}
+        <strong>Total Grids:</strong> {len(html_files)} ({grids_size / 2**20:.1f} MB)<br>
+        {bundle_summary}
     </div>
 
 """
@@ -275,9 +561,16 @@ if __name__ == "__main__":
 
     parser_args = argparse.ArgumentParser(description="Generate all grid combinations")
     parser_args.add_argument('--output-dir', '-o', type=str, help='Output directory path')
-    parser_args.add_argument('--format', '-f', choices=['html', 'png'], default='html', help='Output file format')
+    parser_args.add_argument('--format', '-f', choices=list(FORMAT_SETS), default='html',
+                             help="Output format ('all' = HTML + PNG + PDF + PPT in one pass)")
     parser_args.add_argument('--dry-run', '-d', action='store_true', help='Dry run mode (show plan only)')
     parser_args.add_argument('--index', '-i', action='store_true', help='Generate index page after completion')
+    parser_args.add_argument('--workers', '-w', type=int, help='Render processes (default: CPU count)')
+    parser_args.add_argument('--force', action='store_true', help='Regenerate files that are up to date')
+    parser_args.add_argument('--csv', type=str, help='Consolidated CSV path')
+    parser_args.add_argument('--plotlyjs', choices=['directory', 'cdn', 'inline'], default='directory',
+                             help='HTML: shared plotly.js bundle in the output directory, CDN link, or embedded')
+    parser_args.add_argument('--template', type=str, help='PPT template for the pptx report')
 
     args = parser_args.parse_args()
 
@@ -285,7 +578,12 @@ if __name__ == "__main__":
     generate_all_grids(
         output_dir=args.output_dir,
         file_format=args.format,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers,
+        force=args.force,
+        csv_path=args.csv,
+        plotlyjs=args.plotlyjs,
+        template_path=args.template
     )
 
     # Generate index if requested
@@ -301,3 +599,7 @@ if __name__ == "__main__":
     print("  python generate_all_grids.py --index")
     print("\n  # Generate PNG files (requires kaleido)")
     print("  python generate_all_grids.py --format png")
+    print("\n  # HTML, PNG, PDF report and PPT report in one pass")
+    print("  python generate_all_grids.py --format all")
+    print("\n  # Regenerate everything with 4 render processes")
+    print("  python generate_all_grids.py --force --workers 4")
@@ -4,7 +4,7 @@ Supports both simple CSV (frequency, gain_db) and consolidated format (89 column
 """
 
 from pathlib import Path
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, List, Optional, Iterator
 import pandas as pd
 import numpy as np
 
@@ -38,6 +38,34 @@ class CsvParser:
         'S0402': ('ANTL', 'RXOUT4'),
     }
 
+    # Grid index key: (band, LNA state, input port, N-plexer bank, output port)
+    GRID_KEY_COLUMNS = [
+        'Cfg Band',
+        'cfg-lna_gain_state',
+        'cfg-active_port_1',
+        'debug-nplexer_bank',
+        'cfg-active_port_2',
+    ]
+
+    # Output ports (grid rows)
+    OUTPUT_PORTS = ['RXOUT1', 'RXOUT2', 'RXOUT3', 'RXOUT4']
+
+    # Consolidated columns read by the viewer and the Django ingest (the rest are skipped)
+    REQUIRED_COLUMNS = ['Cfg Band', 'Frequency', 'Active RF Path', 'Gain (dB)']
+    CONSOLIDATED_COLUMNS = GRID_KEY_COLUMNS + ['Active RF Path', 'Frequency', 'Gain (dB)']
+
+    # Explicit dtypes: low-cardinality labels as categoricals, gain as float32
+    CONSOLIDATED_DTYPES = {
+        'Cfg Band': 'category',
+        'cfg-lna_gain_state': 'category',
+        'cfg-active_port_1': 'category',
+        'debug-nplexer_bank': 'category',
+        'cfg-active_port_2': 'category',
+        'Active RF Path': 'category',
+        'Frequency': 'float64',
+        'Gain (dB)': 'float32',
+    }
+
     def __init__(self, file_path: str):
         """
         Args:
@@ -47,6 +75,7 @@ class CsvParser:
         self.data = None
         self._is_loaded = False
         self._format_type = None  # 'simple' or 'consolidated'
+        self._grid_index = None   # Built by load_consolidated()
 
     def load(self, freq_column: str = 'frequency', value_column: str = 'gain_db') -> bool:
         """
@@ -69,34 +98,134 @@ class CsvParser:
         except Exception as e:
             raise ValueError(f"Failed to load CSV file: {e}")
 
-    def load_consolidated(self) -> bool:
+    def load_consolidated(self, engine: Optional[str] = None, dtypes: Optional[Dict[str, str]] = None) -> bool:
         """
         Load consolidated format CSV (89 columns)
 
+        Only CONSOLIDATED_COLUMNS are parsed, with CONSOLIDATED_DTYPES.
+
         Expected columns:
         - Freq Type, RAT, Cfg Band, Debug Band, Frequency
         - Active RF Path, Gain (dB), ...
         - cfg-active_port_1, cfg-active_port_2, cfg-lna_gain_state
 
+        Args:
+            engine: pandas CSV engine ('c' by default, 'pyarrow' if installed)
+            dtypes: Overrides for CONSOLIDATED_DTYPES (e.g. {'Gain (dB)': 'float64'})
+
         Returns:
             Success status
         """
         try:
-            self.data = pd.read_csv(self.file_path)
-
-            # Verify essential columns exist
-            required_cols = ['Cfg Band', 'Frequency', 'Active RF Path', 'Gain (dB)']
-            missing = [col for col in required_cols if col not in self.data.columns]
-
-            if missing:
-                raise ValueError(f"Missing required columns: {missing}")
+            self.data = pd.read_csv(self.file_path, **self._consolidated_read_options(dtypes), engine=engine)
 
+            self._build_grid_index()
             self._is_loaded = True
             self._format_type = 'consolidated'
             return True
         except Exception as e:
             raise ValueError(f"Failed to load consolidated CSV: {e}")
 
+    def iter_consolidated(
+        self,
+        chunksize: int = 500_000,
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over a consolidated CSV in DataFrame chunks
+
+        For files too large to load at once. Each chunk has the same columns
+        and dtypes as load_consolidated(); categorical chunks carry their own
+        categories. Parser state is not changed.
+
+        Args:
+            chunksize: Rows per chunk
+            dtypes: Overrides for CONSOLIDATED_DTYPES
+
+        Yields:
+            DataFrame chunks in file order
+        """
+        options = self._consolidated_read_options(dtypes)
+        with pd.read_csv(self.file_path, **options, chunksize=chunksize) as reader:
+            yield from reader
+
+    def _consolidated_read_options(self, dtypes: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        usecols/dtype arguments for the consolidated columns present in the file
+
+        Raises:
+            ValueError: A REQUIRED_COLUMNS column is missing
+        """
+        header = pd.read_csv(self.file_path, nrows=0).columns
+
+        # Verify essential columns exist
+        missing = [col for col in self.REQUIRED_COLUMNS if col not in header]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        usecols = [col for col in self.CONSOLIDATED_COLUMNS if col in header]
+        dtype = {**self.CONSOLIDATED_DTYPES, **(dtypes or {})}
+        return {
+            'usecols': usecols,
+            'dtype': {col: dtype[col] for col in usecols if col in dtype},
+        }
+
+    def _build_grid_index(self):
+        """
+        Group row positions by GRID_KEY_COLUMNS once, after loading
+
+        Rows are ordered by group (original order kept inside each group), so
+        every (band, lna, port1, nplexer bank, port2) cell is a contiguous
+        slice of the reordered Frequency/Gain arrays. Facet lists per band are
+        taken from the group keys, so lookups never scan the full table.
+        """
+        df = self.data
+        key_columns = [col for col in self.GRID_KEY_COLUMNS if col in df.columns]
+
+        # {key tuple: row positions}, one hash pass over the key columns
+        groups = df.groupby(key_columns, sort=False, dropna=False, observed=True).indices
+        if len(key_columns) == 1:
+            groups = {(key,): rows for key, rows in groups.items()}
+
+        # Expand to full 5-tuples (None for a missing key column)
+        present = [self.GRID_KEY_COLUMNS.index(col) for col in key_columns]
+
+        def full_key(key):
+            values = [None] * len(self.GRID_KEY_COLUMNS)
+            for position, value in zip(present, key):
+                values[position] = value
+            return tuple(values)
+
+        keys = [full_key(key) for key in groups]
+        row_groups = list(groups.values())
+        bounds = np.cumsum([0] + [len(rows) for rows in row_groups])
+        order = np.concatenate(row_groups) if row_groups else np.array([], dtype=np.intp)
+
+        self._grid_rows = order
+        self._grid_frequency = df['Frequency'].to_numpy()[order]
+        self._grid_gain = df['Gain (dB)'].to_numpy()[order]
+        self._grid_index = {
+            key: slice(int(start), int(end))
+            for key, start, end in zip(keys, bounds[:-1], bounds[1:])
+        }
+
+        # Group keys per band (small: one entry per measured cell)
+        self._band_keys = {}
+        for key in keys:
+            self._band_keys.setdefault(key[0], []).append(key)
+
+    def _index_keys(self, band: Optional[str] = None) -> List[tuple]:
+        """Grid index keys, optionally for one band"""
+        if band is None:
+            return list(self._grid_index)
+        return self._band_keys.get(band, [])
+
+    def _index_rows(self, keys: List[tuple]) -> np.ndarray:
+        """Original row positions of the given groups, in file order"""
+        if not keys:
+            return np.array([], dtype=np.intp)
+        return np.sort(np.concatenate([self._grid_rows[self._grid_index[key]] for key in keys]))
+
     def auto_detect_and_load(self) -> bool:
         """
         Auto-detect CSV format and load appropriately
@@ -105,10 +234,10 @@ class CsvParser:
             Success status
         """
         try:
-            # Read first line to detect format
-            df_sample = pd.read_csv(self.file_path, nrows=1)
+            # Read the header to detect format
+            header = pd.read_csv(self.file_path, nrows=0).columns
 
-            if 'Cfg Band' in df_sample.columns and 'Active RF Path' in df_sample.columns:
+            if 'Cfg Band' in header and 'Active RF Path' in header:
                 return self.load_consolidated()
             else:
                 return self.load()
@@ -153,37 +282,38 @@ class CsvParser:
         if not self._is_loaded or self._format_type != 'consolidated':
             raise ValueError("Consolidated format must be loaded first with load_consolidated()")
 
-        # Start with band filter
-        filtered = self.data[self.data['Cfg Band'] == band].copy()
-
-        # Apply Active RF Path filter if specified
-        if active_rf_path:
-            filtered = filtered[filtered['Active RF Path'] == active_rf_path]
+        # Groups of this band (and LNA state), then the RF path on just those rows
+        keys = self._index_keys(band)
+        if lna_gain_state and 'cfg-lna_gain_state' in self.data.columns:
+            keys = [key for key in keys if key[1] == lna_gain_state]
+        rows = self._index_rows(keys)
 
-        # Apply LNA gain state filter if specified
-        if lna_gain_state and 'cfg-lna_gain_state' in filtered.columns:
-            filtered = filtered[filtered['cfg-lna_gain_state'] == lna_gain_state]
+        if active_rf_path and len(rows):
+            # take() first: a categorical column is only decoded for these rows
+            rows = rows[self.data['Active RF Path'].take(rows).to_numpy() == active_rf_path]
 
-        if filtered.empty:
+        if len(rows) == 0:
             return {
                 'frequency': np.array([]),
                 'gain_db': np.array([]),
                 'count': 0
             }
 
+        first = rows[0]
+
         # Extract port labels
-        port_1 = filtered['cfg-active_port_1'].iloc[0] if 'cfg-active_port_1' in filtered.columns else None
-        port_2 = filtered['cfg-active_port_2'].iloc[0] if 'cfg-active_port_2' in filtered.columns else None
+        port_1 = self.data['cfg-active_port_1'].iat[first] if 'cfg-active_port_1' in self.data.columns else None
+        port_2 = self.data['cfg-active_port_2'].iat[first] if 'cfg-active_port_2' in self.data.columns else None
 
         return {
-            'frequency': filtered['Frequency'].values,
-            'gain_db': filtered['Gain (dB)'].values,
+            'frequency': self.data['Frequency'].to_numpy()[rows],
+            'gain_db': self.data['Gain (dB)'].to_numpy()[rows],
             'band': band,
-            'active_rf_path': active_rf_path or filtered['Active RF Path'].iloc[0],
+            'active_rf_path': active_rf_path or self.data['Active RF Path'].iat[first],
             'input_port': port_1,
             'output_port': port_2,
             'lna_gain_state': lna_gain_state,
-            'count': len(filtered)
+            'count': len(rows)
         }
 
     def get_available_bands(self) -> List[str]:
@@ -196,7 +326,7 @@ class CsvParser:
         if not self._is_loaded or self._format_type != 'consolidated':
             raise ValueError("Consolidated format must be loaded first")
 
-        return sorted(self.data['Cfg Band'].unique().tolist())
+        return sorted(self._band_keys)
 
     def get_available_paths(self, band: Optional[str] = None) -> List[Dict]:
         """
@@ -265,9 +395,7 @@ class CsvParser:
         if 'debug-nplexer_bank' not in self.data.columns:
             return []
 
-        df = self.data if band is None else self.data[self.data['Cfg Band'] == band]
-
-        ca_combinations = df['debug-nplexer_bank'].unique().tolist()
+        ca_combinations = list(dict.fromkeys(key[3] for key in self._index_keys(band)))
 
         # Sort: single band first, then CA combinations
         def sort_key(ca):
@@ -295,9 +423,7 @@ class CsvParser:
         if 'cfg-lna_gain_state' not in self.data.columns:
             return []
 
-        df = self.data if band is None else self.data[self.data['Cfg Band'] == band]
-
-        gain_states = df['cfg-lna_gain_state'].unique().tolist()
+        gain_states = list(dict.fromkeys(key[1] for key in self._index_keys(band)))
 
         # Sort: G0_H, G0_L, then G1-G5
         def sort_key(state):
@@ -325,14 +451,36 @@ class CsvParser:
         if 'cfg-active_port_1' not in self.data.columns:
             return []
 
-        df = self.data if band is None else self.data[self.data['Cfg Band'] == band]
-
-        ports = df['cfg-active_port_1'].unique().tolist()
+        ports = list(dict.fromkeys(key[2] for key in self._index_keys(band)))
 
         # Sort: ANT1, ANT2, ANTL
         port_order = {'ANT1': 0, 'ANT2': 1, 'ANTL': 2}
         return sorted(ports, key=lambda p: port_order.get(p, 99))
 
+    def get_grid_combinations(self) -> List[Tuple[str, str, str]]:
+        """
+        Get (band, LNA gain state, input port) combinations that have data
+
+        Taken from the grid index group keys, so combinations without rows
+        are never listed (unlike the full band x LNA x port cross product).
+
+        Returns:
+            List of (band, lna_gain_state, input_port), ordered like the
+            get_available_bands() / get_lna_gain_states() / get_input_ports() lists
+        """
+        if not self._is_loaded or self._format_type != 'consolidated':
+            raise ValueError("Consolidated format must be loaded first")
+
+        combinations = set(key[:3] for key in self._grid_index)
+
+        lna_order = {state: idx for idx, state in enumerate(self.get_lna_gain_states())}
+        port_order = {port: idx for idx, port in enumerate(self.get_input_ports())}
+
+        return sorted(
+            combinations,
+            key=lambda c: (str(c[0]), lna_order.get(c[1], len(lna_order)), port_order.get(c[2], len(port_order)))
+        )
+
     def get_grid_data(
         self,
         band: str,
@@ -369,25 +517,19 @@ class CsvParser:
         # Get CA combinations for this band
         ca_combinations = self.get_ca_combinations(band)
 
-        # Output ports (rows)
-        output_ports = ['RXOUT1', 'RXOUT2', 'RXOUT3', 'RXOUT4']
-
         result = {}
 
         for ca_combo in ca_combinations:
             result[ca_combo] = {}
 
-            for output_port in output_ports:
-                # Filter data
-                filtered = self.data[
-                    (self.data['Cfg Band'] == band) &
-                    (self.data['debug-nplexer_bank'] == ca_combo) &
-                    (self.data['cfg-lna_gain_state'] == lna_gain_state) &
-                    (self.data['cfg-active_port_1'] == input_port) &
-                    (self.data['cfg-active_port_2'] == output_port)
-                ]
-
-                if filtered.empty:
+            for output_port in self.OUTPUT_PORTS:
+                # Contiguous slice of the grid index (views, no table scan).
+                # Rows without a CA label (NaN) never match a cell, as with value filtering.
+                cell = None if pd.isna(ca_combo) else self._grid_index.get(
+                    (band, lna_gain_state, input_port, ca_combo, output_port)
+                )
+
+                if cell is None:
                     result[ca_combo][output_port] = {
                         'frequency': np.array([]),
                         'gain_db': np.array([]),
@@ -395,9 +537,9 @@ class CsvParser:
                     }
                 else:
                     result[ca_combo][output_port] = {
-                        'frequency': filtered['Frequency'].values,
-                        'gain_db': filtered['Gain (dB)'].values,
-                        'count': len(filtered)
+                        'frequency': self._grid_frequency[cell],
+                        'gain_db': self._grid_gain[cell],
+                        'count': cell.stop - cell.start
                     }
 
         return result
@@ -0,0 +1,80 @@
+"""
+Test script for frequency-span band detection
+Tests the zero-width span rule (single-frequency traces pick the narrowest band)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prototype.utils.sparameter import SParameterAnalyzer
+
+
+def test_single_point_narrowest_band():
+    """A single frequency matches the narrowest band containing it"""
+
+    print("="*70)
+    print("Test: Zero-Width Span -> Narrowest Band")
+    print("="*70)
+
+    # (frequency MHz, expected band, bands containing it)
+    cases = [
+        (2140.0, 'B4', 'B1 60 / B4 45 / B65 90 / B66 90 MHz'),
+        (2600.0, 'B38', 'B38 50 / B41 194 MHz'),
+        (1815.0, 'B3', 'B3 75 / DCS 75 MHz (LTE name wins the tie)'),
+    ]
+
+    passed = True
+    for i, (freq_mhz, expected, note) in enumerate(cases, 1):
+        band = SParameterAnalyzer.detect_band_from_frequency(np.array([freq_mhz * 1e6]))
+        status = "OK" if band == expected else "FAIL"
+        passed &= band == expected
+        print(f"  [{i}] {freq_mhz:.1f} MHz -> {band} (expected {expected}; {note}) [{status}]")
+
+    return passed
+
+
+def test_single_point_traces_in_batch():
+    """detect_bands() applies the same rule to one-point traces among sweeps"""
+
+    print("\n" + "="*70)
+    print("Test: Zero-Width Traces in detect_bands()")
+    print("="*70)
+
+    traces = [
+        np.linspace(2110e6, 2170e6, 61),   # B1 sweep
+        np.array([2140e6]),                # single point inside B1/B4/B65/B66
+        np.linspace(1920e6, 1980e6, 61),   # B2 downlink (was B1 with the old table)
+        np.array([100e6]),                 # no band
+    ]
+    expected = ['B1', 'B4', 'B2', 'Unknown']
+
+    freq = np.concatenate(traces)
+    offsets = np.concatenate([[0], np.cumsum([len(t) for t in traces])])
+    bands = SParameterAnalyzer.detect_bands(freq, offsets)
+
+    print(f"\n  Detected: {list(bands)}")
+    print(f"  Expected: {expected}")
+
+    return list(bands) == expected
+
+
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("Band Detection Test Suite")
+    print("="*70)
+
+    all_passed = True
+
+    all_passed &= test_single_point_narrowest_band()
+    all_passed &= test_single_point_traces_in_batch()
+
+    print("\n" + "="*70)
+    if all_passed:
+        print("[SUCCESS] All tests passed!")
+    else:
+        print("[FAILED] Some tests failed")
+    print("="*70)
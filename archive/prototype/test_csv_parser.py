@@ -3,8 +3,12 @@ Test script for updated CSV parser with consolidated format support
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -157,6 +161,109 @@ def test_multiple_bands():
     return True
 
 
+def _mask_ca_combinations(df, band=None):
+    """Reference: get_ca_combinations() before the grid index (boolean mask + unique)"""
+    if band is not None:
+        df = df[df['Cfg Band'] == band]
+    ca_combinations = df['debug-nplexer_bank'].unique().tolist()
+    return sorted(ca_combinations, key=lambda ca: (1 if '+' in str(ca) else 0, str(ca)))
+
+
+def _mask_grid_data(df, band, lna_gain_state, input_port):
+    """Reference: get_grid_data() before the grid index (one boolean mask per cell)"""
+    result = {}
+    for ca_combo in _mask_ca_combinations(df, band):
+        result[ca_combo] = {}
+        for output_port in CsvParser.OUTPUT_PORTS:
+            filtered = df[
+                (df['Cfg Band'] == band) &
+                (df['debug-nplexer_bank'] == ca_combo) &
+                (df['cfg-lna_gain_state'] == lna_gain_state) &
+                (df['cfg-active_port_1'] == input_port) &
+                (df['cfg-active_port_2'] == output_port)
+            ]
+            result[ca_combo][output_port] = {
+                'frequency': filtered['Frequency'].values,
+                'gain_db': filtered['Gain (dB)'].values,
+                'count': len(filtered)
+            }
+    return result
+
+
+def _write_synthetic_csv(path):
+    """Interleaved rows over two bands, with missing (NaN) keys in several columns"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame({
+        'Cfg Band': rng.choice(['B1', 'B3', None], n, p=[0.5, 0.45, 0.05]),
+        'cfg-lna_gain_state': rng.choice(['G0_H', 'G1', None], n, p=[0.5, 0.45, 0.05]),
+        'cfg-active_port_1': rng.choice(['ANT1', 'ANT2'], n),
+        'debug-nplexer_bank': rng.choice(['1', '3', '1+3', '1+3+7', None], n),
+        'cfg-active_port_2': rng.choice(CsvParser.OUTPUT_PORTS + [None], n),
+        'Active RF Path': 'S0706',
+        'Frequency': np.round(rng.uniform(1800.0, 2200.0, n), 1),
+        'Gain (dB)': np.round(rng.normal(15.0, 1.0, n), 3),
+    })
+    df.to_csv(path, index=False)
+
+
+def _same_ca(actual, expected):
+    """CA lists are equal, treating NaN entries as equal"""
+    return [str(ca) for ca in actual] == [str(ca) for ca in expected]
+
+
+def test_grid_index_matches_mask_filtering():
+    """Grid index lookups return the same cells as the old mask-based filtering"""
+
+    print("\n" + "=" * 70)
+    print("Testing Grid Index vs Mask Filtering (synthetic CSV with NaN keys)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "synthetic_consolidated.csv"
+        _write_synthetic_csv(csv_path)
+
+        parser = CsvParser(str(csv_path))
+        parser.load_consolidated()
+        df = parser.data
+
+        passed = True
+        for band in [None, 'B1', 'B3', 'B7']:
+            same = _same_ca(parser.get_ca_combinations(band), _mask_ca_combinations(df, band))
+            passed &= same
+            print(f"  get_ca_combinations({band!r}): {'OK' if same else 'MISMATCH'}")
+
+        cells = 0
+        for band in ['B1', 'B3', 'B7']:
+            for lna in ['G0_H', 'G1']:
+                for port in ['ANT1', 'ANT2']:
+                    actual = parser.get_grid_data(band, lna, port)
+                    expected = _mask_grid_data(df, band, lna, port)
+
+                    if not _same_ca(list(actual), list(expected)):
+                        print(f"  [MISMATCH] {band} {lna} {port}: columns {list(actual)} != {list(expected)}")
+                        passed = False
+                        continue
+
+                    for (ca, row), (_, expected_row) in zip(actual.items(), expected.items()):
+                        for output_port in CsvParser.OUTPUT_PORTS:
+                            got, want = row[output_port], expected_row[output_port]
+                            cells += 1
+                            if (got['count'] != want['count']
+                                    or not np.array_equal(got['frequency'], want['frequency'])
+                                    or not np.array_equal(got['gain_db'], want['gain_db'])):
+                                print(f"  [MISMATCH] {band} {lna} {port} {ca} {output_port}: "
+                                      f"{got['count']} != {want['count']} points")
+                                passed = False
+
+        print(f"  Compared {cells} grid cells")
+
+    print("\n" + "=" * 70)
+    print("[SUCCESS] Grid index matches mask filtering!" if passed else "[FAILED] Grid index differs from mask filtering")
+    print("=" * 70)
+    return passed
+
+
 if __name__ == "__main__":
     print("\n" + "="*70)
     print("CSV Parser Test Suite")
@@ -168,6 +275,7 @@ if __name__ == "__main__":
     all_passed &= test_consolidated_csv()
     all_passed &= test_auto_detect()
     all_passed &= test_multiple_bands()
+    all_passed &= test_grid_index_matches_mask_filtering()
 
     print("\n" + "="*70)
     if all_passed:
@@ -4,5 +4,6 @@ Utility modules for S-parameter processing and chart generation
 
 from .sparameter import SParameterAnalyzer
 from .chart_generator import ChartGenerator
+from .renderer_pool import RendererPool
 
-__all__ = ['SParameterAnalyzer', 'ChartGenerator']
+__all__ = ['SParameterAnalyzer', 'ChartGenerator', 'RendererPool']
@@ -2,17 +2,34 @@
 Plotly 기반 차트 생성 유틸리티
 """
 
+import os
+import uuid
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import numpy as np
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 
+from .renderer_pool import PLOTLYJS_PATH, RendererPool
+
 
 class ChartGenerator:
     """
     Plotly를 사용한 인터랙티브 차트 생성
     """
 
+    # 간략 그리드 공통 설정 (서버 Figure 생성 / 클라이언트 조립 공용)
+    COMPACT_GRID_ROWS = ['RXOUT1', 'RXOUT2', 'RXOUT3', 'RXOUT4']
+    COMPACT_GRID_SPACING = 0.02
+    COMPACT_GRID_CANVAS = (1500, 900)  # Fixed target canvas size (width, height)
+    COMPACT_GRID_MARGIN = dict(l=150, r=60, t=100, b=80)
+    COMPACT_GRID_LINE_COLOR = '#1f77b4'
+
+    # 전체 점 개수가 이 값을 넘으면 WebGL(Scattergl) trace 사용 (SVG는 약 10만 점부터 브라우저가 느려짐)
+    WEBGL_POINT_THRESHOLD = 100_000
+    TRACE_TYPES = {'svg': 'scatter', 'webgl': 'scattergl'}
+
     @staticmethod
     def create_single_chart(
         freq: np.ndarray,
@@ -64,7 +81,9 @@ class ChartGenerator:
         row_labels: List[str],
         col_labels: List[str],
         title: str = "S-parameter Analysis Grid",
-        subplot_height: int = 300
+        subplot_height: int = 300,
+        render_mode: str = 'auto',
+        webgl_threshold: Optional[int] = None
     ) -> go.Figure:
         """
         그리드 레이아웃으로 여러 차트 배치
@@ -76,6 +95,8 @@ class ChartGenerator:
             col_labels: 열 레이블 리스트 (예: ['B1', 'B1_B3'])
             title: 전체 제목
             subplot_height: 서브플롯 높이 (픽셀)
+            render_mode: 'auto', 'svg', 'webgl' (choose_render_mode() 참고)
+            webgl_threshold: 'auto'의 WebGL 전환 점 개수 (None이면 WEBGL_POINT_THRESHOLD)
 
         Returns:
             Plotly Figure 객체
@@ -107,6 +128,14 @@ class ChartGenerator:
             horizontal_spacing=0.08
         )
 
+        # 점 개수로 trace 종류 결정
+        total_points = sum(
+            len(cell['freq']) for row in data_grid for cell in row
+            if cell and 'freq' in cell and 'gain' in cell
+        )
+        mode = ChartGenerator.choose_render_mode(total_points, render_mode, webgl_threshold)
+        trace_class = go.Scattergl if mode == 'webgl' else go.Scatter
+
         # 데이터 추가
         for row_idx in range(rows):
             for col_idx in range(cols):
@@ -115,7 +144,7 @@ class ChartGenerator:
 
                     if cell_data and 'freq' in cell_data and 'gain' in cell_data:
                         fig.add_trace(
-                            go.Scatter(
+                            trace_class(
                                 x=cell_data['freq'],
                                 y=cell_data['gain'],
                                 mode='lines',
@@ -207,15 +236,52 @@ class ChartGenerator:
         Args:
             fig: Plotly Figure 객체
             output_path: 출력 파일 경로
-            include_plotlyjs: 'cdn', 'inline', True 중 선택
+            include_plotlyjs: 'cdn', 'inline', True, 'directory' 중 선택
+                'directory': 출력 폴더의 공용 plotly.js 번들을 참조 (번들은 폴더당 1회만 기록)
+                             → 데이터만 담은 작은 HTML, 오프라인 사용 가능
             auto_open: 저장 후 브라우저로 자동 열기
         """
+        if include_plotlyjs == 'directory':
+            include_plotlyjs = ChartGenerator.write_plotlyjs_bundle(Path(output_path).parent).name
+        elif include_plotlyjs == 'inline':
+            include_plotlyjs = True
+
         fig.write_html(
             output_path,
             include_plotlyjs=include_plotlyjs,
             auto_open=auto_open
         )
 
+    @staticmethod
+    def plotlyjs_bundle_name() -> str:
+        """공용 plotly.js 번들 파일명 (버전 포함 → plotly 업그레이드 시 새 파일)"""
+        return f"plotly-{get_plotlyjs_version()}.min.js"
+
+    @staticmethod
+    def write_plotlyjs_bundle(output_dir: str) -> Path:
+        """
+        출력 폴더에 공용 plotly.js 번들 기록 (이미 있으면 그대로 사용)
+
+        임시 파일에 쓴 뒤 이름을 바꾸므로 여러 프로세스가 동시에 호출해도 안전
+
+        Args:
+            output_dir: 출력 폴더
+
+        Returns:
+            번들 경로
+        """
+        bundle_path = Path(output_dir) / ChartGenerator.plotlyjs_bundle_name()
+        if bundle_path.exists():
+            return bundle_path
+
+        temp_path = bundle_path.with_name(f".{bundle_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_bytes(Path(PLOTLYJS_PATH).read_bytes())
+            os.replace(temp_path, bundle_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return bundle_path
+
     @staticmethod
     def export_to_image(
         fig: go.Figure,
@@ -235,8 +301,37 @@ class ChartGenerator:
         Note:
             kaleido 패키지 필요: pip install kaleido
         """
+        image_format = Path(output_path).suffix.lstrip('.').lower() or 'png'
+        image_bytes = ChartGenerator.render_image(fig, format=image_format, width=width, height=height)
+        Path(output_path).write_bytes(image_bytes)
+
+    @staticmethod
+    def render_image(
+        fig: go.Figure,
+        format: str = 'png',
+        width: int = 1200,
+        height: int = 800,
+        pool: Optional[RendererPool] = None
+    ) -> bytes:
+        """
+        차트를 이미지 바이트로 렌더링 (PNG, JPG, SVG, PDF)
+
+        프로세스 공용 kaleido 렌더러 풀을 사용하므로 Chromium 시작 비용은 최초 1회만 발생
+        WebGL(Scattergl) trace는 SVG trace로 바꿔 렌더링 (RendererPool.render 참고)
+
+        Args:
+            fig: Plotly Figure 객체
+            format: 이미지 포맷
+            width: 이미지 너비
+            height: 이미지 높이
+            pool: 사용할 렌더러 풀 (None이면 프로세스 공용 풀)
+
+        Returns:
+            이미지 바이트
+        """
+        pool = pool or RendererPool.get_instance()
         try:
-            fig.write_image(output_path, width=width, height=height)
+            return pool.render(fig, format=format, width=width, height=height)
         except Exception as e:
             raise RuntimeError(f"이미지 저장 실패. kaleido 설치 필요: pip install kaleido\nError: {e}")
 
@@ -246,7 +341,9 @@ class ChartGenerator:
         band: str,
         lna_gain_state: str,
         input_port: str,
-        compact_size: Tuple[int, int] = (300, 200)
+        compact_size: Tuple[int, int] = (300, 200),
+        render_mode: str = 'auto',
+        webgl_threshold: Optional[int] = None
     ) -> go.Figure:
         """
         CSV 데이터용 간략 그리드 레이아웃 생성
@@ -261,9 +358,12 @@ class ChartGenerator:
             lna_gain_state: LNA gain state (예: 'G0_H')
             input_port: Input port (예: 'ANT1')
             compact_size: (width, height) for each subplot in pixels
+            render_mode: 'auto' (점 개수가 임계값을 넘으면 WebGL), 'svg', 'webgl'
+                정적 내보내기(render_image)는 WebGL trace를 SVG로 바꿔 렌더링
+            webgl_threshold: 'auto'의 WebGL 전환 점 개수 (None이면 WEBGL_POINT_THRESHOLD)
 
         Returns:
-            Plotly Figure 객체
+            Plotly Figure 객체 (선택된 모드는 render_mode_of(fig)로 확인)
         """
         # CA 조합 (열)
         ca_combinations = list(grid_data.keys())
@@ -289,8 +389,8 @@ class ChartGenerator:
             return fig
 
         # RX 포트 (행)
-        rx_ports = ['RXOUT1', 'RXOUT2', 'RXOUT3', 'RXOUT4']
-        rows = 4
+        rx_ports = ChartGenerator.COMPACT_GRID_ROWS
+        rows = len(rx_ports)
 
         # 서브플롯 제목 생성 (열 제목만)
         subplot_titles = []
@@ -302,88 +402,59 @@ class ChartGenerator:
                 else:
                     subplot_titles.append("")
 
-        # 서브플롯 생성
-        fig = make_subplots(
+        # 서브플롯 배치 (도메인, 열 제목, RXOUT 행 제목)는 make_subplots로 계산한 뒤
+        # layout을 dict로 꺼내 축 설정을 합친다 → Figure 검증은 마지막에 한 번만
+        layout = make_subplots(
             rows=rows,
             cols=cols,
             subplot_titles=subplot_titles,
-            vertical_spacing=0.02,  # Minimal spacing like sample
-            horizontal_spacing=0.02,  # Minimal spacing like sample
+            vertical_spacing=ChartGenerator.COMPACT_GRID_SPACING,  # Minimal spacing like sample
+            horizontal_spacing=ChartGenerator.compact_grid_spacing(cols),  # Minimal spacing like sample
             row_titles=rx_ports,  # 왼쪽에 RXOUT1-4 표시
-        )
-
-        # 데이터 추가
-        for col_idx, ca_combo in enumerate(ca_combinations):
-            for row_idx, rx_port in enumerate(rx_ports):
-                # Check if data exists for this combination
-                if ca_combo not in grid_data or rx_port not in grid_data[ca_combo]:
-                    continue
-
-                cell_data = grid_data[ca_combo][rx_port]
-
-                if cell_data['count'] > 0:
-                    freq = cell_data['frequency']
-                    gain = cell_data['gain_db']
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=freq,
-                            y=gain,
-                            mode='lines',
-                            name=f"{rx_port}-{ca_combo}",
-                            showlegend=False,
-                            line=dict(width=2, color='#1f77b4'),
-                            hovertemplate=f'{rx_port} - {ca_combo}<br>Freq: %{{x:.1f}} MHz<br>Gain: %{{y:.2f}} dB<extra></extra>'
-                        ),
-                        row=row_idx + 1,
-                        col=col_idx + 1
-                    )
+        ).layout.to_plotly_json()
 
         # X축, Y축 설정 (모든 서브플롯)
-        middle_row = (rows + 1) // 2  # Y축 제목을 중간 행에 표시
+        y_range = ChartGenerator.compact_grid_y_range(lna_gain_state)  # G5는 [-10, 10], 나머지는 [0, 20]
         for i in range(1, rows + 1):
             for j in range(1, cols + 1):
+                suffix = ChartGenerator._subplot_suffix(i, j, cols)
+
                 # X축 설정
-                fig.update_xaxes(
+                layout[f'xaxis{suffix}'].update(
                     showticklabels=(i == rows),  # Only bottom row
                     showgrid=True,
                     gridwidth=0.5,
                     gridcolor='#E8E8E8',
-                    title_text="Frequency (MHz)" if i == rows else "",
-                    title_font=dict(size=12),
-                    tickfont=dict(size=10),
-                    row=i,
-                    col=j
+                    title=dict(text="Frequency (MHz)" if i == rows else "", font=dict(size=12)),
+                    tickfont=dict(size=10)
                 )
 
-                # Y축 설정 - G5는 [-10, 10], 나머지는 [0, 20]
-                y_range = [-10, 10] if lna_gain_state == 'G5' else [0, 20]
-                fig.update_yaxes(
+                # Y축 설정
+                layout[f'yaxis{suffix}'].update(
                     showticklabels=(j == 1),  # Only left column
                     showgrid=True,
                     gridwidth=0.5,
                     gridcolor='#E8E8E8',
-                    title_text="Avg Gain (dB)" if j == 1 else "",  # Show on all rows
-                    title_font=dict(size=12),
-                    title_standoff=15,  # Reduced spacing to make room for RXOUT labels in export
+                    title=dict(
+                        text="Avg Gain (dB)" if j == 1 else "",  # Show on all rows
+                        font=dict(size=12),
+                        standoff=15  # Reduced spacing to make room for RXOUT labels in export
+                    ),
                     tickfont=dict(size=10),
-                    row=i,
-                    range=y_range,
-                    col=j
+                    range=y_range
                 )
 
         # 전체 레이아웃 - 반응형 사이즈 (Responsive sizing)
         # Fixed target canvas size for consistent display
-        TARGET_WIDTH = 1500  # Increased to accommodate larger left margin
-        TARGET_HEIGHT = 900
+        TARGET_WIDTH, TARGET_HEIGHT = ChartGenerator.COMPACT_GRID_CANVAS
 
         # Charts scale based on grid size: fewer charts = larger, more charts = smaller
         total_width = TARGET_WIDTH
         total_height = TARGET_HEIGHT
 
-        fig.update_layout(
+        layout.update(
             title=dict(
-                text=f"Cfg Band: <b style='color:#1f77b4'>{band}</b> | LNA Gain State: <b style='color:#ff7f0e'>{lna_gain_state}</b> | Input Port: <b style='color:#2ca02c'>{input_port}</b>",
+                text=ChartGenerator.compact_grid_title(band, lna_gain_state, input_port),
                 x=0.5,
                 xanchor='center',
                 font=dict(size=18)
@@ -392,14 +463,164 @@ class ChartGenerator:
             width=total_width,
             hovermode='closest',
             template='plotly_white',
-            margin=dict(l=150, r=60, t=100, b=80)  # Optimized left margin for export inclusion
+            margin=ChartGenerator.COMPACT_GRID_MARGIN  # Optimized left margin for export inclusion
         )
 
         # Move RXOUT labels from right to left and make horizontal
-        for annotation in fig.layout.annotations:
+        for annotation in layout.get('annotations', []):
             # Row titles (RXOUT labels) have textangle=90
-            if hasattr(annotation, "textangle") and annotation.textangle == 90:
+            if annotation.get('textangle') == 90:
                 # Change to horizontal, move to left side, and use paper coordinates for export
                 annotation.update(x=-0.04, xanchor="right", textangle=0)  # Moved closer to subplot for export
 
+        # 데이터 추가 - trace마다 축을 직접 지정하고 add_traces() 한 번으로 추가
+        total_points = sum(cell['count'] for cells in grid_data.values() for cell in cells.values())
+        trace_type = ChartGenerator.TRACE_TYPES[
+            ChartGenerator.choose_render_mode(total_points, render_mode, webgl_threshold)
+        ]
+        traces = []
+        for col_idx, ca_combo in enumerate(ca_combinations):
+            for row_idx, rx_port in enumerate(rx_ports):
+                # Check if data exists for this combination
+                cell_data = grid_data[ca_combo].get(rx_port)
+                if not cell_data or cell_data['count'] == 0:
+                    continue
+
+                suffix = ChartGenerator._subplot_suffix(row_idx + 1, col_idx + 1, cols)
+                traces.append(dict(
+                    type=trace_type,
+                    x=cell_data['frequency'],
+                    y=cell_data['gain_db'],
+                    xaxis=f'x{suffix}',
+                    yaxis=f'y{suffix}',
+                    mode='lines',
+                    name=f"{rx_port}-{ca_combo}",
+                    showlegend=False,
+                    line=dict(width=2, color=ChartGenerator.COMPACT_GRID_LINE_COLOR),
+                    hovertemplate=f'{rx_port} - {ca_combo}<br>Freq: %{{x:.1f}} MHz<br>Gain: %{{y:.2f}} dB<extra></extra>'
+                ))
+
+        fig = go.Figure(layout=layout)
+        fig.add_traces(traces)
+
         return fig
+
+    @staticmethod
+    def _subplot_suffix(row: int, col: int, cols: int) -> str:
+        """make_subplots 축 번호 접미사 (1부터, 왼쪽 위에서 행 우선: '', '2', '3', ...)"""
+        subplot = (row - 1) * cols + col
+        return '' if subplot == 1 else str(subplot)
+
+    @staticmethod
+    def compact_grid_title(band: str, lna_gain_state: str, input_port: str) -> str:
+        """간략 그리드 제목 (HTML)"""
+        return (
+            f"Cfg Band: <b style='color:#1f77b4'>{band}</b> | "
+            f"LNA Gain State: <b style='color:#ff7f0e'>{lna_gain_state}</b> | "
+            f"Input Port: <b style='color:#2ca02c'>{input_port}</b>"
+        )
+
+    @staticmethod
+    def choose_render_mode(
+        total_points: int,
+        render_mode: str = 'auto',
+        webgl_threshold: Optional[int] = None
+    ) -> str:
+        """
+        trace 렌더링 모드 결정
+
+        Args:
+            total_points: 차트 전체 점 개수
+            render_mode: 'auto', 'svg', 'webgl'
+            webgl_threshold: 'auto'의 WebGL 전환 점 개수 (None이면 WEBGL_POINT_THRESHOLD)
+
+        Returns:
+            'svg' 또는 'webgl'
+        """
+        if render_mode not in ('auto', 'svg', 'webgl'):
+            raise ValueError(f"render_mode must be 'auto', 'svg' or 'webgl': {render_mode}")
+        if render_mode != 'auto':
+            return render_mode
+
+        threshold = ChartGenerator.WEBGL_POINT_THRESHOLD if webgl_threshold is None else webgl_threshold
+        return 'webgl' if total_points > threshold else 'svg'
+
+    @staticmethod
+    def render_mode_of(fig: go.Figure) -> str:
+        """Figure의 trace 렌더링 모드 ('webgl': Scattergl trace 포함)"""
+        return 'webgl' if any(trace.type == 'scattergl' for trace in fig.data) else 'svg'
+
+    @staticmethod
+    def compact_grid_spacing(cols: int) -> float:
+        """열 간격 - 기본 COMPACT_GRID_SPACING, 열이 많으면 plotly 한계(1 / (cols - 1)) 안으로 축소"""
+        if cols <= 1:
+            return ChartGenerator.COMPACT_GRID_SPACING
+        return min(ChartGenerator.COMPACT_GRID_SPACING, 0.5 / (cols - 1))
+
+    @staticmethod
+    def compact_grid_y_range(lna_gain_state: str) -> List[int]:
+        """Y축 범위 - G5는 [-10, 10], 나머지는 [0, 20]"""
+        return [-10, 10] if lna_gain_state == 'G5' else [0, 20]
+
+    @staticmethod
+    def create_compact_grid_spec(
+        grid_data: Dict[str, Dict[str, Dict]],
+        band: str,
+        lna_gain_state: str,
+        input_port: str,
+        render_mode: str = 'auto',
+        webgl_threshold: Optional[int] = None
+    ) -> Dict:
+        """
+        간략 그리드의 데이터 전용 명세 (Plotly Figure 없이)
+
+        create_compact_grid()와 같은 배치를 클라이언트에서 조립할 수 있도록
+        레이아웃 메타데이터와 trace 배열만 반환한다 (서브플롯별 축 설정은 생성하지 않음).
+
+        Args:
+            grid_data: CSV parser의 get_grid_data() 결과
+            band: 밴드 이름
+            lna_gain_state: LNA gain state
+            input_port: Input port
+            render_mode: 'auto', 'svg', 'webgl' (create_compact_grid()와 동일)
+            webgl_threshold: 'auto'의 WebGL 전환 점 개수
+
+        Returns:
+            {'layout': {...}, 'traces': [{'row', 'col', 'name', 'x', 'y'}, ...]}
+            layout['trace_type']: 'scatter' 또는 'scattergl'
+            row/col은 0부터 시작 (row 0 = 맨 위)
+        """
+        ca_combinations = list(grid_data.keys())
+        width, height = ChartGenerator.COMPACT_GRID_CANVAS
+
+        traces = []
+        for col_idx, ca_combo in enumerate(ca_combinations):
+            for row_idx, rx_port in enumerate(ChartGenerator.COMPACT_GRID_ROWS):
+                cell_data = grid_data[ca_combo].get(rx_port)
+                if not cell_data or cell_data['count'] == 0:
+                    continue
+                traces.append({
+                    'row': row_idx,
+                    'col': col_idx,
+                    'name': f"{rx_port}-{ca_combo}",
+                    'x': cell_data['frequency'],
+                    'y': cell_data['gain_db']
+                })
+
+        layout = {
+            'title': ChartGenerator.compact_grid_title(band, lna_gain_state, input_port),
+            'rows': ChartGenerator.COMPACT_GRID_ROWS,
+            'columns': ca_combinations,
+            'y_range': ChartGenerator.compact_grid_y_range(lna_gain_state),
+            'spacing': ChartGenerator.COMPACT_GRID_SPACING,
+            'col_spacing': ChartGenerator.compact_grid_spacing(len(ca_combinations)),
+            'width': width,
+            'height': height,
+            'margin': ChartGenerator.COMPACT_GRID_MARGIN,
+            'line_color': ChartGenerator.COMPACT_GRID_LINE_COLOR,
+            'trace_type': ChartGenerator.TRACE_TYPES[ChartGenerator.choose_render_mode(
+                sum(len(trace['x']) for trace in traces), render_mode, webgl_threshold
+            )]
+        }
+
+        return {'layout': layout, 'traces': traces}
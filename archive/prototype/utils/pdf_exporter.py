@@ -1,36 +1,213 @@
 """
 PDF export utilities
-Combines multiple images into a single PDF report
+Combines multiple images into a single PDF report, one page at a time
 """
 
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 from PIL import Image
 from datetime import datetime
 
 
+def _pdf_string(text: str) -> bytes:
+    """PDF text string: literal for ASCII, UTF-16BE hex otherwise"""
+    try:
+        escaped = text.encode('ascii').replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+        return b'(' + escaped + b')'
+    except UnicodeEncodeError:
+        return b'<FEFF' + text.encode('utf-16-be').hex().upper().encode('ascii') + b'>'
+
+
+class PdfPageWriter:
+    """
+    Minimal PDF writer that appends one JPEG page at a time
+
+    Each page (image XObject, content stream, page object) is written to the
+    file as soon as it is added; only object offsets are kept, so memory does
+    not grow with the page count. The page tree, catalog and xref table are
+    written on close().
+
+    Example:
+        >>> with PdfPageWriter(Path('report.pdf'), title='Report') as writer:
+        ...     writer.add_jpeg_page(jpeg_bytes, 1920, 1200, dpi=300)
+    """
+
+    # Fixed object numbers; page objects follow
+    CATALOG, PAGES, INFO = 1, 2, 3
+
+    def __init__(self, output_pdf: Path, title: Optional[str] = None, author: Optional[str] = None):
+        self.output_pdf = Path(output_pdf)
+        self._fh = open(self.output_pdf, 'wb')
+        self._offsets = {}
+        self._next_id = self.INFO + 1
+        self._page_ids = []
+        self._info = {'Producer': 'RF Analyzer'}
+        if title:
+            self._info['Title'] = title
+        if author:
+            self._info['Author'] = author
+
+        # Header with a binary comment so transfer tools treat the file as binary
+        self._fh.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_ids)
+
+    def _write_object(self, obj_id: int, body: bytes, stream: Optional[bytes] = None) -> None:
+        self._offsets[obj_id] = self._fh.tell()
+        self._fh.write(f'{obj_id} 0 obj\n'.encode() + body)
+        if stream is not None:
+            self._fh.write(b'\nstream\n' + stream + b'\nendstream')
+        self._fh.write(b'\nendobj\n')
+
+    def add_jpeg_page(self, jpeg: bytes, width: int, height: int, dpi: float = 72.0) -> None:
+        """
+        Append a page showing one RGB JPEG image at full page size
+
+        Args:
+            jpeg: Baseline JPEG bytes (RGB)
+            width: Image width in pixels
+            height: Image height in pixels
+            dpi: Resolution; page size is width x height pixels at this DPI
+        """
+        image_id, contents_id, page_id = self._next_id, self._next_id + 1, self._next_id + 2
+        self._next_id += 3
+
+        page_width = width * 72.0 / dpi
+        page_height = height * 72.0 / dpi
+
+        self._write_object(image_id, (
+            f'<< /Type /XObject /Subtype /Image /Width {width} /Height {height} '
+            f'/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode /Length {len(jpeg)} >>'
+        ).encode(), jpeg)
+
+        contents = f'q {page_width:.4f} 0 0 {page_height:.4f} 0 0 cm /image Do Q'.encode()
+        self._write_object(contents_id, f'<< /Length {len(contents)} >>'.encode(), contents)
+
+        self._write_object(page_id, (
+            f'<< /Type /Page /Parent {self.PAGES} 0 R '
+            f'/MediaBox [0 0 {page_width:.4f} {page_height:.4f}] '
+            f'/Resources << /ProcSet [/PDF /ImageC] /XObject << /image {image_id} 0 R >> >> '
+            f'/Contents {contents_id} 0 R >>'
+        ).encode())
+        self._page_ids.append(page_id)
+
+    def close(self) -> None:
+        """Write page tree, catalog, info and xref table, then close the file"""
+        if self._fh.closed:
+            return
+
+        kids = ' '.join(f'{page_id} 0 R' for page_id in self._page_ids)
+        self._write_object(self.PAGES, f'<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>'.encode())
+        self._write_object(self.CATALOG, f'<< /Type /Catalog /Pages {self.PAGES} 0 R >>'.encode())
+
+        self._info['CreationDate'] = datetime.now().strftime("D:%Y%m%d%H%M%S")
+        info = b' '.join(f'/{key} '.encode() + _pdf_string(value) for key, value in self._info.items())
+        self._write_object(self.INFO, b'<< ' + info + b' >>')
+
+        xref_offset = self._fh.tell()
+        lines = [f'xref\n0 {self._next_id}\n', '0000000000 65535 f \n']
+        lines += [f'{self._offsets[obj_id]:010d} 00000 n \n' for obj_id in range(1, self._next_id)]
+        lines.append(
+            f'trailer\n<< /Size {self._next_id} /Root {self.CATALOG} 0 R /Info {self.INFO} 0 R >>\n'
+            f'startxref\n{xref_offset}\n%%EOF\n'
+        )
+        self._fh.write(''.join(lines).encode())
+        self._fh.close()
+
+    def abort(self) -> None:
+        """Close and delete the partial file"""
+        self._fh.close()
+        self.output_pdf.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
 class PDFExporter:
     """
     PDF export utility for combining multiple chart images
     """
 
+    # Pages decoded and JPEG-encoded ahead of the writer
+    DEFAULT_DECODE_WORKERS = 2
+
+    JPEG_QUALITY = 95
+    HIGH_QUALITY_DPI = 300
+    STANDARD_DPI = 100
+
+    @staticmethod
+    def encode_page(image: Union[Path, bytes], page_size: Optional[tuple] = None, quality: int = JPEG_QUALITY):
+        """
+        Decode one image and encode it as an RGB JPEG page for PdfPageWriter
+
+        Args:
+            image: Image file path, or encoded image bytes (e.g. PNG from the renderer)
+            page_size: (width, height) in pixels, None to keep original
+            quality: JPEG quality
+
+        Returns:
+            (jpeg bytes, width, height), or None if the image is missing/unreadable
+        """
+        if isinstance(image, (bytes, bytearray)):
+            source, label = io.BytesIO(image), 'image bytes'
+        else:
+            source = label = Path(image)
+            if not source.exists():
+                print(f"[WARNING] Image not found: {source}")
+                return None
+
+        try:
+            with Image.open(source) as img:
+                # Convert to RGB if needed
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+
+                # Resize only if page_size is specified
+                if page_size:
+                    img = img.resize(page_size, Image.Resampling.LANCZOS)
+
+                buffer = io.BytesIO()
+                img.save(buffer, format='JPEG', quality=quality)
+                return buffer.getvalue(), img.width, img.height
+
+        except Exception as e:
+            print(f"[ERROR] Failed to load {label}: {e}")
+            return None
+
     @staticmethod
     def images_to_pdf(
         image_paths: List[Path],
         output_pdf: Path,
         title: str = "RF S-parameter Analysis Report",
         page_size: tuple = None,  # None = keep original size
-        high_quality: bool = True
+        high_quality: bool = True,
+        decode_workers: int = DEFAULT_DECODE_WORKERS
     ) -> None:
         """
         Combine multiple images into a single PDF
 
+        Pages are decoded, converted and written one at a time, so memory
+        stays bounded to a few pages regardless of the page count. Up to
+        2 x decode_workers pages are prepared ahead in a thread pool.
+
         Args:
             image_paths: List of image file paths (PNG/JPG)
             output_pdf: Output PDF file path
             title: PDF document title
             page_size: (width, height) in pixels, None to keep original
             high_quality: Use high quality settings (default: True)
+            decode_workers: Decode threads (0 = decode in the calling thread)
 
         Note:
             Requires: pip install pillow
@@ -38,49 +215,37 @@ class PDFExporter:
         if not image_paths:
             raise ValueError("No images provided")
 
-        # Convert all images to RGB (required for PDF)
-        images = []
-
-        for img_path in image_paths:
-            if not img_path.exists():
-                print(f"[WARNING] Image not found: {img_path}")
-                continue
-
-            try:
-                img = Image.open(img_path)
-
-                # Convert to RGB if needed
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Resize only if page_size is specified
-                if page_size:
-                    img = img.resize(page_size, Image.Resampling.LANCZOS)
+        output_pdf = Path(output_pdf)
 
-                images.append(img)
+        # Same settings as Pillow's PDF writer used before: JPEG (DCTDecode) pages
+        dpi = PDFExporter.HIGH_QUALITY_DPI if high_quality else PDFExporter.STANDARD_DPI
+        quality = PDFExporter.JPEG_QUALITY
 
-            except Exception as e:
-                print(f"[ERROR] Failed to load {img_path}: {e}")
+        def encoded_pages():
+            if decode_workers <= 0:
+                for img_path in image_paths:
+                    yield PDFExporter.encode_page(Path(img_path), page_size, quality)
+                return
 
-        if not images:
-            raise ValueError("No valid images to export")
+            with ThreadPoolExecutor(max_workers=decode_workers) as executor:
+                pending = deque()
+                for img_path in image_paths:
+                    pending.append(executor.submit(PDFExporter.encode_page, Path(img_path), page_size, quality))
+                    if len(pending) >= decode_workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
 
-        # Save as PDF with high quality settings
-        dpi = 300 if high_quality else 100  # 300 DPI for high quality
+        with PdfPageWriter(output_pdf, title=title, author="RF Analyzer") as writer:
+            for page in encoded_pages():
+                if page is not None:
+                    writer.add_jpeg_page(*page, dpi=dpi)
 
-        images[0].save(
-            output_pdf,
-            save_all=True,
-            append_images=images[1:],
-            resolution=dpi,
-            quality=95,  # High JPEG quality
-            optimize=False,  # Don't optimize, keep quality
-            title=title,
-            author="RF Analyzer"
-        )
+            if writer.page_count == 0:
+                raise ValueError("No valid images to export")
 
         print(f"[OK] PDF created: {output_pdf}")
-        print(f"  Pages: {len(images)}")
+        print(f"  Pages: {writer.page_count}")
         print(f"  File size: {output_pdf.stat().st_size / (1024*1024):.1f} MB")
 
     @staticmethod
@@ -88,7 +253,8 @@ class PDFExporter:
         image_dir: Path,
         output_pdf: Path,
         pattern: str = "*.png",
-        sort_by_name: bool = True
+        sort_by_name: bool = True,
+        decode_workers: int = DEFAULT_DECODE_WORKERS
     ) -> None:
         """
         Create PDF report from all images in a directory
@@ -98,6 +264,7 @@ class PDFExporter:
             output_pdf: Output PDF file path
             pattern: File pattern (e.g., "*.png", "B41_*.png")
             sort_by_name: Sort images by filename
+            decode_workers: Decode threads for images_to_pdf()
         """
         if not image_dir.exists():
             raise ValueError(f"Directory not found: {image_dir}")
@@ -118,7 +285,8 @@ class PDFExporter:
         PDFExporter.images_to_pdf(
             image_paths=image_paths,
             output_pdf=output_pdf,
-            title=f"RF Analysis Report - {datetime.now().strftime('%Y-%m-%d')}"
+            title=f"RF Analysis Report - {datetime.now().strftime('%Y-%m-%d')}",
+            decode_workers=decode_workers
         )
 
     @staticmethod
@@ -127,7 +295,8 @@ class PDFExporter:
         output_pdf: Path,
         band: Optional[str] = None,
         lna_state: Optional[str] = None,
-        input_port: Optional[str] = None
+        input_port: Optional[str] = None,
+        decode_workers: int = DEFAULT_DECODE_WORKERS
     ) -> None:
         """
         Create PDF report with filtered images
@@ -138,6 +307,7 @@ class PDFExporter:
             band: Filter by band (e.g., "B41")
             lna_state: Filter by LNA state (e.g., "G0_H")
             input_port: Filter by input port (e.g., "ANT1")
+            decode_workers: Decode threads for images_to_pdf()
         """
         # Build pattern
         parts = []
@@ -161,7 +331,8 @@ class PDFExporter:
         PDFExporter.create_report_from_directory(
             image_dir=image_dir,
             output_pdf=output_pdf,
-            pattern=pattern
+            pattern=pattern,
+            decode_workers=decode_workers
         )
 
 
@@ -176,6 +347,8 @@ def main():
     parser.add_argument('--band', '-b', type=str, help='Filter by band')
     parser.add_argument('--lna', '-l', type=str, help='Filter by LNA state')
     parser.add_argument('--port', '-P', type=str, help='Filter by input port')
+    parser.add_argument('--workers', '-w', type=int, default=PDFExporter.DEFAULT_DECODE_WORKERS,
+                        help='Decode threads (0 = none)')
 
     args = parser.parse_args()
 
@@ -188,13 +361,15 @@ def main():
             output_pdf=output_pdf,
             band=args.band,
             lna_state=args.lna,
-            input_port=args.port
+            input_port=args.port,
+            decode_workers=args.workers
         )
     else:
         PDFExporter.create_report_from_directory(
             image_dir=input_dir,
             output_pdf=output_pdf,
-            pattern=args.pattern
+            pattern=args.pattern,
+            decode_workers=args.workers
         )
 
 
@@ -3,12 +3,15 @@ PowerPoint 자동 생성 유틸리티
 python-pptx를 사용한 PPT 자동화
 """
 
+import io
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union, BinaryIO
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
+DEFAULT_TITLE_TEMPLATE = "{band} {lna} {port} LNA Gain"
+
 
 class PptGenerator:
     """
@@ -84,7 +87,7 @@ class PptGenerator:
     def add_slide_with_image(
         self,
         title: str,
-        image_path: Path,
+        image: Union[Path, bytes, BinaryIO],
         layout_index: Optional[int] = None
     ) -> None:
         """
@@ -92,7 +95,8 @@ class PptGenerator:
 
         Args:
             title: 슬라이드 제목
-            image_path: 삽입할 이미지 경로
+            image: 삽입할 이미지 경로, 이미지 바이트 또는 바이너리 스트림
+                   (바이트/스트림은 임시 파일 없이 메모리에서 바로 삽입)
             layout_index: 레이아웃 인덱스 (None이면 자동 감지된 레이아웃 사용)
         """
         # 레이아웃 선택
@@ -120,9 +124,16 @@ class PptGenerator:
             title_shape.text_frame.paragraphs[0].font.bold = True
 
         # 이미지 추가
-        if not image_path.exists():
-            print(f"[WARNING] Image not found: {image_path}")
-            return
+        if isinstance(image, (bytes, bytearray)):
+            image_source = io.BytesIO(image)
+        elif isinstance(image, (str, Path)):
+            image_path = Path(image)
+            if not image_path.exists():
+                print(f"[WARNING] Image not found: {image_path}")
+                return
+            image_source = str(image_path)
+        else:
+            image_source = image  # File-like object
 
         # Content placeholder가 있으면 그 위치에 이미지 삽입
         content_shape = None
@@ -142,7 +153,7 @@ class PptGenerator:
             sp.getparent().remove(sp)
             
             slide.shapes.add_picture(
-                str(image_path),
+                image_source,
                 left,
                 top,
                 width=width
@@ -154,57 +165,82 @@ class PptGenerator:
             img_width = Inches(9)
             
             slide.shapes.add_picture(
-                str(image_path),
+                image_source,
                 img_left,
                 img_top,
                 width=img_width
             )
 
-    def save(self, output_path: Path) -> None:
+    def save(self, output: Union[Path, BinaryIO]) -> None:
         """
         PPT 파일 저장
 
         Args:
-            output_path: 저장 경로
+            output: 저장 경로 또는 쓰기 가능한 바이너리 스트림
+                    (HTTP 응답, SpooledTemporaryFile 등 - 디스크 경유 없이 저장)
         """
+        if hasattr(output, 'write'):
+            start = output.tell() if output.seekable() else 0
+            self.prs.save(output)
+            if output.seekable():
+                file_size = (output.tell() - start) / (1024 * 1024)
+                print(f"[OK] PPT saved to stream ({file_size:.1f} MB)")
+            return
+
+        output_path = Path(output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         self.prs.save(str(output_path))
         file_size = output_path.stat().st_size / (1024 * 1024)
         print(f"[OK] PPT saved: {output_path.name} ({file_size:.1f} MB)")
 
+    @staticmethod
+    def slide_title(stem: str, title_template: str = DEFAULT_TITLE_TEMPLATE) -> str:
+        """
+        파일명 stem에서 슬라이드 제목 생성
+
+        Args:
+            stem: {band}_{lna}_{port} 형식 (LNA 상태에는 '_' 포함 가능, 예: B41_G0_H_ANT1)
+            title_template: 제목 템플릿
+
+        Returns:
+            제목 (형식이 다르면 stem 그대로)
+        """
+        parts = stem.split('_')
+        if len(parts) < 3:
+            return stem
+
+        return title_template.format(band=parts[0], lna='_'.join(parts[1:-1]), port=parts[-1])
+
     @staticmethod
     def batch_generate_ppt(
-        image_files: List[Path],
-        output_ppt: Path,
+        image_files: List[Union[Path, Tuple[str, bytes]]],
+        output_ppt: Union[Path, BinaryIO],
         template_path: Optional[Path] = None,
-        title_template: str = "{band} {lna} {port} LNA Gain"
+        title_template: str = DEFAULT_TITLE_TEMPLATE
     ) -> None:
         """
         여러 이미지를 하나의 PPT로 자동 생성
 
         Args:
-            image_files: 이미지 파일 리스트
-            output_ppt: 출력 PPT 경로
+            image_files: 이미지 파일 리스트, 또는 (stem, 이미지 바이트) 리스트
+                         (렌더링 결과를 파일로 저장/재오픈하지 않고 바로 삽입)
+            output_ppt: 출력 PPT 경로 또는 바이너리 스트림
             template_path: PPT 템플릿 (선택)
             title_template: 제목 템플릿
         """
         generator = PptGenerator(template_path)
 
-        for img_path in image_files:
-            # 파일명에서 정보 추출 (예: B41_G0_H_ANT1.png)
-            stem = img_path.stem
-            parts = stem.split('_')
-
-            if len(parts) >= 3:
-                band = parts[0]
-                lna = parts[1]
-                port = parts[2]
-                title = title_template.format(band=band, lna=lna, port=port)
+        for item in image_files:
+            if isinstance(item, tuple):
+                stem, image = item
             else:
-                title = stem
+                stem, image = Path(item).stem, item
+
+            # 파일명에서 정보 추출 (예: B41_G0_H_ANT1.png)
+            title = PptGenerator.slide_title(stem, title_template)
 
             print(f"  Adding slide: {title}")
-            generator.add_slide_with_image(title, img_path)
+            generator.add_slide_with_image(title, image)
 
         generator.save(output_ppt)
         print(f"[OK] Total slides: {len(image_files)}")
@@ -0,0 +1,319 @@
+"""
+Kaleido renderer pool
+Keeps warm kaleido (Chromium) processes alive across static image exports
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+import plotly
+import plotly.graph_objects as go
+
+try:
+    from kaleido.scopes.plotly import PlotlyScope
+except ImportError:  # kaleido missing or kaleido>=1.0 (no scope API)
+    PlotlyScope = None
+
+
+# plotly.js bundled with plotly.py, so static exports match the interactive viewer
+PLOTLYJS_PATH = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+
+
+def static_figure(fig):
+    """
+    Figure for static export: WebGL traces (scattergl) become SVG traces (scatter)
+
+    Headless Chromium often has no WebGL context, so WebGL traces come out
+    blank or rasterized in PNG/PDF output. Scattergl attributes used by the
+    charts are a subset of scatter's, so only the trace type changes.
+    Figures without WebGL traces are returned unchanged.
+    """
+    if not any(trace.type == 'scattergl' for trace in fig.data):
+        return fig
+
+    fig_dict = fig.to_dict()
+    for trace in fig_dict['data']:
+        if trace.get('type') == 'scattergl':
+            trace['type'] = 'scatter'
+    return go.Figure(fig_dict)
+
+
+class _KaleidoRenderer:
+    """
+    One kaleido subprocess plus its usage bookkeeping
+    """
+
+    def __init__(self):
+        # mathjax=False: grid charts use no LaTeX, skip the CDN fetch on startup
+        self.scope = PlotlyScope(plotlyjs=PLOTLYJS_PATH, mathjax=False)
+        self.render_count = 0
+        self.created_at = time.time()
+
+    def render(self, fig, format: str, width: Optional[int], height: Optional[int],
+               scale: Optional[float]) -> bytes:
+        image_bytes = self.scope.transform(fig, format=format, width=width, height=height, scale=scale)
+        self.render_count += 1
+        return image_bytes
+
+    def is_healthy(self) -> bool:
+        """Subprocess not started yet (lazy) or still running"""
+        proc = getattr(self.scope, '_proc', None)
+        return proc is None or proc.poll() is None
+
+    def close(self) -> None:
+        try:
+            self.scope._shutdown_kaleido()
+        except Exception:
+            pass
+
+
+class RendererPool:
+    """
+    Bounded pool of long-lived kaleido renderers shared by one worker process
+
+    - Renderers are started once (warm) and reused across requests
+    - At most `size` renderers exist; extra callers wait for a free one
+    - Renderers failing a health check are replaced on checkout
+    - Each renderer is recycled after `max_renders` images to cap Chromium memory growth
+
+    Falls back to fig.to_image() when the kaleido scope API is unavailable.
+
+    Example:
+        >>> pool = RendererPool.get_instance(size=2)
+        >>> png_bytes = pool.render(fig, format='png', width=1920, height=1200)
+    """
+
+    DEFAULT_SIZE = 2
+    DEFAULT_MAX_RENDERS = 200
+    DEFAULT_ACQUIRE_TIMEOUT = 300.0  # seconds
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        max_renders: int = DEFAULT_MAX_RENDERS,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT
+    ):
+        """
+        Args:
+            size: Maximum number of concurrent kaleido processes
+            max_renders: Recycle a renderer after this many images
+            acquire_timeout: Seconds to wait for a free renderer before failing
+        """
+        if size < 1:
+            raise ValueError("Renderer pool size must be at least 1")
+
+        self.size = size
+        self.max_renders = max_renders
+        self.acquire_timeout = acquire_timeout
+
+        self._idle = queue.LifoQueue()  # LIFO keeps the most recently used renderer hot
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+        self._pid = os.getpid()
+        self._stats = {
+            'renders': 0,
+            'started': 0,
+            'recycled': 0,
+            'unhealthy': 0,
+            'errors': 0,
+        }
+
+    @classmethod
+    def get_instance(cls, **kwargs) -> 'RendererPool':
+        """
+        Get the per-process pool, creating it on first use
+
+        Keyword arguments are only applied when the pool is created.
+        A pool inherited through fork() is discarded, since its
+        subprocess pipes belong to the parent process.
+        """
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._pid != os.getpid():
+                cls._instance = cls(**kwargs)
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Shut down and drop the per-process pool"""
+        with cls._instance_lock:
+            if cls._instance is not None and cls._instance._pid == os.getpid():
+                cls._instance.shutdown()
+            cls._instance = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """True if kaleido's scope API is installed"""
+        return PlotlyScope is not None
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """
+        Start renderers ahead of time so the first export skips Chromium startup
+
+        Args:
+            count: Number of renderers to warm (default: pool size)
+
+        Returns:
+            Number of renderers warmed
+        """
+        if not self.is_available():
+            return 0
+
+        count = min(count or self.size, self.size)
+        warm_fig = go.Figure(go.Scatter(x=[0, 1], y=[0, 1]))
+
+        # Hold warmed renderers until the end so each pass starts a new one
+        renderers = []
+        try:
+            for _ in range(count):
+                renderer = self._acquire()
+                try:
+                    renderer.render(warm_fig, 'png', 64, 64, None)
+                except Exception:
+                    # Same as render(): a renderer that failed is not reused
+                    with self._lock:
+                        self._stats['errors'] += 1
+                    self._discard(renderer)
+                    raise
+                renderers.append(renderer)
+        finally:
+            for renderer in renderers:
+                self._release(renderer)
+
+        return len(renderers)
+
+    def render(
+        self,
+        fig: go.Figure,
+        format: str = 'png',
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        scale: Optional[float] = None
+    ) -> bytes:
+        """
+        Render a figure to image bytes (png, jpeg, webp, svg, pdf)
+
+        WebGL traces are drawn as SVG traces (see static_figure()).
+
+        Args:
+            fig: Plotly Figure
+            format: Output format
+            width: Image width in layout pixels
+            height: Image height in layout pixels
+            scale: Resolution scale factor
+
+        Returns:
+            Encoded image bytes
+        """
+        fig = static_figure(fig)
+
+        if not self.is_available():
+            return fig.to_image(format=format, width=width, height=height, scale=scale)
+
+        renderer = self._acquire()
+        try:
+            image_bytes = renderer.render(fig, format, width, height, scale)
+        except Exception:
+            # Chromium state is unknown after a failed transform: replace the renderer
+            with self._lock:
+                self._stats['errors'] += 1
+            self._discard(renderer)
+            raise
+
+        with self._lock:
+            self._stats['renders'] += 1
+        self._release(renderer)
+
+        return image_bytes
+
+    def _acquire(self) -> _KaleidoRenderer:
+        """Check out a healthy renderer, starting one if the pool is below size"""
+        if self._closed:
+            raise RuntimeError("Renderer pool has been shut down")
+
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            try:
+                renderer = self._idle.get_nowait()
+            except queue.Empty:
+                renderer = None
+                with self._lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        self._stats['started'] += 1
+                        create = True
+                    else:
+                        create = False
+
+                if create:
+                    try:
+                        return _KaleidoRenderer()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No kaleido renderer free after {self.acquire_timeout:.0f}s")
+                try:
+                    # Short waits so a slot freed by a discarded renderer is noticed
+                    renderer = self._idle.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    continue
+
+            if renderer.is_healthy():
+                return renderer
+
+            with self._lock:
+                self._stats['unhealthy'] += 1
+            self._discard(renderer)
+
+    def _release(self, renderer: _KaleidoRenderer) -> None:
+        """Return a renderer to the pool, recycling it once it hits max_renders"""
+        if self._closed:
+            self._discard(renderer)
+            return
+
+        if self.max_renders and renderer.render_count >= self.max_renders:
+            with self._lock:
+                self._stats['recycled'] += 1
+            self._discard(renderer)
+            return
+
+        self._idle.put(renderer)
+
+    def _discard(self, renderer: _KaleidoRenderer) -> None:
+        renderer.close()
+        with self._lock:
+            self._created -= 1
+
+    def shutdown(self) -> None:
+        """Stop all idle renderers; renderers in use are stopped on release"""
+        self._closed = True
+        while True:
+            try:
+                renderer = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(renderer)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Pool counters (renders, started, recycled, unhealthy, errors, idle, alive)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['alive'] = self._created
+        stats['idle'] = self._idle.qsize()
+        return stats
+
+    def __repr__(self):
+        stats = self.get_stats()
+        return (f"RendererPool(size={self.size}, max_renders={self.max_renders}, "
+                f"alive={stats['alive']}, idle={stats['idle']}, renders={stats['renders']})")
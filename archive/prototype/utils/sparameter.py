@@ -2,6 +2,9 @@
 S-parameter 분석 유틸리티
 """
 
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
 from typing import Tuple, List, Dict
 import numpy as np
 
@@ -51,6 +54,42 @@ class SParameterAnalyzer:
             'std': float(np.std(gain_db))
         }
 
+    @staticmethod
+    def calculate_gain_statistics_batch(gain_db: np.ndarray, offsets: np.ndarray = None) -> Dict[str, np.ndarray]:
+        """
+        여러 트레이스의 Gain 통계값 일괄 계산
+
+        Args:
+            gain_db: 이어붙인 Gain 배열 (offsets 지정 시) 또는 (트레이스 수, 포인트 수) 2D 배열
+            offsets: 트레이스 경계 (길이 트레이스 수 + 1, concat_traces 참고)
+
+        Returns:
+            {'mean', 'max', 'min', 'std', 'ripple'}: 트레이스별 배열 (ripple = max - min)
+        """
+        gain_db = np.asarray(gain_db, dtype=np.float64)
+
+        if offsets is None:
+            gain_db = np.atleast_2d(gain_db)
+            g_mean = gain_db.mean(axis=1)
+            g_max = gain_db.max(axis=1)
+            g_min = gain_db.min(axis=1)
+            g_std = gain_db.std(axis=1)
+        else:
+            starts, lengths = _trace_bounds(offsets, len(gain_db))
+            g_mean = np.add.reduceat(gain_db, starts) / lengths
+            deviation = gain_db - np.repeat(g_mean, lengths)
+            g_std = np.sqrt(np.add.reduceat(deviation * deviation, starts) / lengths)
+            g_max = np.maximum.reduceat(gain_db, starts)
+            g_min = np.minimum.reduceat(gain_db, starts)
+
+        return {
+            'mean': g_mean,
+            'max': g_max,
+            'min': g_min,
+            'std': g_std,
+            'ripple': g_max - g_min
+        }
+
     @staticmethod
     def find_frequency_range(
         freq: np.ndarray,
@@ -96,6 +135,181 @@ class SParameterAnalyzer:
         gain_interp = np.interp(freq_interp, freq, gain)
         return freq_interp, gain_interp
 
+    @staticmethod
+    def concat_traces(traces: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        길이가 다른 트레이스 목록을 하나의 배열 + 경계(offsets)로 변환
+
+        트레이스 i는 values[offsets[i]:offsets[i + 1]] 이다.
+
+        Args:
+            traces: 1D 배열 리스트
+
+        Returns:
+            (values, offsets)
+        """
+        lengths = [len(trace) for trace in traces]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.concatenate(traces) if traces else np.empty(0)
+        return values, offsets
+
+    @staticmethod
+    def interpolate_batch(
+        freq: np.ndarray,
+        gain: np.ndarray,
+        offsets: np.ndarray,
+        freq_grid: np.ndarray = None,
+        num_points: int = 1000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 트레이스를 공통 주파수 그리드로 일괄 보간 (벡터화)
+
+        각 트레이스를 0부터 시작하도록 이동한 뒤 (최대 트레이스 폭 + 1) 간격으로 이어붙여
+        전체를 하나의 정렬된 주파수 축으로 만들고, np.interp를 한 번만 호출한다.
+        그리드 값은 트레이스마다 자기 범위로 잘라서 (np.interp와 같이 범위 밖은 끝 값)
+        이웃 트레이스와 섞이지 않는다. 결과는 트레이스별 np.interp와 부동소수점 오차
+        (약 1e-9) 이내로 같다.
+
+        Args:
+            freq: 이어붙인 주파수 배열 (트레이스별 오름차순)
+            gain: 이어붙인 Gain 배열
+            offsets: 트레이스 경계 (concat_traces 참고)
+            freq_grid: 공통 주파수 그리드 (None이면 모든 트레이스가 겹치는 구간을 num_points로 분할)
+            num_points: freq_grid가 None일 때 포인트 수
+
+        Returns:
+            (freq_grid, gain_matrix): gain_matrix는 (트레이스 수, 그리드 포인트 수)
+        """
+        freq = np.asarray(freq, dtype=np.float64)
+        gain = np.asarray(gain, dtype=np.float64)
+        starts, lengths = _trace_bounds(offsets, len(freq))
+        first = freq[starts]
+        last = freq[starts + lengths - 1]
+
+        if freq_grid is None:
+            low, high = first.max(), last.min()
+            if low > high:
+                raise ValueError("모든 트레이스가 겹치는 주파수 구간이 없습니다")
+            freq_grid = np.linspace(low, high, num_points)
+        else:
+            freq_grid = np.asarray(freq_grid, dtype=np.float64)
+
+        # 트레이스별 시작점을 0으로 맞추고 (최대 트레이스 폭 + 1) 간격으로 배치
+        span = float((last - first).max()) + 1.0
+        shift = np.arange(len(lengths)) * span - first
+        keys = freq + np.repeat(shift, lengths)
+
+        query = np.clip(freq_grid[np.newaxis, :], first[:, np.newaxis], last[:, np.newaxis])
+        query += shift[:, np.newaxis]
+        return freq_grid, np.interp(query, keys, gain)
+
+    @staticmethod
+    def lttb_indices(
+        x: np.ndarray,
+        y: np.ndarray,
+        target_points: int,
+        refine_passes: int = 2
+    ) -> np.ndarray:
+        """
+        Largest-Triangle-Three-Buckets 다운샘플링 인덱스 계산 (벡터화)
+
+        첫/마지막 포인트를 유지하고, 나머지를 (target_points - 2)개 버킷으로 나눠
+        버킷마다 삼각형 면적이 가장 큰 포인트 하나를 선택한다 (피크/노치 보존).
+
+        원래 LTTB는 직전 버킷의 선택 결과를 기준점으로 쓰는 순차 알고리즘이므로,
+        여기서는 직전 버킷 평균을 초기 기준점으로 모든 버킷을 한 번에 계산한 뒤
+        이전 패스의 선택 결과로 기준점을 갱신하며 refine_passes번 반복한다.
+
+        면적 기준만으로는 전역 최대/최소가 빠질 수 있으므로, 두 극값(NaN 제외)은
+        해당 버킷의 선택을 대체해 항상 포함한다. 두 극값이 같은 버킷에 있으면
+        출력은 target_points + 1개가 된다.
+
+        Args:
+            x: X 배열 (정렬된 주파수)
+            y: Y 배열 (Gain)
+            target_points: 출력 포인트 수
+            refine_passes: 기준점 갱신 반복 횟수
+
+        Returns:
+            선택된 포인트 인덱스 배열 (오름차순, 전역 최대/최소 포함)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n = len(x)
+
+        if target_points >= n or target_points < 3:
+            return np.arange(n)
+
+        # 버킷 경계 (첫/마지막 포인트 제외)
+        num_buckets = target_points - 2
+        every = (n - 2) / num_buckets
+        edges = (np.arange(num_buckets + 1) * every).astype(np.int64) + 1
+        edges[-1] = n - 1
+        sizes = np.diff(edges)
+        starts = edges[:-1] - 1
+
+        inner_x = x[1:-1]
+        inner_y = y[1:-1]
+        bucket = np.repeat(np.arange(num_buckets), sizes)
+
+        # 다음 버킷 평균 (마지막 버킷은 마지막 포인트)
+        avg_x = np.add.reduceat(inner_x, starts) / sizes
+        avg_y = np.add.reduceat(inner_y, starts) / sizes
+        next_x = np.append(avg_x[1:], x[-1])[bucket]
+        next_y = np.append(avg_y[1:], y[-1])[bucket]
+
+        # 초기 기준점: 직전 버킷 평균 (첫 버킷은 첫 포인트)
+        anchor_x = np.insert(avg_x[:-1], 0, x[0])
+        anchor_y = np.insert(avg_y[:-1], 0, y[0])
+
+        for _ in range(refine_passes + 1):
+            ax = anchor_x[bucket]
+            ay = anchor_y[bucket]
+            area = np.abs((ax - next_x) * (inner_y - ay) - (ax - inner_x) * (next_y - ay))
+            area[np.isnan(area)] = -1.0
+
+            # 버킷별 첫 번째 최대 면적 포인트
+            best = np.maximum.reduceat(area, starts)
+            hits = np.flatnonzero(area >= best[bucket])
+            selected = hits[np.r_[True, np.diff(bucket[hits]) != 0]]
+
+            anchor_x = np.insert(inner_x[selected[:-1]], 0, x[0])
+            anchor_y = np.insert(inner_y[selected[:-1]], 0, y[0])
+
+        # 전역 최대/최소 강제 포함 (첫/마지막 포인트는 이미 포함)
+        if not np.isnan(y).all():
+            extremes = {int(np.nanargmax(y)), int(np.nanargmin(y))} - {0, n - 1}
+            if extremes:
+                forced = np.array(sorted(extremes), dtype=np.int64) - 1
+                keep = np.ones(num_buckets, dtype=bool)
+                keep[bucket[forced]] = False
+                selected = np.sort(np.concatenate((selected[keep], forced)))
+
+        return np.concatenate(([0], selected + 1, [n - 1]))
+
+    @staticmethod
+    def downsample_lttb(
+        freq: np.ndarray,
+        gain: np.ndarray,
+        target_points: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        LTTB 다운샘플링 (차트 표시용)
+
+        Args:
+            freq: 주파수 배열 (오름차순)
+            gain: Gain 배열
+            target_points: 출력 포인트 수 (보통 서브플롯 픽셀 폭)
+
+        Returns:
+            (downsampled_freq, downsampled_gain)
+        """
+        freq = np.asarray(freq)
+        gain = np.asarray(gain)
+        indices = SParameterAnalyzer.lttb_indices(freq, gain, target_points)
+        return freq[indices], gain[indices]
+
     @staticmethod
     def auto_y_range(
         gain_values: List[np.ndarray],
@@ -122,26 +336,66 @@ class SParameterAnalyzer:
         """
         주파수 범위에서 LTE Band 자동 감지
 
+        rf_converter의 3GPP 밴드 구간 인덱스 (Rx/downlink 기준)를 사용한다.
+        측정 구간의 절반 이상을 덮는 밴드 중 가장 잘 맞는 밴드를 고른다.
+
         Args:
             freq: 주파수 배열 (Hz)
 
         Returns:
-            Band 이름 (예: 'B1', 'B3')
-        """
-        freq_mhz = freq[0] / 1e6  # 첫 포인트 기준
-
-        # LTE Band 주파수 매핑 (간략화)
-        bands = {
-            'B1': (1920, 2170),
-            'B3': (1710, 1880),
-            'B7': (2500, 2690),
-            'B20': (791, 862),
-            'B38': (2570, 2620),
-            'B41': (2496, 2690),
-        }
+            Band 이름 (예: 'B1', 'B3'), 해당 밴드가 없으면 'Unknown'
+        """
+        freq_mhz = np.asarray(freq, dtype=np.float64) / 1e6
+        band = _band_index().assign(freq_mhz.min(), freq_mhz.max())[0]
+        return band or 'Unknown'
+
+    @staticmethod
+    def detect_bands(freq: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """
+        여러 트레이스의 Band 일괄 감지 (벡터화)
+
+        Args:
+            freq: 이어붙인 주파수 배열 (Hz, concat_traces 참고)
+            offsets: 트레이스 경계
 
-        for band_name, (f_min, f_max) in bands.items():
-            if f_min <= freq_mhz <= f_max:
-                return band_name
+        Returns:
+            트레이스별 Band 이름 배열 (해당 밴드가 없으면 'Unknown')
+        """
+        freq_mhz = np.asarray(freq, dtype=np.float64) / 1e6
+        starts, _ = _trace_bounds(offsets, len(freq_mhz))
+        bands = _band_index().assign(
+            np.minimum.reduceat(freq_mhz, starts),
+            np.maximum.reduceat(freq_mhz, starts)
+        )
+        bands[np.equal(bands, None)] = 'Unknown'
+        return bands
+
+
+def _trace_bounds(offsets: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """offsets 검증 후 (트레이스 시작 인덱스, 트레이스 길이) 반환"""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) < 2 or offsets[0] != 0 or offsets[-1] != size:
+        raise ValueError(f"offsets는 0으로 시작해 {size}로 끝나야 합니다")
+
+    lengths = np.diff(offsets)
+    if np.any(lengths < 1):
+        raise ValueError("빈 트레이스는 지원하지 않습니다")
+
+    return offsets[:-1], lengths
 
-        return 'Unknown'
+
+# rf_converter/core/band_index.py (numpy만 의존하는 단일 모듈)
+_BAND_INDEX_PATH = Path(__file__).resolve().parents[3] / 'rf_converter' / 'core' / 'band_index.py'
+
+
+@lru_cache(maxsize=None)
+def _band_index():
+    """rf_converter의 공용 3GPP 밴드 구간 인덱스 (Rx/downlink, 최초 1회 생성)
+
+    rf_converter.core 패키지(__init__의 파서/서비스 import)와 sys.path를
+    거치지 않도록 band_index.py 파일만 직접 로드한다.
+    """
+    spec = importlib.util.spec_from_file_location('_rf_converter_band_index', _BAND_INDEX_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.BandIntervalIndex.default('rx')
@@ -3,6 +3,18 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serving under an ASGI server is optional but recommended: the progress SSE
+stream then runs on the event loop, woken by ProgressNotifier, instead of
+holding a worker thread and polling the cache per connection (the WSGI
+fallback used by runserver):
+
+    uvicorn config.asgi:application
+
+Progress notifications are in-process and the default cache is per-process,
+so with more than one worker configure a shared cache (e.g. Redis); streams
+then pick up other workers' writes on their heartbeat re-read. cancel_task
+is async, so a cancel request never waits behind a running sync export.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
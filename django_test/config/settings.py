@@ -131,3 +131,43 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# RF Analyzer: static chart export
+# Warm kaleido renderers kept per worker process (see prototype/utils/renderer_pool.py)
+RF_ANALYZER_RENDERER_POOL = {
+    'size': 2,            # Concurrent Chromium processes per worker
+    'max_renders': 200,   # Recycle a renderer after N images to limit memory growth
+}
+
+# Export downloads are assembled in spooled temp files: in memory up to this size,
+# then rolled over to disk in RF_ANALYZER_EXPORT_TEMP_DIR (None = system temp dir)
+RF_ANALYZER_EXPORT_SPOOL_MAX_MEMORY = 32 * 1024 * 1024
+RF_ANALYZER_EXPORT_TEMP_DIR = None
+
+# Rendered chart pages (PDF/PNG) shared by all exports, LRU-evicted by total size
+RF_ANALYZER_ARTIFACT_CACHE_DIR = BASE_DIR / 'cache' / 'artifacts'
+RF_ANALYZER_ARTIFACT_CACHE_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+
+# Interactive charts switch to WebGL (Scattergl) traces above this many points per grid
+# (None = ChartGenerator.WEBGL_POINT_THRESHOLD); static exports always render SVG traces
+RF_ANALYZER_WEBGL_POINT_THRESHOLD = 100_000
+
+# SnP folder upload: one request may carry a whole measurement folder (Django's default is 100 files)
+DATA_UPLOAD_MAX_NUMBER_FILES = 2000
+RF_ANALYZER_SNP_INGEST_WORKERS = None  # Parser processes per upload (None = CPU count)
+
+# Chunked (resumable) CSV upload: chunks are staged here until ingested
+RF_ANALYZER_CHUNKED_UPLOAD_DIR = BASE_DIR / 'cache' / 'uploads'
+RF_ANALYZER_CHUNKED_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RF_ANALYZER_CHUNKED_UPLOAD_MAX_BYTES = 20 * 1024 ** 3  # 20 GB
+RF_ANALYZER_CHUNKED_UPLOAD_STALL_TIMEOUT = 30 * 60  # Ingest thread stops waiting for a chunk (resumes with the next one)
+RF_ANALYZER_CHUNKED_UPLOAD_EXPIRY = 24 * 3600  # No chunk activity for this long: upload and its session are purged
+
+# Optional chart warmup after each upload: pre-builds every combination's chart API
+# payloads (and PNG thumbnails) into the artifact cache so the first viewer click is a hit
+RF_ANALYZER_WARMUP = {
+    'enabled': False,
+    'workers': 2,         # Combinations built concurrently
+    'thumbnails': True,   # Also render thumbnails (uses the kaleido renderer pool)
+}
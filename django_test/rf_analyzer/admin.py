@@ -1,12 +1,12 @@
 from django.contrib import admin
-from .models import MeasurementSession, MeasurementFile, MeasurementData
+from .models import MeasurementSession, MeasurementFile, MeasurementData, SessionCombination, ChunkedUpload
 
 
 @admin.register(MeasurementSession)
 class MeasurementSessionAdmin(admin.ModelAdmin):
     """Admin interface for MeasurementSession"""
-    list_display = ['name', 'user', 'file_count', 'data_point_count', 'created_at', 'updated_at']
-    list_filter = ['created_at', 'updated_at']
+    list_display = ['name', 'user', 'file_count', 'data_point_count', 'is_deleting', 'created_at', 'updated_at']
+    list_filter = ['is_deleting', 'created_at', 'updated_at']
     search_fields = ['name', 'description', 'user__username']
     readonly_fields = ['created_at', 'updated_at', 'file_count', 'data_point_count']
     date_hierarchy = 'created_at'
@@ -31,10 +31,81 @@ class MeasurementSessionAdmin(admin.ModelAdmin):
     file_count.short_description = 'Files'
     
     def data_point_count(self, obj):
-        """Display number of data points"""
-        return obj.data_points.count()
+        """Display number of data points (summed from the combination index)"""
+        return obj.total_data_points()
     data_point_count.short_description = 'Data Points'
 
+    actions = ['export_data_csv', 'rebuild_combinations', 'warm_chart_cache', 'delete_in_background']
+
+    def export_data_csv(self, request, queryset):
+        """Bulk action: stream all measurement data of the selected sessions as CSV"""
+        from .exporters import stream_measurement_csv
+
+        data = MeasurementData.objects.filter(session__in=queryset)
+        if queryset.count() == 1:
+            filename = f'{queryset.get().name}_measurement_data.csv'
+        else:
+            filename = 'measurement_data.csv'
+        return stream_measurement_csv(data, filename=filename, request=request)
+    export_data_csv.short_description = "Export measurement data to CSV"
+
+    def rebuild_combinations(self, request, queryset):
+        """Bulk action: rebuild Band/LNA/Port index from measurement data"""
+        total = 0
+        for session in queryset:
+            total += session.rebuild_combinations()
+            session.bump_data_version()
+        self.message_user(request, f"Rebuilt {total} combinations for {queryset.count()} sessions")
+    rebuild_combinations.short_description = "Rebuild combination index"
+
+    def warm_chart_cache(self, request, queryset):
+        """Bulk action: pre-build chart payloads and thumbnails in background"""
+        from .tasks import schedule_session_warmup
+
+        sessions = list(queryset.filter(is_deleting=False))
+        for session in sessions:
+            schedule_session_warmup(session)
+        self.message_user(request, f"{len(sessions)} sessions queued for chart warmup")
+    warm_chart_cache.short_description = "Warm chart cache (payloads and thumbnails)"
+
+    def delete_in_background(self, request, queryset):
+        """Bulk action: chunked background delete (also resumes interrupted purges)"""
+        from .tasks import schedule_session_purge
+
+        sessions = list(queryset)
+        for session in sessions:
+            schedule_session_purge(session)
+        self.message_user(request, f"{len(sessions)} sessions queued for background deletion")
+    delete_in_background.short_description = "Delete selected sessions in background (fast)"
+
+
+@admin.register(SessionCombination)
+class SessionCombinationAdmin(admin.ModelAdmin):
+    """Read-only view of the materialized Band/LNA/Port index"""
+    list_display = ['session', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1', 'row_count', 'freq_min_mhz', 'freq_max_mhz']
+    list_filter = ['cfg_band']
+    search_fields = ['session__name', 'cfg_band']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    """Read-only view of resumable uploads"""
+    list_display = ['filename', 'session', 'status', 'total_size', 'total_chunks', 'ingest_heartbeat', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['filename', 'session__name', 'upload_id']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(MeasurementFile)
 class MeasurementFileAdmin(admin.ModelAdmin):
@@ -88,6 +159,31 @@ class MeasurementDataAdmin(admin.ModelAdmin):
     
     # Removed list_filter to avoid distinct() issue with large datasets
     # Users can use search instead
+
+    def save_model(self, request, obj, form, change):
+        """Keep the combination index of old and new sessions in sync"""
+        previous_session_id = None
+        if change and 'session' in form.changed_data:
+            previous_session_id = form.initial.get('session')
+        super().save_model(request, obj, form, change)
+        self._refresh_sessions({obj.session_id, previous_session_id})
+
+    def delete_model(self, request, obj):
+        session_id = obj.session_id
+        super().delete_model(request, obj)
+        self._refresh_sessions({session_id})
+
+    def delete_queryset(self, request, queryset):
+        session_ids = set(queryset.values_list('session_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        self._refresh_sessions(session_ids)
+
+    @staticmethod
+    def _refresh_sessions(session_ids):
+        """Rebuild combination index and invalidate derived artifacts"""
+        for session in MeasurementSession.objects.filter(id__in=[sid for sid in session_ids if sid]):
+            session.rebuild_combinations()
+            session.bump_data_version()
     
     fieldsets = (
         ('Session', {
@@ -115,27 +211,8 @@ class MeasurementDataAdmin(admin.ModelAdmin):
     actions = ['export_to_csv']
     
     def export_to_csv(self, request, queryset):
-        """Bulk action: export selected data to CSV"""
-        import csv
-        from django.http import HttpResponse
-        
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="measurement_data.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Session', 'Band', 'LNA State', 'Port1', 'Port2', 'RF Path', 'Frequency (MHz)', 'Gain (dB)'])
-        
-        for obj in queryset:
-            writer.writerow([
-                obj.session.name,
-                obj.cfg_band,
-                obj.cfg_lna_gain_state,
-                obj.cfg_active_port_1,
-                obj.cfg_active_port_2,
-                obj.active_rf_path,
-                obj.frequency_mhz,
-                obj.gain_db
-            ])
-        
-        return response
+        """Bulk action: export selected data to CSV (streamed)"""
+        from .exporters import stream_measurement_csv
+
+        return stream_measurement_csv(queryset, request=request)
     export_to_csv.short_description = "Export selected data to CSV"
@@ -0,0 +1,196 @@
+"""
+Rendered Artifact Cache
+Disk cache of rendered chart pages (PDF/PNG) and chart API bodies shared by all endpoints
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+
+class ArtifactCache:
+    """
+    Content-addressed, size-bounded disk cache for rendered charts
+
+    Artifacts are keyed by everything that determines their bytes:
+    session data version, Band/LNA/Port combination, format and image size.
+    Files live under <root>/<session_id>/<key>.<format> so a whole session
+    can be dropped at once. Reads refresh the file mtime, and writes evict
+    least-recently-used files once the total exceeds max_bytes.
+    """
+
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+    EVICT_TO_RATIO = 0.9  # Evict down to 90% of max_bytes to avoid evicting on every write
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            root: Cache directory
+            max_bytes: Total size limit in bytes
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Lazily measured on first write
+
+    @classmethod
+    def get_instance(cls):
+        """Process-wide cache configured from settings"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    root=getattr(settings, 'RF_ANALYZER_ARTIFACT_CACHE_DIR',
+                                 Path(settings.BASE_DIR) / 'cache' / 'artifacts'),
+                    max_bytes=getattr(settings, 'RF_ANALYZER_ARTIFACT_CACHE_MAX_BYTES', cls.DEFAULT_MAX_BYTES),
+                )
+            return cls._instance
+
+    @staticmethod
+    def make_key(session, band, lna, port, format, width, height, variant=None):
+        """
+        Build the content address for a rendered combination
+
+        Args:
+            session: MeasurementSession (id and data_version are used)
+            band, lna, port: Combination
+            format: 'pdf', 'png', or a chart body kind ('chart.json', 'buffers.json')
+            width, height: Image (or subplot) size in pixels
+            variant: Optional string for settings that also change the bytes
+                (e.g. the chart WebGL threshold)
+
+        Returns:
+            str: Cache key (hex digest)
+        """
+        identity = [session.id, session.data_version, band, lna, port, format, width, height]
+        if variant is not None:
+            identity.append(variant)
+        identity = json.dumps(identity, separators=(',', ':'))
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _path(self, session_id, key, format):
+        return self.root / str(session_id) / f'{key}.{format}'
+
+    def get(self, session_id, key, format):
+        """
+        Read a cached artifact
+
+        Returns:
+            bytes or None if not cached
+        """
+        path = self._path(session_id, key, format)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return data
+
+    def put(self, session_id, key, format, data):
+        """Store an artifact, evicting least-recently-used files if over budget"""
+        path = self._path(session_id, key, format)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Atomic publish: concurrent readers never see a partial file
+        tmp_path = path.with_name(f'.{path.name}.{uuid.uuid4().hex}.tmp')
+        tmp_path.write_bytes(data)
+        try:
+            replaced_bytes = path.stat().st_size  # Overwriting a key frees the old file
+        except FileNotFoundError:
+            replaced_bytes = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._measure()
+            else:
+                self._total_bytes += len(data) - replaced_bytes
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def get_or_render(self, session, band, lna, port, format, width, height, render, variant=None):
+        """
+        Return cached artifact bytes, rendering and storing them on a miss
+
+        Args:
+            session: MeasurementSession
+            band, lna, port: Combination
+            format: 'pdf' or 'png'
+            width, height: Image size in pixels
+            render: Callable returning the artifact bytes (only called on a miss)
+            variant: Optional settings identity (see make_key)
+
+        Returns:
+            (bytes, hit): Artifact bytes and whether they came from the cache
+        """
+        key = self.make_key(session, band, lna, port, format, width, height, variant)
+        data = self.get(session.id, key, format)
+        if data is not None:
+            return data, True
+
+        data = render()
+        self.put(session.id, key, format, data)
+        return data, False
+
+    def invalidate_session(self, session_id):
+        """Drop every artifact of a session"""
+        session_dir = self.root / str(session_id)
+        if session_dir.exists():
+            shutil.rmtree(session_dir, ignore_errors=True)
+            with self._lock:
+                self._total_bytes = None
+
+    def _iter_files(self):
+        if not self.root.exists():
+            return
+        for session_dir in self.root.iterdir():
+            if session_dir.is_dir():
+                for path in session_dir.iterdir():
+                    if path.is_file() and not path.name.startswith('.'):
+                        yield path
+
+    def _measure(self):
+        total = 0
+        for path in self._iter_files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        """Delete least-recently-used files until under EVICT_TO_RATIO of max_bytes"""
+        entries = []
+        for path in self._iter_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.EVICT_TO_RATIO
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+        self._total_bytes = total
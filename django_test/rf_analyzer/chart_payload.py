@@ -0,0 +1,62 @@
+"""
+Compact Chart Payload
+Encodes a compact grid spec as layout metadata plus packed float32 trace buffers
+"""
+import base64
+
+import numpy as np
+
+PAYLOAD_FORMAT = 'rf-grid/1'
+PAYLOAD_DTYPE = '<f4'  # Little-endian float32 (matches Float32Array on all browsers)
+
+
+def pack_float32(arrays):
+    """
+    Concatenate arrays into one little-endian float32 buffer
+
+    Args:
+        arrays: Sequence of 1-D numeric arrays/lists
+
+    Returns:
+        (base64 str, offsets): Encoded buffer and start offset of each array (in elements)
+    """
+    lengths = [len(a) for a in arrays]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(int).tolist() if lengths else []
+    if lengths:
+        packed = np.concatenate([np.asarray(a, dtype=PAYLOAD_DTYPE) for a in arrays])
+    else:
+        packed = np.empty(0, dtype=PAYLOAD_DTYPE)
+    return base64.b64encode(packed.tobytes()).decode('ascii'), offsets
+
+
+def encode_compact_grid(spec):
+    """
+    Build the data-only chart payload from ChartGenerator.create_compact_grid_spec()
+
+    Trace x/y values are packed into two shared buffers; each trace records
+    its offset and length so the client can take zero-copy subarrays.
+
+    Returns:
+        dict: {'format', 'dtype', 'layout', 'traces', 'x', 'y'}
+    """
+    traces = spec['traces']
+    x_buffer, offsets = pack_float32([t['x'] for t in traces])
+    y_buffer, _ = pack_float32([t['y'] for t in traces])
+
+    return {
+        'format': PAYLOAD_FORMAT,
+        'dtype': PAYLOAD_DTYPE,
+        'layout': spec['layout'],
+        'traces': [
+            {
+                'row': t['row'],
+                'col': t['col'],
+                'name': t['name'],
+                'offset': offset,
+                'length': len(t['x']),
+            }
+            for t, offset in zip(traces, offsets)
+        ],
+        'x': x_buffer,
+        'y': y_buffer,
+    }
@@ -0,0 +1,417 @@
+"""
+Chunked Upload
+Resumable CSV upload: numbered chunks are staged on disk and ingested in
+order by a background thread while later chunks are still arriving
+
+Each chunk file is deleted once its bytes are in assembled.csv, so staging
+holds the upload about once; abandoned uploads are removed by
+expire_chunked_uploads().
+"""
+import io
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, models
+from django.utils import timezone
+
+from .ingest import CSV_COLUMN_MAP, CSV_DTYPES, bulk_insert_dataframe, finalize_ingest
+from .models import ChunkedUpload, MeasurementData, MeasurementFile
+from .progress_tracker import ProgressTracker
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+MIN_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+INGEST_CSV_ROWS = 100000     # Rows per DataFrame handed to bulk insert
+POLL_INTERVAL = 0.5          # Seconds between checks for the next chunk
+HEARTBEAT_INTERVAL = 10      # Seconds between ingest_heartbeat writes
+HEARTBEAT_TIMEOUT = 60       # Older heartbeat = ingest thread is gone, next request restarts it
+DEFAULT_EXPIRY = 24 * 3600   # Seconds without chunk activity before an upload is abandoned
+
+_lock = threading.Lock()
+_running = set()                        # Upload ids with an ingest thread in this process
+_chunk_ready = threading.Condition()    # Wakes local ingest threads when a chunk lands
+
+
+class UploadStalled(Exception):
+    """No new chunk arrived within RF_ANALYZER_CHUNKED_UPLOAD_STALL_TIMEOUT"""
+
+
+class UploadAborted(Exception):
+    """Ingest cancelled through ProgressTracker.cancel()"""
+
+
+def clamp_chunk_size(requested):
+    """Server-side chunk size for an init request (None = default)"""
+    if not requested:
+        return getattr(settings, 'RF_ANALYZER_CHUNKED_UPLOAD_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+    return max(MIN_CHUNK_SIZE, min(int(requested), MAX_CHUNK_SIZE))
+
+
+def upload_dir(upload_id):
+    return Path(settings.RF_ANALYZER_CHUNKED_UPLOAD_DIR) / str(upload_id)
+
+
+def chunk_path(upload_id, index):
+    return upload_dir(upload_id) / f'{index:06d}.part'
+
+
+def assembled_path(upload_id):
+    return upload_dir(upload_id) / 'assembled.csv'
+
+
+def consumed_chunks(upload):
+    """Number of leading chunks already copied into assembled.csv (their files are gone)"""
+    try:
+        size = assembled_path(upload.upload_id).stat().st_size
+    except FileNotFoundError:
+        return 0
+    if size >= upload.total_size:
+        return upload.total_chunks
+    return size // upload.chunk_size
+
+
+def received_chunks(upload):
+    """Indices of the chunks stored for an upload (staged or already consumed)"""
+    directory = upload_dir(upload.upload_id)
+    if not directory.is_dir():
+        return []
+    # List before measuring assembled.csv: a chunk is deleted only after its bytes are flushed
+    stored = {int(path.stem) for path in directory.glob('*.part')}
+    return sorted(stored.union(range(consumed_chunks(upload))))
+
+
+def discard_upload_files(upload_id):
+    shutil.rmtree(upload_dir(upload_id), ignore_errors=True)
+
+
+def write_chunk(upload, index, stream, block_size=1024 * 1024):
+    """
+    Store one chunk from a request stream
+
+    The chunk is written to a temporary name and renamed into place, so a
+    dropped connection never leaves a partial chunk behind and re-sending a
+    chunk is harmless.
+
+    Args:
+        upload: ChunkedUpload
+        index: Chunk number (0-based)
+        stream: File-like object (the request body)
+
+    Returns:
+        int: Bytes written
+
+    Raises:
+        ValueError: Index out of range or chunk size mismatch
+    """
+    if not 0 <= index < upload.total_chunks:
+        raise ValueError(f'Chunk index {index} out of range (0-{upload.total_chunks - 1})')
+
+    expected = upload.expected_chunk_size(index)
+    directory = upload_dir(upload.upload_id)
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path = directory / f'{index:06d}.{uuid.uuid4().hex}.tmp'
+
+    written = 0
+    try:
+        with open(temp_path, 'wb') as fh:
+            while True:
+                block = stream.read(block_size)
+                if not block:
+                    break
+                written += len(block)
+                if written > expected:
+                    break
+                fh.write(block)
+        if written != expected:
+            raise ValueError(f'Chunk {index} has {written} bytes, expected {expected}')
+        os.replace(temp_path, chunk_path(upload.upload_id, index))
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    with _chunk_ready:
+        _chunk_ready.notify_all()
+    return written
+
+
+class ChunkStreamReader(io.RawIOBase):
+    """
+    Sequential read over an upload's chunks, blocking until the next one is stored
+
+    Every byte read is also appended to `assembled`, so the complete file is
+    rebuilt in the same pass that parses it, and each chunk file is deleted
+    once consumed. A restarted ingest passes start_index (consumed_chunks())
+    and first replays those chunks' bytes from `assembled` itself.
+    """
+
+    def __init__(self, upload, assembled, on_chunk=None, check_alive=None, stall_timeout=None,
+                 start_index=0):
+        self.upload = upload
+        self.assembled = assembled
+        self.on_chunk = on_chunk
+        self.check_alive = check_alive
+        self.stall_timeout = stall_timeout
+        self.index = start_index
+        self._fh = None
+        self._replay = open(assembled.name, 'rb') if start_index else None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._replay is not None:
+            n = self._replay.readinto(buffer)
+            if n:
+                return n
+            self._replay.close()
+            self._replay = None
+
+        while self.index < self.upload.total_chunks:
+            if self._fh is None:
+                self._fh = open(self._wait_for_chunk(self.index), 'rb')
+            n = self._fh.readinto(buffer)
+            if n:
+                self.assembled.write(memoryview(buffer)[:n])
+                return n
+            self._fh.close()
+            self._fh = None
+            # Its bytes must reach assembled.csv before the chunk goes (see received_chunks)
+            self.assembled.flush()
+            chunk_path(self.upload.upload_id, self.index).unlink(missing_ok=True)
+            self.index += 1
+            if self.on_chunk:
+                self.on_chunk(self.index)
+        return 0
+
+    def _wait_for_chunk(self, index):
+        path = chunk_path(self.upload.upload_id, index)
+        waiting_since = time.monotonic()
+        while not path.exists():
+            if self.check_alive:
+                self.check_alive()
+            if self.stall_timeout and time.monotonic() - waiting_since > self.stall_timeout:
+                raise UploadStalled(f'No chunk {index} after {self.stall_timeout}s')
+            with _chunk_ready:
+                _chunk_ready.wait(POLL_INTERVAL)
+        return path
+
+    def close(self):
+        for fh in (self._fh, self._replay):
+            if fh is not None:
+                fh.close()
+        self._fh = self._replay = None
+        super().close()
+
+
+class _AssembledFile(File):
+    """Lets FileSystemStorage move the assembled file into place instead of copying it"""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def ensure_ingest(upload):
+    """
+    Start the ingest thread for an upload unless one is already alive
+
+    Called on init and on every chunk/status request, so an ingest that died
+    with its process (or gave up on a stalled client) resumes from the
+    stored chunks. The heartbeat UPDATE is the claim: only one request, in
+    any worker process, wins it.
+
+    Returns:
+        bool: True if a new ingest thread was started
+    """
+    if upload.status != 'uploading' or upload.session_id is None:
+        return False
+
+    with _lock:
+        if upload.upload_id in _running:
+            return False
+
+        now = timezone.now()
+        claimed = ChunkedUpload.objects.filter(pk=upload.pk, status='uploading').filter(
+            models.Q(ingest_heartbeat__isnull=True) |
+            models.Q(ingest_heartbeat__lt=now - timedelta(seconds=HEARTBEAT_TIMEOUT))
+        ).update(ingest_heartbeat=now)
+        if not claimed:
+            return False
+        _running.add(upload.upload_id)
+
+    threading.Thread(
+        target=_run_ingest, args=(upload.upload_id,),
+        name=f'rf-analyzer-ingest-{upload.pk}', daemon=True
+    ).start()
+    return True
+
+
+def _run_ingest(upload_id):
+    close_old_connections()
+    try:
+        return ingest_chunked_upload(upload_id)
+    except Exception as e:
+        print(f"[Chunked Upload] Error ingesting {upload_id}: {str(e)}")
+    finally:
+        with _lock:
+            _running.discard(upload_id)
+        close_old_connections()
+
+
+def ingest_chunked_upload(upload_id):
+    """
+    Parse an upload's chunks in order and bulk insert the rows
+
+    Runs until the last chunk has been parsed, waiting for chunks that have
+    not arrived yet. Progress is reported through ProgressTracker(session_id),
+    one step per chunk. A restart re-parses from the first byte, replaying
+    the chunks already consumed from assembled.csv.
+
+    Args:
+        upload_id: ChunkedUpload.upload_id
+
+    Returns:
+        int: Rows inserted (0 if the client stalled and the ingest was released)
+    """
+    from .tasks import schedule_session_purge
+
+    upload = ChunkedUpload.objects.select_related('session').get(upload_id=upload_id)
+    session = upload.session
+    tracker = ProgressTracker(session.id)
+    stall_timeout = getattr(settings, 'RF_ANALYZER_CHUNKED_UPLOAD_STALL_TIMEOUT', None)
+
+    # Rows left by an earlier, interrupted ingest of this upload
+    MeasurementData.objects.filter(session=session).delete()
+    tracker.start(upload.total_chunks, f'Ingesting {upload.filename}')
+
+    rows = 0
+    last_heartbeat = time.monotonic()
+
+    def check_alive():
+        nonlocal last_heartbeat
+        if time.monotonic() - last_heartbeat >= HEARTBEAT_INTERVAL:
+            alive = ChunkedUpload.objects.filter(pk=upload.pk, status='uploading').update(
+                ingest_heartbeat=timezone.now()
+            )
+            if not alive:
+                raise UploadAborted('Upload is no longer in progress (expired)')
+            last_heartbeat = time.monotonic()
+        progress = tracker.get_progress()
+        if progress and progress.get('status') == 'cancelled':
+            raise UploadAborted('Upload cancelled')
+
+    def on_chunk(done):
+        tracker.update(done, f'{rows:,} rows')
+
+    assembled_file = assembled_path(upload.upload_id)
+    start_index = consumed_chunks(upload)
+    start_time = time.time()
+    try:
+        assembled_file.parent.mkdir(parents=True, exist_ok=True)
+        # Drop a partly copied chunk (its file is still staged)
+        assembled_file.touch()
+        os.truncate(assembled_file, min(start_index * upload.chunk_size, upload.total_size))
+        with open(assembled_file, 'ab') as assembled, \
+                ChunkStreamReader(upload, assembled, on_chunk, check_alive, stall_timeout, start_index) as raw:
+            frames = pd.read_csv(
+                io.BufferedReader(raw, buffer_size=1024 * 1024),
+                usecols=list(CSV_COLUMN_MAP.values()),
+                dtype=CSV_DTYPES,
+                chunksize=INGEST_CSV_ROWS,
+            )
+            for df in frames:
+                rows += bulk_insert_dataframe(session, df)
+                check_alive()
+    except UploadStalled as e:
+        # Client went away: free the thread but keep the staged data; the next request restarts ingest
+        MeasurementData.objects.filter(session=session).delete()
+        ChunkedUpload.objects.filter(pk=upload.pk).update(ingest_heartbeat=None)
+        print(f"[Chunked Upload] {upload.filename}: {str(e)}, ingest released")
+        return 0
+    except Exception as e:
+        # An expired upload is already failed and its session queued for purge
+        failed = ChunkedUpload.objects.filter(pk=upload.pk, status='uploading').update(status='failed', error=str(e))
+        tracker.complete(success=False, message=f'Upload failed: {str(e)}')
+        discard_upload_files(upload.upload_id)
+        if failed:
+            schedule_session_purge(session)
+        raise
+
+    with open(assembled_file, 'rb') as fh:
+        MeasurementFile.objects.create(
+            session=session,
+            file=_AssembledFile(fh, name=upload.filename),
+            filename=upload.filename,
+            file_type='csv',
+            file_size=upload.total_size,
+            is_parsed=True
+        )
+    finalize_ingest(session)
+
+    ChunkedUpload.objects.filter(pk=upload.pk).update(status='ingested', ingest_heartbeat=timezone.now())
+    discard_upload_files(upload.upload_id)
+    tracker.complete(success=True, message=f'{rows:,} rows ingested')
+
+    print(f"[Chunked Upload] {upload.filename}: {rows} rows in {time.time() - start_time:.1f}s")
+    return rows
+
+
+def expire_chunked_uploads(max_age=None):
+    """
+    Remove abandoned chunked uploads and old upload records
+
+    An 'uploading' upload whose staging directory has not changed for
+    max_age (no chunk stored or consumed) is marked failed, its chunks and
+    assembled.csv are removed and its session is purged; a live ingest
+    thread notices on its next heartbeat. Finished ('ingested'/'failed')
+    records older than max_age are deleted with any leftover files.
+
+    Args:
+        max_age: Seconds (default RF_ANALYZER_CHUNKED_UPLOAD_EXPIRY)
+
+    Returns:
+        tuple: (uploads expired, records deleted)
+    """
+    from .tasks import schedule_session_purge
+
+    if max_age is None:
+        max_age = getattr(settings, 'RF_ANALYZER_CHUNKED_UPLOAD_EXPIRY', DEFAULT_EXPIRY)
+    cutoff = timezone.now() - timedelta(seconds=max_age)
+
+    finished = ChunkedUpload.objects.exclude(status='uploading').filter(created_at__lt=cutoff)
+    for upload_id in finished.values_list('upload_id', flat=True):
+        discard_upload_files(upload_id)
+    deleted, _ = finished.delete()
+
+    expired = 0
+    for upload in ChunkedUpload.objects.filter(status='uploading', created_at__lt=cutoff).select_related('session'):
+        try:
+            last_activity = upload_dir(upload.upload_id).stat().st_mtime
+        except FileNotFoundError:
+            last_activity = upload.created_at.timestamp()
+        if last_activity >= cutoff.timestamp():
+            continue
+
+        claimed = ChunkedUpload.objects.filter(pk=upload.pk, status='uploading').update(
+            status='failed', error='Upload expired (no chunks received)'
+        )
+        if not claimed:
+            continue  # Finished or failed meanwhile
+        discard_upload_files(upload.upload_id)
+        if upload.session is not None:
+            ProgressTracker(upload.session_id).complete(success=False, message='Upload expired')
+            if not upload.session.is_deleting:
+                schedule_session_purge(upload.session)
+        expired += 1
+
+    if expired or deleted:
+        print(f"[Chunked Upload] Expired {expired} uploads, deleted {deleted} old upload records")
+    return expired, deleted
@@ -0,0 +1,155 @@
+"""
+Session Comparison
+Overlay of one Band/LNA/Port combination across sessions (e.g. DUT vs. golden unit)
+with per-cell deltas and min/max envelopes on a common frequency grid
+"""
+import hashlib
+import json
+
+import numpy as np
+from django.core.cache import cache
+
+from .models import MeasurementData
+
+COMPARE_MAX_SESSIONS = 10
+COMPARE_CACHE_TIMEOUT = 3600  # Keys include every session's data_version and updated_at, so entries never go stale
+
+
+def fetch_traces(session_id, band, lna, port):
+    """
+    Load every trace of one combination with a single query
+
+    Returns:
+        {(ca_combo, output_port): (frequency ndarray, gain ndarray)}, sorted by frequency
+    """
+    rows = MeasurementData.objects.filter(
+        session_id=session_id,
+        cfg_band=band,
+        cfg_lna_gain_state=lna,
+        cfg_active_port_1=port
+    ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz').values_list(
+        'debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz', 'gain_db'
+    )
+
+    rows = list(rows)
+    if not rows:
+        return {}
+
+    ca_combos, output_ports, frequency, gain = zip(*rows)
+    ca_combos = np.array(ca_combos, dtype=object)
+    output_ports = np.array(output_ports, dtype=object)
+    frequency = np.array(frequency, dtype=np.float64)
+    gain = np.array(gain, dtype=np.float64)
+
+    # Rows are ordered by cell, so each cell is one contiguous slice
+    changed = (ca_combos[1:] != ca_combos[:-1]) | (output_ports[1:] != output_ports[:-1])
+    bounds = np.concatenate(([0], np.flatnonzero(changed) + 1, [len(rows)]))
+
+    return {
+        (ca_combos[start], output_ports[start]): (frequency[start:end], gain[start:end])
+        for start, end in zip(bounds[:-1], bounds[1:])
+    }
+
+
+def compare_traces(traces_by_session, reference_id):
+    """
+    Interpolate each cell onto a common grid and compute deltas/envelopes
+
+    The common grid is the reference session's own frequency points inside
+    the range every session covers, so the golden trace is never resampled.
+    Cells missing from the reference session use the first session that has them.
+
+    Args:
+        traces_by_session: {session_id: fetch_traces() result}, in display order
+        reference_id: Session the deltas are taken against
+
+    Returns:
+        list of cell dicts
+    """
+    cells = []
+    keys = sorted({key for traces in traces_by_session.values() for key in traces})
+
+    for ca_combo, output_port in keys:
+        present = [sid for sid, traces in traces_by_session.items() if (ca_combo, output_port) in traces]
+        base_id = reference_id if reference_id in present else present[0]
+
+        low = max(traces_by_session[sid][(ca_combo, output_port)][0][0] for sid in present)
+        high = min(traces_by_session[sid][(ca_combo, output_port)][0][-1] for sid in present)
+        base_freq = traces_by_session[base_id][(ca_combo, output_port)][0]
+        grid = base_freq[(base_freq >= low) & (base_freq <= high)]
+        if grid.size == 0:
+            continue  # Sessions do not overlap in frequency
+
+        # Sessions x points
+        stacked = np.vstack([
+            np.interp(grid, *traces_by_session[sid][(ca_combo, output_port)])
+            for sid in present
+        ])
+        base = stacked[present.index(base_id)]
+        delta = stacked - base
+
+        cells.append({
+            'ca_combo': ca_combo,
+            'output_port': output_port,
+            'reference': base_id,
+            'frequency': grid.tolist(),
+            'traces': {str(sid): row.tolist() for sid, row in zip(present, stacked)},
+            'delta': {str(sid): row.tolist() for sid, row in zip(present, delta) if sid != base_id},
+            'max_abs_delta': {
+                str(sid): round(float(np.abs(row).max()), 4)
+                for sid, row in zip(present, delta) if sid != base_id
+            },
+            'envelope': {
+                'min': stacked.min(axis=0).tolist(),
+                'max': stacked.max(axis=0).tolist(),
+            },
+        })
+
+    return cells
+
+
+def comparison_cache_key(sessions, reference_id, band, lna, port):
+    """
+    Cache key over the combination, reference and every session's version
+
+    updated_at is included with data_version because the payload carries
+    session names, which a rename changes without touching the data.
+    """
+    versions = ','.join(f'{s.id}:{s.data_version}:{s.updated_at.isoformat()}' for s in sessions)
+    digest = hashlib.sha256(f'{versions}|{reference_id}|{band}|{lna}|{port}'.encode()).hexdigest()[:32]
+    return f'rf_compare_{digest}'
+
+
+def build_comparison(sessions, reference_id, band, lna, port):
+    """
+    Comparison payload as JSON bytes (cached per set of session versions and edit times)
+
+    Args:
+        sessions: MeasurementSession list in display order
+        reference_id: Reference (golden) session id
+
+    Returns:
+        (bytes, cache_hit)
+    """
+    key = comparison_cache_key(sessions, reference_id, band, lna, port)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    traces_by_session = {s.id: fetch_traces(s.id, band, lna, port) for s in sessions}
+    payload = {
+        'band': band,
+        'lna': lna,
+        'port': port,
+        'reference': reference_id,
+        'sessions': [
+            {'id': s.id, 'name': s.name, 'data_version': s.data_version,
+             'cells': len(traces_by_session[s.id])}
+            for s in sessions
+        ],
+        'cells': compare_traces(traces_by_session, reference_id),
+    }
+
+    body = json.dumps(payload).encode()
+    cache.set(key, body, COMPARE_CACHE_TIMEOUT)
+    return body, False
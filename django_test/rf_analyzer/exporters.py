@@ -0,0 +1,161 @@
+"""
+Data Exporters
+Streaming CSV export of measurement data with constant memory
+
+Django's ASGI handler consumes a sync iterator into a list before sending
+anything, so responses built here take the request and switch to async
+iterators when it is served under ASGI (WSGI streams sync iterators as is).
+"""
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.http import FileResponse, StreamingHttpResponse
+
+# Rows fetched per database round trip (server-side cursor where supported)
+CSV_CHUNK_SIZE = 5000
+
+CSV_HEADER = ['Session', 'Band', 'LNA State', 'Port1', 'Port2', 'RF Path', 'Frequency (MHz)', 'Gain (dB)']
+CSV_FIELDS = (
+    'session__name',
+    'cfg_band',
+    'cfg_lna_gain_state',
+    'cfg_active_port_1',
+    'cfg_active_port_2',
+    'active_rf_path',
+    'frequency_mhz',
+    'gain_db',
+)
+
+
+# Bytes per read when streaming export files under ASGI (one thread hop per block)
+FILE_BLOCK_SIZE = 256 * 1024
+
+
+def is_asgi(request):
+    """True if the request is served by Django's ASGI handler"""
+    from django.core.handlers.asgi import ASGIRequest
+
+    return isinstance(request, ASGIRequest)
+
+
+class Echo:
+    """Pseudo-buffer: csv.writer returns each formatted line instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_measurement_csv(queryset, chunk_size=CSV_CHUNK_SIZE):
+    """
+    Yield CSV lines for a MeasurementData queryset
+
+    Rows come from one values_list() query with the session name joined
+    in, in insertion order, read and emitted chunk_size rows at a time.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+
+    rows = queryset.order_by('id').values_list(*CSV_FIELDS).iterator(chunk_size=chunk_size)
+
+    # Join lines per chunk so the server writes a few large blocks, not one per row
+    lines = []
+    for row in rows:
+        lines.append(writer.writerow(row))
+        if len(lines) >= chunk_size:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+async def aiter_measurement_csv(queryset, chunk_size=CSV_CHUNK_SIZE):
+    """
+    Async variant of iter_measurement_csv() for ASGI responses
+
+    Each chunk is fetched and formatted in one sync_to_async call on the
+    request's thread, which keeps the server-side cursor there. (Not
+    QuerySet.aiterator(): values_list() starts its query on the event loop.)
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+
+    rows = queryset.order_by('id').values_list(*CSV_FIELDS).iterator(chunk_size=chunk_size)
+
+    def next_chunk():
+        return ''.join(writer.writerow(row) for row in islice(rows, chunk_size))
+
+    while chunk := await sync_to_async(next_chunk)():
+        yield chunk
+
+
+def stream_measurement_csv(queryset, filename='measurement_data.csv', chunk_size=CSV_CHUNK_SIZE,
+                           request=None):
+    """
+    StreamingHttpResponse for a MeasurementData queryset
+
+    Args:
+        queryset: MeasurementData queryset (any filter)
+        filename: Download filename
+        chunk_size: Rows per database fetch
+        request: Current request; under ASGI rows are fetched with an
+            async iterator, otherwise the response would be buffered whole
+
+    Returns:
+        StreamingHttpResponse (text/csv attachment)
+    """
+    rows = aiter_measurement_csv if is_asgi(request) else iter_measurement_csv
+    return StreamingHttpResponse(
+        rows(queryset, chunk_size),
+        content_type='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
+
+
+class ExportFileResponse(FileResponse):
+    """
+    FileResponse that also streams under ASGI
+
+    With asynchronous=True the file is read FILE_BLOCK_SIZE bytes at a time
+    in a worker thread through an async iterator, instead of the sync block
+    iterator the ASGI handler would read into memory in full first.
+    Headers (Content-Length, Content-Disposition) are set as usual.
+    """
+
+    def __init__(self, *args, asynchronous=False, **kwargs):
+        self.asynchronous = asynchronous
+        super().__init__(*args, **kwargs)
+
+    def _set_streaming_content(self, value):
+        super()._set_streaming_content(value)
+        if self.asynchronous and self.file_to_stream is not None:
+            self._iterator = self._read_blocks(self.file_to_stream)
+            self.is_async = True
+
+    @staticmethod
+    async def _read_blocks(filelike):
+        read = sync_to_async(filelike.read, thread_sensitive=False)
+        while block := await read(FILE_BLOCK_SIZE):
+            yield block
+
+
+def export_file_response(request, filelike, filename, content_type):
+    """
+    Download response for a finished export file (closed when sent)
+
+    Args:
+        request: Current request (ASGI gets an async file iterator)
+        filelike: Open binary file positioned at the start
+        filename: Download filename
+        content_type: MIME type
+
+    Returns:
+        ExportFileResponse (attachment)
+    """
+    return ExportFileResponse(
+        filelike,
+        asynchronous=is_asgi(request),
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+    )
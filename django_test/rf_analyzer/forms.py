@@ -54,3 +54,108 @@ class CsvUploadForm(forms.Form):
                 raise forms.ValidationError('File size must be less than 200MB.')
 
         return file
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    """FileField that accepts several files (returns a list)"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('widget', MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        single_file_clean = super().clean
+        if isinstance(data, (list, tuple)):
+            return [single_file_clean(d, initial) for d in data]
+        return [single_file_clean(data, initial)]
+
+
+class SnpUploadForm(forms.Form):
+    """
+    SnP (Touchstone) file upload form - individual files or zipped folders
+    """
+    session_name = forms.CharField(
+        max_length=200,
+        required=True,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'e.g., 2025-01 Measurement'
+        }),
+        label='Session Name'
+    )
+
+    description = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={
+            'class': 'form-control',
+            'rows': 3,
+            'placeholder': 'Optional description...'
+        }),
+        label='Description'
+    )
+
+    snp_files = MultipleFileField(
+        required=True,
+        widget=MultipleFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.s1p,.s2p,.s3p,.s4p,.s5p,.s6p,.s7p,.s8p,.s9p,.s10p,.s11p,.s12p,.zip'
+        }),
+        label='SnP Files',
+        help_text='Select SnP files or a zipped measurement folder (e.g., X_ANT1_B1@1_(G0H).s2p)'
+    )
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('auto_id', 'snp_%s')  # Shares the page with CsvUploadForm
+        super().__init__(*args, **kwargs)
+
+    def clean_snp_files(self):
+        """Validate SnP files"""
+        from .snp_ingest import is_snp_filename
+
+        files = self.cleaned_data.get('snp_files') or []
+
+        for file in files:
+            if not (is_snp_filename(file.name) or file.name.lower().endswith('.zip')):
+                raise forms.ValidationError(f'Only SnP or ZIP files are allowed: {file.name}')
+
+        # Check total size (max 500MB)
+        if sum(file.size for file in files) > 500 * 1024 * 1024:
+            raise forms.ValidationError('Total upload size must be less than 500MB.')
+
+        return files
+
+
+class ChunkedUploadInitForm(forms.Form):
+    """
+    Start a resumable (chunked) CSV upload
+    """
+    session_name = forms.CharField(max_length=200, required=True)
+    description = forms.CharField(required=False)
+    filename = forms.CharField(max_length=255, required=True)
+    total_size = forms.IntegerField(min_value=1, required=True)
+    chunk_size = forms.IntegerField(min_value=1, required=False)
+
+    def clean_filename(self):
+        """Validate CSV filename"""
+        filename = self.cleaned_data.get('filename')
+
+        if not filename.endswith('.csv'):
+            raise forms.ValidationError('Only CSV files are allowed.')
+
+        return filename
+
+    def clean_total_size(self):
+        """Validate file size"""
+        from django.conf import settings
+
+        total_size = self.cleaned_data.get('total_size')
+        max_bytes = settings.RF_ANALYZER_CHUNKED_UPLOAD_MAX_BYTES
+
+        if total_size > max_bytes:
+            raise forms.ValidationError(f'File size must be less than {max_bytes // 1024 ** 3}GB.')
+
+        return total_size
@@ -0,0 +1,129 @@
+"""
+HTTP Caching Helpers
+Conditional GET validators keyed by session data version, and response compression
+"""
+import hashlib
+from functools import wraps
+
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .models import MeasurementSession
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+# Smallest body worth compressing (same threshold as GZipMiddleware)
+MIN_COMPRESS_LENGTH = 200
+BROTLI_QUALITY = 5  # Good ratio at interactive speed (11 is far slower)
+
+_gzip = GZipMiddleware(lambda request: None)  # Used only for process_response()
+
+
+def _session_validators(session_id):
+    """(data_version, updated_at) of a session, or None if it does not exist"""
+    return MeasurementSession.active.filter(id=session_id).values_list(
+        'data_version', 'updated_at'
+    ).first()
+
+
+def session_etag(kind, variant=None):
+    """
+    ETag function for django.views.decorators.http.condition
+
+    The tag covers the endpoint kind, session data version, session
+    last-modified time, every query parameter and the variant, so it
+    changes whenever the response body could.
+
+    Args:
+        kind: Endpoint identifier (e.g. 'chart', 'chart-buffers')
+        variant: Optional callable returning a string for settings that
+            change the body (evaluated per request)
+    """
+    def etag(request, session_id, *args, **kwargs):
+        validators = _session_validators(session_id)
+        if validators is None:
+            return None  # Let the view return its 404
+        data_version, updated_at = validators
+        params = '&'.join(f'{k}={v}' for k, v in sorted(request.GET.items()))
+        identity = f'{kind}|{session_id}|{data_version}|{updated_at.isoformat()}|{params}'
+        if variant is not None:
+            identity += f'|{variant()}'
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:32]
+    return etag
+
+
+def session_last_modified(request, session_id, *args, **kwargs):
+    """Last-Modified function for condition(): session updated_at"""
+    validators = _session_validators(session_id)
+    return validators[1] if validators else None
+
+
+def session_conditional(kind, variant=None):
+    """
+    Conditional GET keyed by session version: 304 when unchanged
+
+    Responses are marked private/no-cache so browsers always revalidate
+    (and get a 304) instead of reusing a possibly stale copy.
+
+    Args:
+        kind: Endpoint identifier
+        variant: Optional callable, see session_etag()
+    """
+    conditional = condition(etag_func=session_etag(kind, variant), last_modified_func=session_last_modified)
+
+    def decorator(view):
+        conditional_view = conditional(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
+
+
+def _accepts_encoding(request, encoding):
+    accept = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    return any(token.split(';')[0].strip() == encoding for token in accept.split(','))
+
+
+def _brotli_response(response):
+    compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+    if len(compressed) >= len(response.content):
+        return response
+
+    response.content = compressed
+    response.headers['Content-Length'] = str(len(compressed))
+    response.headers['Content-Encoding'] = 'br'
+
+    # Compressed body is a different representation: strong ETag becomes weak
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response.headers['ETag'] = 'W/' + etag
+    return response
+
+
+def compress_response(view):
+    """
+    Compress non-streaming responses: brotli if installed and accepted, else gzip
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+
+        if (response.streaming or response.has_header('Content-Encoding')
+                or len(response.content) < MIN_COMPRESS_LENGTH):
+            return response
+
+        if brotli is not None and _accepts_encoding(request, 'br'):
+            patch_vary_headers(response, ('Accept-Encoding',))
+            return _brotli_response(response)
+
+        return _gzip.process_response(request, response)
+    return wrapper
@@ -0,0 +1,111 @@
+"""
+Measurement Ingest
+Bulk insertion of parsed measurement columns into MeasurementData
+"""
+import numpy as np
+import pandas as pd
+
+from .models import MeasurementData
+
+INGEST_BATCH_SIZE = 5000
+
+# MeasurementData field -> column in the consolidated CSV format
+CSV_COLUMN_MAP = {
+    'cfg_band': 'Cfg Band',
+    'cfg_lna_gain_state': 'cfg-lna_gain_state',
+    'cfg_active_port_1': 'cfg-active_port_1',
+    'cfg_active_port_2': 'cfg-active_port_2',
+    'debug_nplexer_bank': 'debug-nplexer_bank',
+    'active_rf_path': 'Active RF Path',
+    'frequency_mhz': 'Frequency',
+    'gain_db': 'Gain (dB)',
+}
+
+# read_csv dtypes used by every CSV ingest route: labels as categoricals,
+# numbers as float64 (stored in FloatField, so float32 would only lose precision)
+CSV_DTYPES = {
+    column: 'float64' if field in ('frequency_mhz', 'gain_db') else 'category'
+    for field, column in CSV_COLUMN_MAP.items()
+}
+
+
+def _as_list(value, length):
+    """Column values as a Python list (scalars are repeated)"""
+    if isinstance(value, (str, int, float)) or value is None:
+        return [value] * length
+    if hasattr(value, 'tolist'):
+        return value.tolist()  # numpy/pandas: native Python values in one C pass
+    return list(value)
+
+
+def bulk_insert_measurements(session, columns, batch_size=INGEST_BATCH_SIZE):
+    """
+    Insert measurement rows from column arrays
+
+    Args:
+        session: MeasurementSession
+        columns: {MeasurementData field: array-like or scalar}; scalars apply to every row
+        batch_size: Rows per bulk_create
+
+    Returns:
+        int: Rows inserted
+    """
+    lengths = {len(v) for v in columns.values() if not isinstance(v, (str, int, float)) and v is not None}
+    if len(lengths) > 1:
+        raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 0
+    if length == 0:
+        return 0
+
+    fields = list(columns)
+    values = [_as_list(columns[field], length) for field in fields]
+
+    inserted = 0
+    for start in range(0, length, batch_size):
+        end = min(start + batch_size, length)
+        MeasurementData.objects.bulk_create([
+            MeasurementData(session=session, **dict(zip(fields, row)))
+            for row in zip(*(column[start:end] for column in values))
+        ])
+        inserted += end - start
+
+    return inserted
+
+
+def _column_values(series):
+    """DataFrame column as an array of the values to store"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.to_numpy()  # Category labels (NaN for missing), not codes
+    if series.dtype == np.float32:
+        # Via the shortest decimal repr: 16.466 stays 16.466, not 16.466000747680664
+        return series.astype(str).astype(np.float64).to_numpy()
+    return series.to_numpy()
+
+
+def bulk_insert_dataframe(session, df, column_map=CSV_COLUMN_MAP, batch_size=INGEST_BATCH_SIZE):
+    """
+    Insert rows from a DataFrame in the consolidated CSV format
+
+    Accepts object, string, categorical and float32/float64 columns (e.g.
+    CsvParser.load_consolidated() output or read_csv with CSV_DTYPES).
+
+    Returns:
+        int: Rows inserted
+    """
+    columns = {field: _column_values(df[column]) for field, column in column_map.items()}
+    return bulk_insert_measurements(session, columns, batch_size)
+
+
+def finalize_ingest(session):
+    """
+    Rebuild the combination index and invalidate derived caches after new data
+
+    Schedules the chart warmup job when RF_ANALYZER_WARMUP['enabled'] is set.
+    """
+    from .tasks import schedule_session_warmup, warmup_config
+
+    session.rebuild_combinations()
+    session.bump_data_version()
+
+    if warmup_config()['enabled']:
+        schedule_session_warmup(session)
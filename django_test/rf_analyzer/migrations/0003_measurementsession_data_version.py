@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rf_analyzer', '0002_measurementfile_file_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='measurementsession',
+            name='data_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_combinations(apps, schema_editor):
+    """Build the combination index for sessions uploaded before it existed"""
+    MeasurementData = apps.get_model('rf_analyzer', 'MeasurementData')
+    SessionCombination = apps.get_model('rf_analyzer', 'SessionCombination')
+
+    rows = MeasurementData.objects.values(
+        'session_id', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'
+    ).annotate(
+        row_count=models.Count('id'),
+        freq_min_mhz=models.Min('frequency_mhz'),
+        freq_max_mhz=models.Max('frequency_mhz'),
+    ).order_by()
+
+    SessionCombination.objects.bulk_create(
+        (SessionCombination(**row) for row in rows),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rf_analyzer', '0003_measurementsession_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionCombination',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cfg_band', models.CharField(max_length=20)),
+                ('cfg_lna_gain_state', models.CharField(max_length=10)),
+                ('cfg_active_port_1', models.CharField(max_length=10)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('freq_min_mhz', models.FloatField(blank=True, null=True)),
+                ('freq_max_mhz', models.FloatField(blank=True, null=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='combinations', to='rf_analyzer.measurementsession')),
+            ],
+            options={
+                'ordering': ['cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'],
+                'constraints': [models.UniqueConstraint(fields=('session', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'), name='unique_session_combination')],
+            },
+        ),
+        migrations.RunPython(backfill_combinations, migrations.RunPython.noop),
+    ]
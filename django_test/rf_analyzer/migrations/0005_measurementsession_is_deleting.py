@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rf_analyzer', '0004_sessioncombination'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='measurementsession',
+            name='is_deleting',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:54
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rf_analyzer', '0005_measurementsession_is_deleting'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='measurementfile',
+            name='file_size',
+            field=models.BigIntegerField(),
+        ),
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('upload_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('filename', models.CharField(max_length=255)),
+                ('total_size', models.BigIntegerField()),
+                ('chunk_size', models.PositiveIntegerField()),
+                ('total_chunks', models.PositiveIntegerField()),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('ingested', 'Ingested'), ('failed', 'Failed')], default='uploading', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('ingest_heartbeat', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('session', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='chunked_uploads', to='rf_analyzer.measurementsession')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
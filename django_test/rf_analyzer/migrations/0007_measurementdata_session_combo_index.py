@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rf_analyzer', '0006_chunkedupload'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='measurementdata',
+            index=models.Index(fields=['session', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1', 'debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz'], name='rf_analyzer_session_c73a93_idx'),
+        ),
+    ]
@@ -2,11 +2,24 @@
 RF Analyzer Django Models
 """
 
-from django.db import models
+import uuid
+
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 
 
+class ActiveSessionManager(models.Manager):
+    """Sessions that are not queued for background deletion"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleting=False)
+
+    def listed(self):
+        """Sessions to list for browsing: excludes those still receiving a chunked upload"""
+        return self.exclude(chunked_uploads__status='uploading')
+
+
 class MeasurementSession(models.Model):
     """
     Measurement session (one analysis task)
@@ -17,6 +30,11 @@ class MeasurementSession(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     grid_config = models.JSONField(default=dict, blank=True)
+    data_version = models.PositiveIntegerField(default=1)  # Bumped whenever measurement data changes
+    is_deleting = models.BooleanField(default=False, db_index=True)  # Hidden while background purge runs
+
+    objects = models.Manager()
+    active = ActiveSessionManager()
 
     class Meta:
         ordering = ['-created_at']
@@ -25,6 +43,73 @@ class MeasurementSession(models.Model):
         username = self.user.username if self.user else 'Anonymous'
         return f"{self.name} - {username}"
 
+    def bump_data_version(self):
+        """
+        Invalidate everything derived from this session's data
+        (rendered artifacts and cached chart payloads are keyed by data_version)
+        """
+        MeasurementSession.objects.filter(pk=self.pk).update(
+            data_version=models.F('data_version') + 1,
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db(fields=['data_version', 'updated_at'])
+
+    def rebuild_combinations(self):
+        """
+        Rebuild the Band/LNA/Port index from this session's measurement data
+        (one GROUP BY over MeasurementData; call after any data change)
+
+        Returns:
+            int: Number of combinations
+        """
+        rows = self.data_points.values(
+            'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'
+        ).annotate(
+            row_count=models.Count('id'),
+            freq_min_mhz=models.Min('frequency_mhz'),
+            freq_max_mhz=models.Max('frequency_mhz'),
+        ).order_by()
+
+        combinations = [SessionCombination(session=self, **row) for row in rows]
+        with transaction.atomic():
+            self.combinations.all().delete()
+            SessionCombination.objects.bulk_create(combinations)
+        return len(combinations)
+
+    def get_combinations(self):
+        """
+        Band/LNA/Port combinations that have data, ordered for display and export
+        (index is backfilled on first use for data loaded outside the upload views)
+        """
+        combinations = self.combinations.all()
+        if not combinations.exists() and self.data_points.exists():
+            self.rebuild_combinations()
+        return combinations
+
+    def total_data_points(self):
+        """Number of measurement rows, summed from the combination index"""
+        total = self.get_combinations().aggregate(total=models.Sum('row_count'))['total']
+        return total or 0
+
+    def get_facets(self):
+        """
+        Distinct values for the viewer dropdowns, read from the combination index
+
+        Returns:
+            dict: {'bands': [...], 'lna_states': [...], 'input_ports': [...]}
+        """
+        rows = self.get_combinations().values_list('cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1')
+        bands, lna_states, input_ports = set(), set(), set()
+        for band, lna, port in rows:
+            bands.add(band)
+            lna_states.add(lna)
+            input_ports.add(port)
+        return {
+            'bands': sorted(bands),
+            'lna_states': sorted(lna_states),
+            'input_ports': sorted(input_ports),
+        }
+
 
 class MeasurementFile(models.Model):
     """
@@ -39,7 +124,7 @@ class MeasurementFile(models.Model):
     file = models.FileField(upload_to='measurements/%Y/%m/%d/')
     filename = models.CharField(max_length=255)
     file_type = models.CharField(max_length=10, choices=FILE_TYPE_CHOICES, default='csv')
-    file_size = models.IntegerField()
+    file_size = models.BigIntegerField()
     main_band = models.CharField(max_length=50, blank=True, db_index=True)
     ca_label = models.CharField(max_length=100, blank=True, db_index=True)
     port_label = models.CharField(max_length=100, blank=True, db_index=True)
@@ -84,9 +169,79 @@ class MeasurementData(models.Model):
         ordering = ['cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1', 'frequency_mhz']
         indexes = [
             models.Index(fields=['cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1']),
+            # Per-session combination reads (chart API, comparison): one ordered index range scan
+            models.Index(fields=['session', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1',
+                                 'debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz']),
             models.Index(fields=['cfg_band', 'debug_nplexer_bank']),
             models.Index(fields=['active_rf_path', 'frequency_mhz']),
         ]
 
     def __str__(self):
         return f"{self.cfg_band} {self.cfg_lna_gain_state} {self.cfg_active_port_1} @ {self.frequency_mhz}MHz"
+
+
+class SessionCombination(models.Model):
+    """
+    Materialized Band/LNA/Port index of a session's measurement data
+    Lets the viewer and full-report exports list facets without scanning MeasurementData
+    """
+    session = models.ForeignKey(MeasurementSession, on_delete=models.CASCADE, related_name='combinations')
+
+    cfg_band = models.CharField(max_length=20)
+    cfg_lna_gain_state = models.CharField(max_length=10)
+    cfg_active_port_1 = models.CharField(max_length=10)
+
+    row_count = models.PositiveIntegerField(default=0)
+    freq_min_mhz = models.FloatField(null=True, blank=True)
+    freq_max_mhz = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['session', 'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'],
+                name='unique_session_combination'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.cfg_band} {self.cfg_lna_gain_state} {self.cfg_active_port_1} ({self.row_count} rows)"
+
+
+class ChunkedUpload(models.Model):
+    """
+    Resumable CSV upload received as numbered chunks
+    Chunks are staged on disk (see chunked_upload.py) and ingested while later ones arrive
+    """
+    STATUS_CHOICES = [
+        ('uploading', 'Uploading'),
+        ('ingested', 'Ingested'),
+        ('failed', 'Failed'),
+    ]
+
+    upload_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    # SET_NULL: a failed upload keeps its error for the client after its session is purged
+    session = models.ForeignKey(MeasurementSession, on_delete=models.SET_NULL, null=True, related_name='chunked_uploads')
+
+    filename = models.CharField(max_length=255)
+    total_size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    total_chunks = models.PositiveIntegerField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='uploading')
+    error = models.TextField(blank=True)
+    ingest_heartbeat = models.DateTimeField(null=True, blank=True)  # Last sign of life from the ingest thread
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.filename} ({self.status})"
+
+    def expected_chunk_size(self, index):
+        """Byte size of chunk `index` (the last chunk holds the remainder)"""
+        if index == self.total_chunks - 1:
+            return self.total_size - index * self.chunk_size
+        return self.chunk_size
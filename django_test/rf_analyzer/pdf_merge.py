@@ -0,0 +1,210 @@
+"""
+Streaming PDF merger
+Concatenates single-page chart PDFs into one document, writing each page's
+objects to the output as soon as it is appended
+"""
+from io import BytesIO
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+    TextStringObject,
+)
+
+
+class StreamingPdfMerger:
+    """
+    Append-only PDF writer with bounded memory
+
+    Unlike PyPDF2's PdfMerger, which keeps every input stream and cloned page
+    in memory until write(), each appended PDF is parsed, renumbered and
+    written to `output` immediately; only object offsets and page references
+    are kept. Memory therefore stays flat regardless of page count.
+
+    Object 1 is the catalog and object 2 the page tree; both, plus the xref
+    table, are written by finish().
+
+    Example:
+        >>> merger = StreamingPdfMerger(spooled_file)
+        >>> for pdf_bytes in pages:
+        ...     merger.append(pdf_bytes)
+        >>> merger.finish(title='Full Report')
+    """
+
+    CATALOG_ID = 1
+    PAGES_ID = 2
+
+    # Page attributes that may be inherited from the source page tree
+    INHERITABLE_KEYS = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+    # Page keys that point back into the source document structure
+    EXCLUDED_PAGE_KEYS = ('/Parent', '/StructParents')
+
+    def __init__(self, output):
+        """
+        Args:
+            output: Writable, seekable binary file object (e.g. SpooledTemporaryFile)
+        """
+        self.output = output
+        self._offsets = {}  # new object id -> byte offset
+        self._page_ids = []
+        self._next_id = self.PAGES_ID + 1
+        self._finished = False
+
+        self.output.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_ids)
+
+    def append(self, pdf_bytes: bytes) -> int:
+        """
+        Append all pages of a PDF document
+
+        Args:
+            pdf_bytes: Complete PDF document (e.g. from kaleido)
+
+        Returns:
+            Number of pages appended
+        """
+        if self._finished:
+            raise RuntimeError("Merger already finished")
+
+        reader = PdfReader(BytesIO(pdf_bytes))
+        added = 0
+
+        for page in reader.pages:
+            id_map = {}
+            pending = []
+
+            def remap(obj):
+                if isinstance(obj, IndirectObject):
+                    key = (obj.idnum, obj.generation)
+                    if key not in id_map:
+                        id_map[key] = self._allocate_id()
+                        pending.append(obj)
+                    return IndirectObject(id_map[key], 0, None)
+                if isinstance(obj, StreamObject):
+                    copy = obj.__class__()
+                    copy._data = obj._data
+                    for key, value in obj.items():
+                        if key != '/Length':
+                            copy[key] = remap(value)
+                    return copy
+                if isinstance(obj, DictionaryObject):
+                    copy = DictionaryObject()
+                    for key, value in obj.items():
+                        copy[key] = remap(value)
+                    return copy
+                if isinstance(obj, ArrayObject):
+                    return ArrayObject(remap(value) for value in obj)
+                return obj
+
+            page_id = self._allocate_id()
+            if page.indirect_reference is not None:
+                id_map[(page.indirect_reference.idnum, page.indirect_reference.generation)] = page_id
+
+            page_dict = DictionaryObject()
+            for key, value in page.items():
+                if key not in self.EXCLUDED_PAGE_KEYS:
+                    page_dict[key] = remap(value)
+            for key in self.INHERITABLE_KEYS:
+                if key not in page_dict:
+                    inherited = self._find_inherited(page, key)
+                    if inherited is not None:
+                        page_dict[NameObject(key)] = remap(inherited)
+            page_dict[NameObject('/Parent')] = IndirectObject(self.PAGES_ID, 0, None)
+
+            self._write_object(page_id, page_dict)
+
+            while pending:
+                source_ref = pending.pop()
+                new_id = id_map[(source_ref.idnum, source_ref.generation)]
+                self._write_object(new_id, remap(source_ref.get_object()))
+
+            self._page_ids.append(page_id)
+            added += 1
+
+        return added
+
+    def finish(self, title: str = None) -> None:
+        """
+        Write page tree, catalog, document info and xref table
+
+        Args:
+            title: Optional document title
+        """
+        if self._finished:
+            return
+
+        pages = DictionaryObject({
+            NameObject('/Type'): NameObject('/Pages'),
+            NameObject('/Kids'): ArrayObject(IndirectObject(pid, 0, None) for pid in self._page_ids),
+            NameObject('/Count'): NumberObject(len(self._page_ids)),
+        })
+        self._write_object(self.PAGES_ID, pages)
+
+        catalog = DictionaryObject({
+            NameObject('/Type'): NameObject('/Catalog'),
+            NameObject('/Pages'): IndirectObject(self.PAGES_ID, 0, None),
+        })
+        self._write_object(self.CATALOG_ID, catalog)
+
+        info_id = None
+        if title:
+            info_id = self._allocate_id()
+            self._write_object(info_id, DictionaryObject({
+                NameObject('/Title'): TextStringObject(title),
+                NameObject('/Producer'): TextStringObject('RF Analyzer'),
+            }))
+
+        # Cross-reference table (ids are allocated contiguously from 1)
+        xref_offset = self.output.tell()
+        size = self._next_id
+        self.output.write(f'xref\n0 {size}\n'.encode())
+        self.output.write(b'0000000000 65535 f \n')
+        for obj_id in range(1, size):
+            offset = self._offsets.get(obj_id)
+            if offset is None:
+                self.output.write(b'0000000000 65535 f \n')
+            else:
+                self.output.write(f'{offset:010d} 00000 n \n'.encode())
+
+        trailer = DictionaryObject({
+            NameObject('/Size'): NumberObject(size),
+            NameObject('/Root'): IndirectObject(self.CATALOG_ID, 0, None),
+        })
+        if info_id:
+            trailer[NameObject('/Info')] = IndirectObject(info_id, 0, None)
+
+        self.output.write(b'trailer\n')
+        trailer.write_to_stream(self.output, None)
+        self.output.write(f'\nstartxref\n{xref_offset}\n%%EOF\n'.encode())
+
+        self._finished = True
+
+    def _allocate_id(self) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def _write_object(self, obj_id: int, obj) -> None:
+        self._offsets[obj_id] = self.output.tell()
+        self.output.write(f'{obj_id} 0 obj\n'.encode())
+        obj.write_to_stream(self.output, None)
+        self.output.write(b'\nendobj\n')
+
+    @staticmethod
+    def _find_inherited(page, key):
+        """Look up an inheritable attribute on the page's ancestors"""
+        node = page.get('/Parent')
+        while node is not None:
+            node = node.get_object()
+            if key in node:
+                return node[key]
+            node = node.get('/Parent')
+        return None
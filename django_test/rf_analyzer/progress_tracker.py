@@ -3,9 +3,73 @@ Progress Tracker for Long-Running Tasks
 Uses Django cache to store and retrieve progress information
 """
 from django.core.cache import cache
+import threading
 import time
 
 
+class ProgressNotifier:
+    """
+    In-process change notifications for ProgressTracker
+
+    Async SSE streams subscribe to a task's cache key and sleep on an
+    asyncio.Event; every tracker write wakes them via their event loop.
+    Writers may run in any thread (sync export views run in a thread pool
+    under ASGI), so wake-ups are scheduled with call_soon_threadsafe.
+
+    Only watchers in the same process are notified; streams also re-read
+    the cache on every heartbeat, which covers writers in other processes.
+    """
+
+    _lock = threading.Lock()
+    _waiters = {}  # cache_key -> {asyncio.Event: event loop}
+
+    @classmethod
+    def subscribe(cls, cache_key):
+        """
+        Register the calling coroutine for change notifications
+
+        Returns:
+            asyncio.Event set whenever the task's progress changes
+        """
+        import asyncio
+
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            cls._waiters.setdefault(cache_key, {})[event] = loop
+        return event
+
+    @classmethod
+    def unsubscribe(cls, cache_key, event):
+        """Remove a subscription created by subscribe()"""
+        with cls._lock:
+            waiters = cls._waiters.get(cache_key)
+            if waiters is not None:
+                waiters.pop(event, None)
+                if not waiters:
+                    del cls._waiters[cache_key]
+
+    @classmethod
+    def notify(cls, cache_key):
+        """Wake every watcher of a task (safe to call from any thread)"""
+        with cls._lock:
+            waiters = list(cls._waiters.get(cache_key, {}).items())
+
+        for event, loop in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Watcher's event loop already closed
+
+    @classmethod
+    def watcher_count(cls, cache_key=None):
+        """Number of active subscriptions (for one task or all tasks)"""
+        with cls._lock:
+            if cache_key is not None:
+                return len(cls._waiters.get(cache_key, {}))
+            return sum(len(waiters) for waiters in cls._waiters.values())
+
+
 class ProgressTracker:
     """Track progress of long-running tasks using Django cache"""
 
@@ -41,7 +105,7 @@ class ProgressTracker:
             'start_time': time.time(),
             'message': f'Starting {description}...'
         }
-        cache.set(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        self._save(progress_data)
 
     def update(self, current, current_item=''):
         """
@@ -79,7 +143,7 @@ class ProgressTracker:
             'message': f'Processing {current}/{total} - {current_item}'
         })
 
-        cache.set(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        self._save(progress_data)
 
     def complete(self, success=True, message=''):
         """
@@ -103,7 +167,7 @@ class ProgressTracker:
             'message': message or ('Task completed successfully' if success else 'Task failed')
         })
 
-        cache.set(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        self._save(progress_data)
 
     def get_progress(self):
         """
@@ -114,6 +178,10 @@ class ProgressTracker:
         """
         return cache.get(self.cache_key)
 
+    async def aget_progress(self):
+        """Async variant of get_progress() for ASGI views"""
+        return await cache.aget(self.cache_key)
+
     def cancel(self):
         """
         Cancel the task
@@ -128,7 +196,21 @@ class ProgressTracker:
             'message': 'Task cancelled by user'
         })
 
-        cache.set(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        self._save(progress_data)
+
+    async def acancel(self):
+        """Async variant of cancel() for ASGI views"""
+        progress_data = await cache.aget(self.cache_key)
+        if not progress_data:
+            return
+
+        progress_data.update({
+            'status': 'cancelled',
+            'message': 'Task cancelled by user'
+        })
+
+        await cache.aset(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        ProgressNotifier.notify(self.cache_key)
 
     def is_cancelled(self):
         """
@@ -143,3 +225,9 @@ class ProgressTracker:
     def clear(self):
         """Clear progress data from cache"""
         cache.delete(self.cache_key)
+        ProgressNotifier.notify(self.cache_key)
+
+    def _save(self, progress_data):
+        """Store progress data and wake any SSE watchers"""
+        cache.set(self.cache_key, progress_data, self.CACHE_TIMEOUT)
+        ProgressNotifier.notify(self.cache_key)
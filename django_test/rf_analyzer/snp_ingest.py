@@ -0,0 +1,241 @@
+"""
+SnP Ingest
+Parses uploaded Touchstone files with the rf_converter core and loads the
+resulting arrays straight into the database (no intermediate CSV)
+"""
+import os
+import shutil
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Repository root, for the rf_converter package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from .filename_parser import ComplexFilenameParser
+
+SNP_EXTENSIONS = tuple(f'.s{i}p' for i in range(1, 13))  # Same set as ConversionService
+
+_parser = None  # Per-process RxGainParser
+
+
+def is_snp_filename(name):
+    return name.lower().endswith(SNP_EXTENSIONS)
+
+
+def stage_uploaded_files(uploaded_files, workdir):
+    """
+    Write uploaded SnP files (and SnP files inside zip archives) to workdir
+
+    Archive members are flattened to their base name, so entries cannot
+    escape workdir.
+
+    Args:
+        uploaded_files: Django UploadedFile list (.sNp or .zip)
+        workdir: Target directory
+
+    Returns:
+        (paths, warnings): Staged SnP paths and skipped-file messages
+    """
+    workdir = Path(workdir)
+    paths = []
+    warnings = []
+
+    def reserve(name):
+        target = workdir / name
+        if target.exists():
+            warnings.append(f'Duplicate file skipped: {name}')
+            return None
+        return target
+
+    for uploaded in uploaded_files:
+        if uploaded.name.lower().endswith('.zip'):
+            with zipfile.ZipFile(uploaded) as archive:
+                for info in archive.infolist():
+                    name = Path(info.filename).name
+                    if info.is_dir() or not name:
+                        continue
+                    if not is_snp_filename(name):
+                        warnings.append(f'Not an SnP file: {info.filename}')
+                        continue
+                    target = reserve(name)
+                    if target is None:
+                        continue
+                    with archive.open(info) as src, open(target, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    paths.append(target)
+        elif is_snp_filename(uploaded.name):
+            target = reserve(Path(uploaded.name).name)
+            if target is None:
+                continue
+            with open(target, 'wb') as dst:
+                for chunk in uploaded.chunks():
+                    dst.write(chunk)
+            paths.append(target)
+        else:
+            warnings.append(f'Unsupported file: {uploaded.name}')
+
+    return paths, warnings
+
+
+def order_snp_files(paths):
+    """
+    Order files the way ComplexFilenameParser.organize_files() lays out the grid
+
+    Sorted by band -> port -> CA -> measurement condition. Files that differ
+    only in condition (gain state, e.g. _(G0H) / _(G1)) share a grid cell, so
+    they are all kept here instead of going through the one-file-per-cell
+    matrix. Files the grid parser does not recognise go last, in input order.
+
+    Returns:
+        (ordered_paths, file_info): Every input path, and {path: parsed
+        filename info} for the recognised ones
+    """
+    placed = []
+    unplaced = []
+    for path in paths:
+        info = ComplexFilenameParser.parse(path.name)
+        if info and info.get('is_valid') and info['main_band'] and info['ca_label'] and info['port_label']:
+            placed.append((path, info))
+        else:
+            unplaced.append(path)
+
+    placed.sort(key=lambda item: (
+        item[1]['main_band'], item[1]['port_label'], item[1]['ca_label'], item[1]['condition'] or ''
+    ))
+
+    ordered = [path for path, _ in placed] + unplaced
+    file_info = dict(placed)
+    return ordered, file_info
+
+
+def parse_snp_file(path):
+    """
+    Parse one SnP file into measurement columns (runs in a worker process)
+
+    Args:
+        path: SnP file path (str or Path)
+
+    Returns:
+        dict with 'frequency_mhz'/'gain_db' float64 arrays and per-file
+        configuration values, or {'file', 'error'} on failure
+    """
+    global _parser
+    path = Path(path)
+
+    try:
+        if _parser is None:
+            from rf_converter.core.parsers.rx_parser import RxGainParser
+            _parser = RxGainParser()
+
+        df = _parser.parse_file(path)
+        metadata = _parser.parse_filename(path.name)
+
+        frequency = df['Frequency'].to_numpy(dtype=np.float64)
+        gain = df['Gain (dB)'].to_numpy(dtype=np.float64)
+        valid = np.isfinite(frequency) & np.isfinite(gain)  # |S21| == 0 gives NaN gain
+
+        port_in = metadata.get('port_in', 'ANT1')
+        port_out = metadata.get('port_out', 'RXOUT1')
+
+        # parse_file() falls back to the measured span when the name has no band tag
+        if len(df):
+            band, ca_config = df['Cfg Band'].iat[0], df['ca_config'].iat[0]
+        else:
+            band = metadata.get('band', 'Unknown')
+            ca_config = metadata.get('ca_config', metadata.get('band', ''))
+
+        return {
+            'file': str(path),
+            'frequency_mhz': frequency[valid],
+            'gain_db': gain[valid],
+            'cfg_band': band,
+            'cfg_lna_gain_state': metadata.get('lna_state', 'Unknown'),
+            'cfg_active_port_1': port_in,
+            'cfg_active_port_2': port_out,
+            # Grid columns use the filename CA notation (no N-plexer mapping loaded here)
+            'debug_nplexer_bank': ca_config,
+            'active_rf_path': _parser.map_port_to_s_notation(port_in, port_out),
+        }
+    except Exception as e:
+        return {'file': str(path), 'error': str(e)}
+
+
+def iter_parsed_files(paths, max_workers=None):
+    """
+    Parse SnP files in parallel, yielding results in input order
+
+    Args:
+        paths: SnP file paths
+        max_workers: Worker processes (default: CPU count); 1 parses in-process
+    """
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths)) if paths else 1
+
+    if max_workers <= 1:
+        for path in paths:
+            yield parse_snp_file(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, len(paths) // (max_workers * 4))
+        yield from executor.map(parse_snp_file, [str(p) for p in paths], chunksize=chunksize)
+
+
+def ingest_snp_files(session, paths, max_workers=None, progress_callback=None):
+    """
+    Parse SnP files and insert their rows into a session
+
+    Parsing runs in worker processes; database writes stay in this process.
+    One MeasurementFile is recorded per successfully parsed file.
+
+    Args:
+        session: MeasurementSession
+        paths: Staged SnP file paths
+        max_workers: Parser processes (default: CPU count)
+        progress_callback: Optional callback(current, total, filename)
+
+    Returns:
+        {'files_processed', 'rows', 'errors': [{'file', 'error'}]}
+    """
+    from django.core.files import File
+    from .ingest import bulk_insert_measurements
+    from .models import MeasurementFile
+
+    ordered, file_info = order_snp_files([Path(p) for p in paths])
+    total = len(ordered)
+    rows = 0
+    processed = 0
+    errors = []
+
+    for idx, (path, result) in enumerate(zip(ordered, iter_parsed_files(ordered, max_workers)), 1):
+        if 'error' in result:
+            errors.append({'file': path.name, 'error': result['error']})
+        else:
+            file_rows = bulk_insert_measurements(session, {
+                field: value for field, value in result.items() if field != 'file'
+            })
+            rows += file_rows
+            processed += 1
+
+            info = file_info.get(path) or {}
+            with open(path, 'rb') as fh:
+                MeasurementFile.objects.create(
+                    session=session,
+                    file=File(fh, name=path.name),
+                    filename=path.name,
+                    file_type='snp',
+                    file_size=path.stat().st_size,
+                    main_band=info.get('main_band') or result['cfg_band'],
+                    ca_label=info.get('ca_label') or result['debug_nplexer_bank'],
+                    port_label=info.get('port_label') or result['cfg_active_port_1'],
+                    condition=info.get('condition') or '',
+                    is_parsed=True
+                )
+
+        if progress_callback:
+            progress_callback(idx, total, path.name)
+
+    return {'files_processed': processed, 'rows': rows, 'errors': errors}
@@ -0,0 +1,265 @@
+"""
+Background Tasks
+In-process worker for slow maintenance jobs (no external task queue)
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, models
+
+from .models import MeasurementSession, MeasurementFile, MeasurementData, SessionCombination, ChunkedUpload
+
+# Rows removed per DELETE statement; keeps each write transaction short
+PURGE_CHUNK_SIZE = 50000
+
+# Single worker: purges run one at a time so they never contend for the DB write lock
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rf-analyzer-tasks')
+
+# Warmup jobs are queued separately so a long warmup never delays a purge;
+# each job fans out to RF_ANALYZER_WARMUP['workers'] threads of its own
+_warmup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rf-analyzer-warmup')
+
+WARMUP_DEFAULTS = {'enabled': False, 'workers': 2, 'thumbnails': True}
+
+# Abandoned chunked uploads are expired at most this often (checked on upload init)
+UPLOAD_EXPIRY_INTERVAL = 3600
+_last_upload_expiry = None
+
+
+def schedule_session_purge(session):
+    """
+    Hide a session immediately and delete its data in the background
+
+    Args:
+        session: MeasurementSession to delete
+
+    Returns:
+        concurrent.futures.Future of purge_session()
+    """
+    MeasurementSession.objects.filter(pk=session.pk).update(is_deleting=True)
+    session.is_deleting = True
+    return _executor.submit(_run_purge, session.pk)
+
+
+def _run_purge(session_id):
+    close_old_connections()
+    try:
+        return purge_session(session_id)
+    except Exception as e:
+        print(f"[Session Purge] Error purging session {session_id}: {str(e)}")
+        raise
+    finally:
+        close_old_connections()
+
+
+def purge_session(session_id, chunk_size=PURGE_CHUNK_SIZE):
+    """
+    Delete a session with set-based DELETEs instead of the ORM cascade collector
+
+    MeasurementData rows are removed in primary-key ranges (bulk_create gives
+    each upload a contiguous range), so no rows are loaded into Python and
+    each statement commits on its own. Uploaded files and rendered artifacts
+    are removed after the rows (with any staged upload chunks), then the
+    now-empty session row.
+
+    Args:
+        session_id: MeasurementSession id
+        chunk_size: Primary-key span per DELETE
+
+    Returns:
+        int: Number of measurement rows deleted
+    """
+    from .artifact_cache import ArtifactCache
+    from .chunked_upload import discard_upload_files
+
+    start_time = time.time()
+    data = MeasurementData.objects.filter(session_id=session_id)
+    bounds = data.aggregate(low=models.Min('id'), high=models.Max('id'))
+
+    deleted_rows = 0
+    if bounds['low'] is not None:
+        for low in range(bounds['low'], bounds['high'] + 1, chunk_size):
+            # MeasurementData has no dependents or signals, so this is a single DELETE
+            deleted, _ = data.filter(id__gte=low, id__lt=low + chunk_size).delete()
+            deleted_rows += deleted
+
+    SessionCombination.objects.filter(session_id=session_id).delete()
+
+    files = MeasurementFile.objects.filter(session_id=session_id)
+    stored_names = [name for name in files.values_list('file', flat=True) if name]
+    files.delete()
+    for name in stored_names:
+        try:
+            default_storage.delete(name)
+        except OSError as e:
+            print(f"[Session Purge] Could not remove {name}: {str(e)}")
+
+    for upload_id in ChunkedUpload.objects.filter(session_id=session_id).values_list('upload_id', flat=True):
+        discard_upload_files(upload_id)
+
+    ArtifactCache.get_instance().invalidate_session(session_id)
+
+    MeasurementSession.objects.filter(pk=session_id).delete()
+
+    print(f"[Session Purge] Session {session_id}: {deleted_rows} rows, "
+          f"{len(stored_names)} files removed in {time.time() - start_time:.1f}s")
+    return deleted_rows
+
+
+def schedule_upload_expiry():
+    """
+    Queue expire_chunked_uploads() unless it ran within UPLOAD_EXPIRY_INTERVAL
+
+    Returns:
+        concurrent.futures.Future, or None if skipped
+    """
+    global _last_upload_expiry
+
+    now = time.monotonic()
+    if _last_upload_expiry is not None and now - _last_upload_expiry < UPLOAD_EXPIRY_INTERVAL:
+        return None
+    _last_upload_expiry = now
+    return _executor.submit(_run_upload_expiry)
+
+
+def _run_upload_expiry():
+    from .chunked_upload import expire_chunked_uploads
+
+    close_old_connections()
+    try:
+        return expire_chunked_uploads()
+    except Exception as e:
+        print(f"[Chunked Upload] Error expiring uploads: {str(e)}")
+        raise
+    finally:
+        close_old_connections()
+
+
+def warmup_config():
+    """RF_ANALYZER_WARMUP merged over WARMUP_DEFAULTS"""
+    return {**WARMUP_DEFAULTS, **getattr(settings, 'RF_ANALYZER_WARMUP', {})}
+
+
+def schedule_session_warmup(session):
+    """
+    Pre-build every combination's chart payloads and thumbnail in the background
+
+    Progress is reported through ProgressTracker('warmup_<session_id>').
+
+    Returns:
+        concurrent.futures.Future of warm_session()
+    """
+    from .progress_tracker import ProgressTracker
+
+    # Visible as queued until the job starts
+    ProgressTracker(f'warmup_{session.pk}').start(0, 'Chart warmup (queued)')
+    return _warmup_executor.submit(_run_warmup, session.pk)
+
+
+def _run_warmup(session_id):
+    close_old_connections()
+    try:
+        return warm_session(session_id, **{k: v for k, v in warmup_config().items() if k != 'enabled'})
+    except Exception as e:
+        print(f"[Chart Warmup] Error warming session {session_id}: {str(e)}")
+        raise
+    finally:
+        close_old_connections()
+
+
+def warm_session(session_id, workers=2, thumbnails=True):
+    """
+    Build the cached chart bodies (and thumbnails) of a session's combinations
+
+    A combination that fails is logged and counted, and the job moves on;
+    the tracker is always completed (failed if any combination failed, the
+    job was cancelled or it stopped on an error) so pollers never see a
+    job stuck in 'running'.
+
+    Args:
+        session_id: MeasurementSession id
+        workers: Combinations built concurrently (thumbnails also share the kaleido renderer pool)
+        thumbnails: Also render PNG thumbnails
+
+    Returns:
+        int: Artifacts built (already cached ones are skipped)
+    """
+    from .progress_tracker import ProgressTracker
+    from .views import warm_chart_cache
+
+    tracker = ProgressTracker(f'warmup_{session_id}')
+    if tracker.is_cancelled():
+        tracker.complete(success=False, message='Warmup cancelled before it started')
+        return 0
+
+    session = MeasurementSession.active.filter(pk=session_id).first()
+    if session is None:
+        tracker.complete(success=False, message='Session not found')
+        return 0
+
+    def warm(combo):
+        try:
+            return warm_chart_cache(
+                session, combo.cfg_band, combo.cfg_lna_gain_state, combo.cfg_active_port_1, thumbnails
+            )
+        finally:
+            close_old_connections()
+
+    start_time = time.time()
+    built = 0
+    done = 0
+    failed = 0
+    cancelled = False
+    success = False
+    message = 'Warmup stopped on an error'
+    try:
+        combinations = list(session.get_combinations())
+        tracker.start(len(combinations), 'Chart warmup')
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='rf-analyzer-warm') as pool:
+            pending = iter(combinations)
+            running = {}
+
+            # Keep at most `workers` combinations in flight so a cancel stops promptly
+            for combo in pending:
+                running[pool.submit(warm, combo)] = combo
+                if len(running) >= workers:
+                    break
+
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    combo = running.pop(future)
+                    current_item = f"{combo.cfg_band} {combo.cfg_lna_gain_state} {combo.cfg_active_port_1}"
+                    try:
+                        built += future.result()
+                    except Exception as e:
+                        failed += 1
+                        print(f"[Chart Warmup] Session {session_id}: {current_item} failed: {str(e)}")
+                    done += 1
+                    tracker.update(done, current_item)
+
+                if tracker.is_cancelled():
+                    cancelled = True
+                    for future in running:
+                        future.cancel()
+                    break
+
+                for combo in pending:
+                    running[pool.submit(warm, combo)] = combo
+                    if len(running) >= workers:
+                        break
+
+        message = f'{built} chart artifacts built for {done} combinations'
+        if failed:
+            message += f', {failed} failed'
+        if cancelled:
+            message = f'Warmup cancelled after {done}/{len(combinations)} combinations: {message}'
+        success = not (failed or cancelled)
+    finally:
+        tracker.complete(success=success, message=message)
+
+    print(f"[Chart Warmup] Session {session_id}: {message} in {time.time() - start_time:.1f}s")
+    return built
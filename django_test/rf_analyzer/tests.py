@@ -1,3 +1,858 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from PyPDF2 import PdfReader
+from django.contrib import admin
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import chunked_upload, tasks
+from .admin import MeasurementDataAdmin
+from .artifact_cache import ArtifactCache
+from .chart_payload import PAYLOAD_DTYPE, encode_compact_grid, pack_float32
+from .comparison import build_comparison
+from .exporters import FILE_BLOCK_SIZE, ExportFileResponse
+from .ingest import CSV_COLUMN_MAP, CSV_DTYPES, bulk_insert_dataframe, finalize_ingest
+from .http_cache import session_conditional, session_etag
+from .models import ChunkedUpload, MeasurementData, MeasurementFile, MeasurementSession, SessionCombination
+from .pdf_merge import StreamingPdfMerger
+from .progress_tracker import ProgressTracker
+from .snp_ingest import order_snp_files
+from .tasks import purge_session, warm_session
+from .views import _chart_variant, _downsample_grid_data, parse_csv_to_database
+from utils.chart_generator import ChartGenerator  # Prototype path is set up by views
+from utils.sparameter import SParameterAnalyzer
+
+
+def make_s2p(freqs_mhz, gain_db=15.0):
+    """Minimal RI-format Touchstone file with a flat |S21|"""
+    s21 = 10 ** (gain_db / 20)
+    lines = ['# MHz S RI R 50']
+    lines += [f'{freq} 0.1 0 {s21:.6f} 0 0.01 0 0.1 0' for freq in freqs_mhz]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def make_pdf(font_name, pages=2):
+    """
+    Minimal PDF whose pages inherit /MediaBox and /Resources from the page tree
+
+    All pages share one font object, referenced as both /F1 and /F2.
+    """
+    page_ids = [5 + i for i in range(pages)]
+    content_ids = [5 + pages + i for i in range(pages)]
+    objects = {
+        1: '<< /Type /Catalog /Pages 2 0 R >>',
+        2: (f'<< /Type /Pages /Kids [{" ".join(f"{pid} 0 R" for pid in page_ids)}] /Count {pages} '
+            '/MediaBox [0 0 200 100] /Resources 3 0 R >>'),
+        3: '<< /Font << /F1 4 0 R /F2 4 0 R >> >>',
+        4: f'<< /Type /Font /Subtype /Type1 /BaseFont /{font_name} >>',
+    }
+    for page_id, content_id in zip(page_ids, content_ids):
+        objects[page_id] = f'<< /Type /Page /Parent 2 0 R /Contents {content_id} 0 R >>'
+        stream = f'BT /F1 12 Tf 10 50 Td (page {page_id}) Tj ET'
+        objects[content_id] = f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f'{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n'.encode()
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    out += ''.join(f'{offsets[obj_id]:010d} 00000 n \n' for obj_id in sorted(objects)).encode()
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return bytes(out)
+
+
+def add_measurements(session, freqs=(2110.0,), band='B1', lna='G0_H', port='ANT1', output='RXOUT1', gain_db=15.0):
+    """Bulk create one trace of MeasurementData rows for a session"""
+    return MeasurementData.objects.bulk_create([
+        MeasurementData(
+            session=session, cfg_band=band, cfg_lna_gain_state=lna, cfg_active_port_1=port,
+            cfg_active_port_2=output, debug_nplexer_bank='1', active_rf_path='S0706',
+            frequency_mhz=freq, gain_db=gain_db
+        )
+        for freq in freqs
+    ])
+
+
+class TempMediaMixin:
+    """Uploads go to a throwaway MEDIA_ROOT"""
+
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp(prefix='rf_media_')
+        media_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+
+class TempArtifactCacheMixin:
+    """ArtifactCache.get_instance() returns a cache in a throwaway directory"""
+
+    def setUp(self):
+        super().setUp()
+        cache_root = tempfile.mkdtemp(prefix='rf_artifacts_')
+        self.addCleanup(shutil.rmtree, cache_root, ignore_errors=True)
+        self.artifacts = ArtifactCache(cache_root)
+        instance_patch = mock.patch.object(ArtifactCache, '_instance', self.artifacts)
+        instance_patch.start()
+        self.addCleanup(instance_patch.stop)
+
+
+class OrderSnpFilesTests(TestCase):
+    """order_snp_files(): grid ordering without dropping files"""
+
+    def test_condition_variants_are_all_kept(self):
+        paths = [
+            Path('B1@ANT1_RXOUT1_B3@1_(G2).s2p'),
+            Path('notes_(G0H).s2p'),
+            Path('B1@ANT1_RXOUT1_B3@1_(G0H).s2p'),
+            Path('B1@ANT1_RXOUT1_B3@1_(G1).s2p'),
+        ]
+
+        ordered, file_info = order_snp_files(paths)
+
+        self.assertEqual([p.name for p in ordered], [
+            'B1@ANT1_RXOUT1_B3@1_(G0H).s2p',
+            'B1@ANT1_RXOUT1_B3@1_(G1).s2p',
+            'B1@ANT1_RXOUT1_B3@1_(G2).s2p',
+            'notes_(G0H).s2p',  # Not a grid filename: last
+        ])
+        self.assertEqual(len(file_info), 3)
+        self.assertEqual(file_info[paths[0]]['condition'], 'G2')
+
+
+@override_settings(RF_ANALYZER_SNP_INGEST_WORKERS=1)
+class SnpUploadTests(TempMediaMixin, TestCase):
+    """SnP upload keeps every gain state of a grid cell"""
+
+    def test_upload_keeps_every_gain_state(self):
+        freqs = np.linspace(2110, 2170, 7)
+        uploads = [
+            SimpleUploadedFile(f'B1@ANT1_RXOUT1_B3@1_({state}).s2p', make_s2p(freqs, gain))
+            for state, gain in (('G0H', 18.0), ('G1', 12.0), ('G2', 6.0))
+        ]
+
+        response = self.client.post(
+            reverse('rf_analyzer:snp_upload'),
+            {'session_name': 'gain states', 'description': '', 'snp_files': uploads},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        session = MeasurementSession.objects.get(name='gain states')
+        files = MeasurementFile.objects.filter(session=session)
+        self.assertEqual(sorted(files.values_list('condition', flat=True)), ['G0H', 'G1', 'G2'])
+        self.assertEqual(
+            set(MeasurementData.objects.filter(session=session).values_list('cfg_lna_gain_state', flat=True)),
+            {'G0_H', 'G1', 'G2'}
+        )
+        self.assertEqual(MeasurementData.objects.filter(session=session).count(), 3 * len(freqs))
+
+    def test_failed_upload_is_purged_in_background(self):
+        upload = SimpleUploadedFile('B1@ANT1_RXOUT1_B3@1_(G0H).s2p', b'not a touchstone file\n')
+
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            response = self.client.post(
+                reverse('rf_analyzer:snp_upload'),
+                {'session_name': 'broken', 'description': '', 'snp_files': [upload]},
+                HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+            )
+
+        self.assertEqual(response.status_code, 400)
+        session = MeasurementSession.objects.get(name='broken')
+        self.assertTrue(session.is_deleting)
+        submit.assert_called_once_with(tasks._run_purge, session.pk)
+
+
+class ProgressStreamTests(TestCase):
+    """Progress SSE works under both WSGI (sync client) and ASGI (async client)"""
+
+    def setUp(self):
+        self.tracker = ProgressTracker(9999)
+        self.addCleanup(self.tracker.clear)
+        self.tracker.start(2, 'Export')
+        self.tracker.complete(message='done')
+        self.url = reverse('rf_analyzer:progress_stream', args=[9999])
+
+    def assert_final_events(self, body):
+        self.assertIn('"status": "completed"', body)
+        self.assertTrue(body.endswith('"Stream closed"}\n\n'))
+
+    def test_wsgi_stream_is_sync(self):
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.is_async)
+        self.assert_final_events(b''.join(response.streaming_content).decode())
+
+    async def test_asgi_stream_is_async(self):
+        response = await AsyncClient().get(self.url)
+
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assert_final_events(body)
+
+    async def test_cancel_task(self):
+        self.tracker.start(2, 'Export')
+
+        response = await AsyncClient().post(reverse('rf_analyzer:cancel_task', args=[9999]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.tracker.is_cancelled())
+
+
+class ExportStreamingTests(TestCase):
+    """Exports stream with async iterators under ASGI instead of being buffered"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.session = MeasurementSession.objects.create(name='export')
+        add_measurements(cls.session, freqs=[2110.0 + i for i in range(3)])
+        cls.url = reverse('rf_analyzer:export_csv', args=[cls.session.id])
+
+    def assert_csv(self, body):
+        lines = body.decode().splitlines()
+        self.assertEqual(lines[0].split(',')[0], 'Session')
+        self.assertEqual(lines[1:], [f'export,B1,G0_H,ANT1,RXOUT1,S0706,{2110.0 + i},15.0' for i in range(3)])
+
+    def test_wsgi_csv_is_sync(self):
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.is_async)
+        self.assert_csv(b''.join(response.streaming_content))
+
+    async def test_asgi_csv_is_async(self):
+        response = await AsyncClient().get(self.url)
+
+        self.assertTrue(response.is_async)
+        self.assert_csv(b''.join([chunk async for chunk in response.streaming_content]))
+
+    async def test_file_response_streams_blocks(self):
+        payload = bytes(range(256)) * (FILE_BLOCK_SIZE // 128 + 1)
+        response = ExportFileResponse(
+            io.BytesIO(payload), asynchronous=True, as_attachment=True,
+            filename='report.pdf', content_type='application/pdf'
+        )
+
+        self.assertTrue(response.is_async)
+        self.assertEqual(response['Content-Length'], str(len(payload)))
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(b''.join(chunks), payload)
+
+    def test_full_report_pdf_failure_releases_spool(self):
+        spool = io.BytesIO()
+        tracker = ProgressTracker(self.session.id)
+        self.addCleanup(tracker.clear)
+
+        with mock.patch('rf_analyzer.views._new_export_spool', return_value=spool), \
+                mock.patch('rf_analyzer.views._render_combination', side_effect=RuntimeError('kaleido died')):
+            response = self.client.get(reverse('rf_analyzer:export_full_report_pdf', args=[self.session.id]))
+
+        self.assertEqual(response.status_code, 500)
+        self.assertTrue(spool.closed)
+        progress = tracker.get_progress()
+        self.assertEqual(progress['status'], 'failed')
+        self.assertIn('kaleido died', progress['message'])
+
+
+class WarmSessionTests(TestCase):
+    """warm_session() survives failing combinations and can be cancelled"""
+
+    def setUp(self):
+        self.session = MeasurementSession.objects.create(name='warmup')
+        for band in ('B1', 'B3', 'B7'):
+            add_measurements(self.session, band=band)
+        self.tracker = ProgressTracker(f'warmup_{self.session.id}')
+        self.addCleanup(self.tracker.clear)
+
+    def warm(self, side_effect):
+        with mock.patch('rf_analyzer.views.warm_chart_cache', side_effect=side_effect):
+            return warm_session(self.session.id, workers=1)
+
+    def test_failed_combination_is_counted(self):
+        def build(session, band, lna, port, thumbnails):
+            if band == 'B3':
+                raise ValueError('render failed')
+            return 2
+
+        built = self.warm(build)
+
+        progress = self.tracker.get_progress()
+        self.assertEqual(built, 4)
+        self.assertEqual(progress['current'], 3)
+        self.assertEqual(progress['status'], 'failed')
+        self.assertIn('1 failed', progress['message'])
+
+    def test_cancel_task_stops_warmup(self):
+        def build_and_cancel(*args):
+            self.client.get(reverse('rf_analyzer:cancel_task', args=[self.session.id]) + '?task=warmup')
+            return 1
+
+        built = self.warm(build_and_cancel)
+
+        progress = self.tracker.get_progress()
+        self.assertEqual(built, 1)
+        self.assertEqual(progress['status'], 'failed')
+        self.assertIn('cancelled after 1/3', progress['message'])
+
+    def test_cancelled_while_queued(self):
+        self.tracker.start(0, 'Chart warmup (queued)')
+        self.tracker.cancel()
+
+        self.assertEqual(self.warm(lambda *args: 1), 0)
+        self.assertIn('before it started', self.tracker.get_progress()['message'])
+
+
+class ChunkedUploadStagingTests(TempMediaMixin, TestCase):
+    """Chunk files are consumed as ingested; abandoned uploads expire"""
+
+    def setUp(self):
+        super().setUp()
+        upload_root = tempfile.mkdtemp(prefix='rf_uploads_')
+        upload_override = override_settings(RF_ANALYZER_CHUNKED_UPLOAD_DIR=upload_root)
+        upload_override.enable()
+        self.addCleanup(upload_override.disable)
+        self.addCleanup(shutil.rmtree, upload_root, ignore_errors=True)
+
+        rows = 300
+        self.data = pd.DataFrame({
+            'Cfg Band': 'B1', 'cfg-lna_gain_state': 'G0_H', 'cfg-active_port_1': 'ANT1',
+            'cfg-active_port_2': 'RXOUT1', 'debug-nplexer_bank': '1', 'Active RF Path': 'S0706',
+            'Frequency': np.linspace(2110, 2170, rows), 'Gain (dB)': 15.0,
+        }).to_csv(index=False).encode()
+        self.session = MeasurementSession.objects.create(name='chunked')
+        chunk_size = len(self.data) // 3 + 1
+        self.upload = ChunkedUpload.objects.create(
+            session=self.session, filename='chunked.csv', total_size=len(self.data),
+            chunk_size=chunk_size, total_chunks=3
+        )
+
+    def stage(self, *indices):
+        size = self.upload.chunk_size
+        for index in indices:
+            chunk = self.data[index * size:(index + 1) * size]
+            chunked_upload.write_chunk(self.upload, index, io.BytesIO(chunk))
+
+    def test_reader_deletes_consumed_chunks(self):
+        self.stage(0, 1, 2)
+        assembled_path = chunked_upload.assembled_path(self.upload.upload_id)
+
+        with open(assembled_path, 'wb') as assembled, \
+                chunked_upload.ChunkStreamReader(self.upload, assembled) as raw:
+            reader = io.BufferedReader(raw, buffer_size=16)
+            self.assertEqual(reader.read(self.upload.chunk_size + 10), self.data[:self.upload.chunk_size + 10])
+            self.assertFalse(chunked_upload.chunk_path(self.upload.upload_id, 0).exists())
+            self.assertEqual(chunked_upload.received_chunks(self.upload), [0, 1, 2])
+            reader.read()
+
+        self.assertEqual(assembled_path.read_bytes(), self.data)
+        self.assertEqual(list(assembled_path.parent.glob('*.part')), [])
+
+    def test_restarted_ingest_replays_assembled_prefix(self):
+        # Interrupted ingest: chunk 0 consumed and deleted, chunk 1 half copied
+        self.stage(1, 2)
+        assembled_path = chunked_upload.assembled_path(self.upload.upload_id)
+        assembled_path.write_bytes(self.data[:self.upload.chunk_size * 3 // 2])
+        self.assertEqual(chunked_upload.received_chunks(self.upload), [0, 1, 2])
+
+        rows = chunked_upload.ingest_chunked_upload(self.upload.upload_id)
+
+        self.assertEqual(rows, 300)
+        stored = MeasurementFile.objects.get(session=self.session).file
+        with stored.open('rb'):
+            self.assertEqual(stored.read(), self.data)
+        self.assertFalse(assembled_path.parent.exists())
+
+    def test_listed_hides_uploading_sessions(self):
+        self.assertNotIn(self.session, MeasurementSession.active.listed())
+
+        ChunkedUpload.objects.filter(pk=self.upload.pk).update(status='ingested')
+        self.assertIn(self.session, MeasurementSession.active.listed())
+
+    def test_expire_abandoned_uploads(self):
+        self.stage(0)
+        directory = chunked_upload.upload_dir(self.upload.upload_id)
+        stale = time.time() - 7200
+        os.utime(directory, (stale, stale))
+        ChunkedUpload.objects.filter(pk=self.upload.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        old_session = MeasurementSession.objects.create(name='old')
+        old = ChunkedUpload.objects.create(
+            session=old_session, filename='old.csv', total_size=1, chunk_size=1, total_chunks=1,
+            status='ingested', created_at=timezone.now() - timedelta(hours=2)
+        )
+        fresh = ChunkedUpload.objects.create(
+            session=old_session, filename='fresh.csv', total_size=1, chunk_size=1, total_chunks=1
+        )
+
+        with mock.patch('rf_analyzer.tasks.schedule_session_purge') as purge:
+            expired, deleted = chunked_upload.expire_chunked_uploads(max_age=3600)
+
+        self.assertEqual((expired, deleted), (1, 1))
+        self.upload.refresh_from_db()
+        self.assertEqual(self.upload.status, 'failed')
+        self.assertFalse(directory.exists())
+        purge.assert_called_once_with(self.session)
+        self.assertFalse(ChunkedUpload.objects.filter(pk=old.pk).exists())
+        self.assertEqual(ChunkedUpload.objects.get(pk=fresh.pk).status, 'uploading')
+
+
+class ComparisonCacheTests(TestCase):
+    """Cached comparison payloads follow session renames"""
+
+    def setUp(self):
+        self.sessions = []
+        for name in ('golden', 'dut'):
+            session = MeasurementSession.objects.create(name=name)
+            add_measurements(session)
+            self.sessions.append(session)
+
+    def compare(self):
+        body, cache_hit = build_comparison(self.sessions, self.sessions[0].id, 'B1', 'G0_H', 'ANT1')
+        return [s['name'] for s in json.loads(body)['sessions']], cache_hit
+
+    def test_rename_invalidates_cached_payload(self):
+        self.assertEqual(self.compare(), (['golden', 'dut'], False))
+        self.assertEqual(self.compare(), (['golden', 'dut'], True))
+
+        self.sessions[1].name = 'dut rev B'
+        self.sessions[1].save()
+
+        self.assertEqual(self.compare(), (['golden', 'dut rev B'], False))
+
+
+class ArtifactCacheTests(SimpleTestCase):
+    """ArtifactCache: keyed hits, per-session invalidation and LRU size bound"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='rf_artifacts_')
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.cache = ArtifactCache(self.root, max_bytes=100)
+        self.session = SimpleNamespace(id=1, data_version=1)
+
+    def render(self, data=b'pdf'):
+        return mock.Mock(return_value=data)
+
+    def test_get_or_render_hit_and_miss(self):
+        render = self.render()
+
+        self.assertEqual(self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render), (b'pdf', False))
+        self.assertEqual(self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render), (b'pdf', True))
+        self.assertEqual(render.call_count, 1)
+
+        # Any part of the key changing is a miss
+        self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'png', 10, 10, render)
+        self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render, variant='webgl=1')
+        self.session.data_version = 2
+        self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render)
+        self.assertEqual(render.call_count, 4)
+
+    def test_invalidate_session(self):
+        other = SimpleNamespace(id=2, data_version=1)
+        for session in (self.session, other):
+            self.cache.get_or_render(session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, self.render())
+
+        self.cache.invalidate_session(self.session.id)
+
+        render = self.render()
+        self.assertFalse(self.cache.get_or_render(self.session, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render)[1])
+        self.assertTrue(self.cache.get_or_render(other, 'B1', 'G0_H', 'ANT1', 'pdf', 10, 10, render)[1])
+        self.assertEqual(render.call_count, 1)
+
+    def test_evicts_least_recently_used(self):
+        for key in ('a', 'b'):
+            self.cache.put(1, key, 'pdf', b'x' * 40)
+        os.utime(self.cache._path(1, 'a', 'pdf'), (1000, 1000))
+        os.utime(self.cache._path(1, 'b', 'pdf'), (2000, 2000))
+        self.cache.get(1, 'a', 'pdf')  # 'a' becomes the most recently used
+
+        self.cache.put(1, 'c', 'pdf', b'x' * 40)  # 120 > 100 bytes: evict down to 90
+
+        self.assertIsNone(self.cache.get(1, 'b', 'pdf'))
+        self.assertIsNotNone(self.cache.get(1, 'a', 'pdf'))
+        self.assertIsNotNone(self.cache.get(1, 'c', 'pdf'))
+        self.assertEqual(self.cache._total_bytes, 80)
+
+    def test_overwrite_counts_replaced_size(self):
+        self.cache.put(1, 'a', 'pdf', b'x' * 40)
+        self.cache.put(1, 'a', 'pdf', b'x' * 30)
+        self.assertEqual(self.cache._total_bytes, 30)
+
+        self.cache.put(1, 'b', 'pdf', b'x' * 60)
+        self.assertEqual(self.cache._total_bytes, 90)
+        self.assertIsNotNone(self.cache.get(1, 'a', 'pdf'))
+
+
+@override_settings(RF_ANALYZER_WARMUP={'enabled': False})
+class CombinationIndexTests(TestCase):
+    """SessionCombination index: built on ingest, backfilled lazily, rebuilt on admin edits"""
+
+    def setUp(self):
+        self.session = MeasurementSession.objects.create(name='index')
+        add_measurements(self.session, freqs=[2130.0, 2110.0, 2170.0])
+        add_measurements(self.session, freqs=[2110.0, 2170.0], output='RXOUT2')
+        add_measurements(self.session, freqs=[1805.0, 1880.0], band='B3', port='ANT2')
+
+    def index(self, session):
+        return {
+            (c.cfg_band, c.cfg_lna_gain_state, c.cfg_active_port_1): (c.row_count, c.freq_min_mhz, c.freq_max_mhz)
+            for c in session.combinations.all()
+        }
+
+    def test_ingest_builds_index(self):
+        finalize_ingest(self.session)
+
+        self.assertEqual(self.index(self.session), {
+            ('B1', 'G0_H', 'ANT1'): (5, 2110.0, 2170.0),
+            ('B3', 'G0_H', 'ANT2'): (2, 1805.0, 1880.0),
+        })
+        self.assertEqual(self.session.total_data_points(), 7)
+        self.assertEqual(self.session.get_facets()['input_ports'], ['ANT1', 'ANT2'])
+
+    def test_lazy_backfill(self):
+        self.assertFalse(self.session.combinations.exists())
+
+        self.assertEqual(len(self.session.get_combinations()), 2)
+        self.assertEqual(self.session.combinations.count(), 2)
+        self.assertEqual(self.session.total_data_points(), 7)
+
+        # Empty session: nothing to backfill
+        empty = MeasurementSession.objects.create(name='empty')
+        self.assertEqual(list(empty.get_combinations()), [])
+        self.assertEqual(empty.total_data_points(), 0)
+
+    def test_admin_edit_rebuilds_index(self):
+        finalize_ingest(self.session)
+        other = MeasurementSession.objects.create(name='other')
+        version = self.session.data_version
+        model_admin = MeasurementDataAdmin(MeasurementData, admin.site)
+        request = RequestFactory().post('/')
+
+        # Move the 1880 MHz B3 row to another session
+        row = self.session.data_points.get(cfg_band='B3', frequency_mhz=1880.0)
+        row.session = other
+        form = mock.Mock(changed_data=['session'], initial={'session': self.session.id})
+        model_admin.save_model(request, row, form, change=True)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.index(self.session)[('B3', 'G0_H', 'ANT2')], (1, 1805.0, 1805.0))
+        self.assertEqual(self.index(other), {('B3', 'G0_H', 'ANT2'): (1, 1880.0, 1880.0)})
+        self.assertGreater(self.session.data_version, version)
+
+        model_admin.delete_queryset(request, self.session.data_points.filter(cfg_band='B3'))
+        self.assertNotIn(('B3', 'G0_H', 'ANT2'), self.index(self.session))
+        self.assertEqual(self.session.total_data_points(), 5)
+
+
+class DownsampleTests(SimpleTestCase):
+    """LTTB chart downsampling (SParameterAnalyzer.lttb_indices)"""
+
+    def downsample(self, freq, gain, target_points):
+        grid = {'1': {'RXOUT1': {'frequency': freq, 'gain_db': gain}}}
+        trace = _downsample_grid_data(grid, target_points)['1']['RXOUT1']
+        return trace['frequency'], trace['gain_db']
+
+    def test_global_extremes_kept(self):
+        freq = np.linspace(2110, 2170, 2000)
+        gain = np.random.default_rng(12).normal(15, 1, 2000)  # Plain LTTB drops both extremes here
+
+        _, reduced = self.downsample(freq, gain, 100)
+
+        self.assertIn(len(reduced), (100, 101))
+        self.assertEqual(reduced.max(), gain.max())
+        self.assertEqual(reduced.min(), gain.min())
+
+    def test_indices_sorted_with_endpoints(self):
+        freq = np.linspace(2110, 2170, 5000)
+        gain = 15 + np.sin(freq / 3)
+
+        indices = SParameterAnalyzer.lttb_indices(freq, gain, 200)
+
+        self.assertIn(len(indices), (200, 201))
+        self.assertEqual((indices[0], indices[-1]), (0, 4999))
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_short_trace_unchanged(self):
+        freq = np.linspace(2110, 2170, 50)
+
+        self.assertEqual(SParameterAnalyzer.lttb_indices(freq, freq, 50).tolist(), list(range(50)))
+        self.assertEqual(len(self.downsample(freq, freq, 2)[0]), 50)
+
+    def test_nan_gain(self):
+        freq = np.linspace(2110, 2170, 1000)
+        gain = np.full(1000, np.nan)
+        gain[500] = 20.0
+
+        indices = SParameterAnalyzer.lttb_indices(freq, gain, 50)
+
+        self.assertIn(500, indices)
+        self.assertEqual(len(indices), 50)
+
+
+class ChartPayloadTests(SimpleTestCase):
+    """Packed float32 chart buffers decode back to the compact grid spec"""
+
+    @staticmethod
+    def decode(buffer):
+        return np.frombuffer(base64.b64decode(buffer), dtype=PAYLOAD_DTYPE)
+
+    @staticmethod
+    def cell(freqs, gains):
+        return {'frequency': np.array(freqs), 'gain_db': np.array(gains), 'count': len(freqs)}
+
+    def test_pack_float32_offsets(self):
+        buffer, offsets = pack_float32([[1.5, 2.5], [], np.array([3.25])])
+
+        self.assertEqual(offsets, [0, 2, 2])
+        np.testing.assert_array_equal(self.decode(buffer), [1.5, 2.5, 3.25])
+
+        self.assertEqual(pack_float32([]), ('', []))
+
+    def test_round_trip_matches_spec(self):
+        empty = self.cell([], [])
+        grid_data = {
+            'B1': {
+                'RXOUT1': self.cell([2110.0, 2140.0, 2170.0], [15.0, 15.5, 14.75]),
+                'RXOUT2': empty,
+                'RXOUT3': self.cell([2110.0], [12.0]),
+            },
+            '1A-3A': {'RXOUT2': self.cell([2110.0, 2170.0], [16.0, 16.25]), 'RXOUT4': empty},
+        }
+        spec = ChartGenerator.create_compact_grid_spec(grid_data, 'B1', 'G0_H', 'ANT1')
+
+        payload = encode_compact_grid(spec)
+        x, y = self.decode(payload['x']), self.decode(payload['y'])
+
+        self.assertEqual(payload['layout'], spec['layout'])
+        self.assertEqual(len(payload['traces']), len(spec['traces']))
+        self.assertEqual(len(x), sum(len(t['x']) for t in spec['traces']))
+        self.assertNotIn('RXOUT2-B1', [t['name'] for t in payload['traces']])  # Empty cells are skipped
+
+        offset = 0
+        for trace, expected in zip(payload['traces'], spec['traces']):
+            self.assertEqual((trace['row'], trace['col'], trace['name']), (expected['row'], expected['col'], expected['name']))
+            self.assertEqual((trace['offset'], trace['length']), (offset, len(expected['x'])))
+            window = slice(trace['offset'], trace['offset'] + trace['length'])
+            np.testing.assert_array_equal(x[window], np.asarray(expected['x'], dtype=PAYLOAD_DTYPE))
+            np.testing.assert_array_equal(y[window], np.asarray(expected['y'], dtype=PAYLOAD_DTYPE))
+            offset += trace['length']
+
+    def test_empty_grid(self):
+        spec = ChartGenerator.create_compact_grid_spec({'B1': {'RXOUT1': self.cell([], [])}}, 'B1', 'G0_H', 'ANT1')
+
+        payload = encode_compact_grid(spec)
+
+        self.assertEqual(payload['traces'], [])
+        self.assertEqual((payload['x'], payload['y']), ('', ''))
+
+
+class StreamingPdfMergerTests(SimpleTestCase):
+    """StreamingPdfMerger output is a valid document with self-contained pages"""
+
+    def merge(self, *documents):
+        output = io.BytesIO()
+        merger = StreamingPdfMerger(output)
+        added = [merger.append(document) for document in documents]
+        merger.finish(title='Full Report')
+        output.seek(0)
+        return added, merger.page_count, PdfReader(output, strict=True)
+
+    def test_page_count(self):
+        added, page_count, reader = self.merge(make_pdf('Helvetica', 2), make_pdf('Courier', 3))
+
+        self.assertEqual(added, [2, 3])
+        self.assertEqual(page_count, 5)
+        self.assertEqual(len(reader.pages), 5)
+        self.assertEqual(reader.metadata.title, 'Full Report')
+
+    def test_inherited_attributes_copied_to_pages(self):
+        _, _, reader = self.merge(make_pdf('Helvetica'))
+
+        # Raw page objects (reader.pages would flatten inheritance on read)
+        page_tree = reader.trailer['/Root']['/Pages']
+        self.assertNotIn('/MediaBox', page_tree)
+        for kid in page_tree['/Kids']:
+            page = kid.get_object()
+            self.assertEqual([float(v) for v in page['/MediaBox']], [0, 0, 200, 100])
+            self.assertIn('/F1', page['/Resources']['/Font'])
+        self.assertIn('page', reader.pages[0].extract_text())
+
+    def test_shared_objects_renumbered_per_document(self):
+        _, _, reader = self.merge(make_pdf('Helvetica'), make_pdf('Courier'))
+
+        fonts = [page['/Resources']['/Font'] for page in reader.pages]
+        # Source documents reuse object numbers; each page keeps its own document's font
+        self.assertEqual([f['/F1'].get_object()['/BaseFont'] for f in fonts],
+                         ['/Helvetica', '/Helvetica', '/Courier', '/Courier'])
+        # Two references to one source object stay one object after renumbering
+        for font in fonts:
+            self.assertEqual(font.raw_get('/F1').idnum, font.raw_get('/F2').idnum)
+        self.assertNotEqual(fonts[0].raw_get('/F1').idnum, fonts[2].raw_get('/F1').idnum)
+
+
+class SessionConditionalTests(TestCase):
+    """Chart endpoints answer 304 while the session and query are unchanged"""
+
+    def setUp(self):
+        self.session = MeasurementSession.objects.create(name='etag')
+        self.view = session_conditional('chart')(lambda request, session_id: HttpResponse('chart'))
+        self.factory = RequestFactory()
+
+    def get(self, etag=None, **params):
+        headers = {'If-None-Match': etag} if etag else {}
+        request = self.factory.get('/chart/', {'band': 'B1', **params}, headers=headers)
+        return self.view(request, self.session.id)
+
+    def test_matching_etag_returns_304(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('no-cache', first['Cache-Control'])
+
+        self.assertEqual(self.get(first['ETag']).status_code, 304)
+
+    def test_etag_follows_session_and_query(self):
+        etag = self.get()['ETag']
+
+        self.assertEqual(self.get(etag, band='B3').status_code, 200)
+
+        self.session.name = 'renamed'
+        self.session.save()
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_chart_endpoint_not_modified(self):
+        params = {'band': 'B1', 'lna': 'G0_H', 'port': 'ANT1'}
+        request = self.factory.get('/', params)
+        etag = session_etag('chart-buffers', _chart_variant)(request, self.session.id)
+
+        response = self.client.get(
+            reverse('rf_analyzer:chart_buffers', args=[self.session.id]), params,
+            HTTP_IF_NONE_MATCH=f'"{etag}"'
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+
+class ChartVariantTests(TempArtifactCacheMixin, TestCase):
+    """Changing the WebGL threshold invalidates cached chart bodies and ETags"""
+
+    def setUp(self):
+        super().setUp()
+        self.session = MeasurementSession.objects.create(name='variant')
+        add_measurements(self.session, freqs=[2110.0, 2120.0, 2130.0])
+        self.url = reverse('rf_analyzer:chart_buffers', args=[self.session.id])
+        self.params = {'band': 'B1', 'lna': 'G0_H', 'port': 'ANT1'}
+
+    def test_threshold_change_rerenders(self):
+        with override_settings(RF_ANALYZER_WEBGL_POINT_THRESHOLD=1000):
+            svg = self.client.get(self.url, self.params)
+        with override_settings(RF_ANALYZER_WEBGL_POINT_THRESHOLD=1):
+            stale = self.client.get(self.url, self.params, HTTP_IF_NONE_MATCH=svg['ETag'])
+            webgl = self.client.get(self.url, self.params)
+
+        self.assertEqual(stale.status_code, 200)
+        self.assertNotEqual(stale['ETag'], svg['ETag'])
+        self.assertEqual(json.loads(svg.content)['render_mode'], 'svg')
+        self.assertEqual(json.loads(webgl.content)['render_mode'], 'webgl')
+
+
+class PurgeSessionTests(TempArtifactCacheMixin, TempMediaMixin, TestCase):
+    """purge_session() removes exactly one session's rows, index, files and artifacts"""
+
+    def setUp(self):
+        super().setUp()
+        self.doomed = MeasurementSession.objects.create(name='doomed')
+        self.kept = MeasurementSession.objects.create(name='kept')
+        # Interleaved id ranges: the kept session's rows sit between the doomed session's
+        add_measurements(self.doomed, freqs=[2110.0, 2120.0])
+        add_measurements(self.kept, freqs=[2110.0, 2120.0, 2130.0])
+        add_measurements(self.doomed, freqs=[2130.0, 2140.0], band='B3')
+        add_measurements(self.kept, freqs=[1805.0], band='B3')
+
+        self.stored = {}
+        for session in (self.doomed, self.kept):
+            session.rebuild_combinations()
+            measurement_file = MeasurementFile.objects.create(
+                session=session, file=ContentFile(b'data', name=f'{session.name}.csv'),
+                filename=f'{session.name}.csv', file_size=4
+            )
+            self.stored[session.name] = measurement_file.file.path
+            self.artifacts.put(session.id, 'key', 'png', b'png')
+
+    def test_purge_keeps_other_session(self):
+        deleted = purge_session(self.doomed.id, chunk_size=2)
+
+        self.assertEqual(deleted, 4)
+        self.assertFalse(MeasurementSession.objects.filter(pk=self.doomed.pk).exists())
+        self.assertFalse(MeasurementData.objects.filter(session_id=self.doomed.pk).exists())
+        self.assertFalse(SessionCombination.objects.filter(session_id=self.doomed.pk).exists())
+        self.assertFalse(os.path.exists(self.stored['doomed']))
+        self.assertIsNone(self.artifacts.get(self.doomed.id, 'key', 'png'))
+
+        self.assertEqual(MeasurementData.objects.filter(session=self.kept).count(), 4)
+        self.assertEqual(SessionCombination.objects.filter(session=self.kept).count(), 2)
+        self.assertTrue(MeasurementFile.objects.filter(session=self.kept).exists())
+        self.assertTrue(os.path.exists(self.stored['kept']))
+        self.assertEqual(self.artifacts.get(self.kept.id, 'key', 'png'), b'png')
+
+    def test_scheduled_purge_hides_session(self):
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            tasks.schedule_session_purge(self.doomed)
+
+        submit.assert_called_once_with(tasks._run_purge, self.doomed.pk)
+        self.assertTrue(MeasurementSession.objects.get(pk=self.doomed.pk).is_deleting)
+        self.assertNotIn(self.doomed, MeasurementSession.active.all())
+        self.assertIn(self.kept, MeasurementSession.active.all())
+
+
+class CsvIngestRoutesTests(TempMediaMixin, TestCase):
+    """Upload (CsvParser) and chunked (read_csv) ingest store identical rows"""
+
+    def test_routes_store_same_rows(self):
+        rows = 50
+        csv_bytes = pd.DataFrame({
+            'Freq Type': 'Rx',  # Not ingested
+            'Cfg Band': np.where(np.arange(rows) % 2, 'B1', 'B3'),
+            'cfg-lna_gain_state': 'G0_H', 'cfg-active_port_1': 'ANT1',
+            'cfg-active_port_2': np.where(np.arange(rows) % 3, 'RXOUT1', 'RXOUT2'),
+            'debug-nplexer_bank': np.where(np.arange(rows) % 5, '1', '1+3'),
+            'Active RF Path': 'S0706',
+            'Frequency': np.round(np.linspace(2110.1, 2169.9, rows), 3),
+            'Gain (dB)': np.round(np.linspace(16.466, 12.103, rows), 3),
+        }).to_csv(index=False).encode()
+
+        upload_session = MeasurementSession.objects.create(name='upload')
+        measurement_file = MeasurementFile.objects.create(
+            session=upload_session, file=ContentFile(csv_bytes, name='routes.csv'),
+            filename='routes.csv', file_size=len(csv_bytes)
+        )
+        self.assertEqual(parse_csv_to_database(measurement_file), rows)
+
+        chunked_session = MeasurementSession.objects.create(name='chunked')
+        df = pd.read_csv(io.BytesIO(csv_bytes), usecols=list(CSV_COLUMN_MAP.values()), dtype=CSV_DTYPES)
+        self.assertEqual(bulk_insert_dataframe(chunked_session, df), rows)
+
+        def stored(session):
+            return list(session.data_points.order_by('id').values_list(*CSV_COLUMN_MAP))
+
+        self.assertEqual(stored(upload_session), stored(chunked_session))
+        self.assertEqual(stored(upload_session)[0], ('B3', 'G0_H', 'ANT1', 'RXOUT2', '1+3', 'S0706', 2110.1, 16.466))
@@ -9,13 +9,23 @@ app_name = 'rf_analyzer'
 
 urlpatterns = [
     path('', views.index, name='index'),
+    path('upload-snp/', views.snp_upload, name='snp_upload'),
+    path('api/upload/', views.upload_init, name='upload_init'),
+    path('api/upload/<uuid:upload_id>/', views.upload_status, name='upload_status'),
+    path('api/upload/<uuid:upload_id>/chunk/<int:index>/', views.upload_chunk, name='upload_chunk'),
+    path('api/upload/<uuid:upload_id>/complete/', views.upload_complete, name='upload_complete'),
     path('viewer/<int:session_id>/', views.viewer, name='viewer'),
     path('session/delete/<int:session_id>/', views.delete_session, name='delete_session'),
     path('session/update/<int:session_id>/', views.update_session, name='update_session'),
     path('api/chart/<int:session_id>/', views.get_chart_data, name='chart_data'),
+    path('api/chart-buffers/<int:session_id>/', views.get_chart_buffers, name='chart_buffers'),
+    path('api/thumbnail/<int:session_id>/', views.get_chart_thumbnail, name='chart_thumbnail'),
+    path('api/warmup/<int:session_id>/', views.warmup_session, name='warmup_session'),
+    path('api/compare/', views.compare_sessions, name='compare_sessions'),
     path('api/export-pdf/<int:session_id>/', views.export_pdf, name='export_pdf'),
     path('api/export-full-report-pdf/<int:session_id>/', views.export_full_report_pdf, name='export_full_report_pdf'),
     path('api/export-full-report-ppt/<int:session_id>/', views.export_full_report_ppt, name='export_full_report_ppt'),
+    path('api/export-csv/<int:session_id>/', views.export_csv, name='export_csv'),
     path('api/cancel-task/<int:session_id>/', views.cancel_task, name='cancel_task'),
     path('api/progress-stream/<int:session_id>/', views.progress_stream, name='progress_stream'),
 ]
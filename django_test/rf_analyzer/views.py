@@ -2,6 +2,7 @@
 RF Analyzer Views
 """
 
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse, HttpResponse
 import pandas as pd
@@ -9,13 +10,188 @@ from pathlib import Path
 import sys
 
 from .models import MeasurementSession, MeasurementFile, MeasurementData
-from .forms import CsvUploadForm
+from .forms import CsvUploadForm, SnpUploadForm, ChunkedUploadInitForm
+from .ingest import CSV_DTYPES, bulk_insert_dataframe, finalize_ingest
+from .http_cache import compress_response, session_conditional
 
 # Add prototype to path for CSV parser
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'prototype'))
 from parsers.csv_parser import CsvParser
 
 
+def _new_export_spool():
+    """
+    Temporary file for assembling export downloads
+
+    Kept in memory up to RF_ANALYZER_EXPORT_SPOOL_MAX_MEMORY bytes, then rolled
+    over to disk under RF_ANALYZER_EXPORT_TEMP_DIR (system temp dir if None).
+    """
+    import tempfile
+
+    return tempfile.SpooledTemporaryFile(
+        max_size=getattr(settings, 'RF_ANALYZER_EXPORT_SPOOL_MAX_MEMORY', 32 * 1024 * 1024),
+        dir=getattr(settings, 'RF_ANALYZER_EXPORT_TEMP_DIR', None)
+    )
+
+
+def _get_renderer_pool():
+    """Per-process kaleido renderer pool, warmed on first export"""
+    from utils.renderer_pool import RendererPool
+
+    pool = RendererPool.get_instance(**getattr(settings, 'RF_ANALYZER_RENDERER_POOL', {}))
+    if not pool.get_stats()['started']:
+        pool.warm(1)
+    return pool
+
+
+# Static export page size (pixels)
+EXPORT_IMAGE_WIDTH = 1920
+EXPORT_IMAGE_HEIGHT = 1200
+
+# Interactive grid subplot size (pixels) and LTTB density
+CHART_COMPACT_SIZE = (300, 200)
+CHART_POINTS_PER_PIXEL = 1
+
+# Preview image width (pixels)
+CHART_THUMBNAIL_WIDTH = 480
+
+
+def _chart_variant():
+    """Settings that change chart bodies without a data change (part of their cache key and ETag)"""
+    return f"webgl={getattr(settings, 'RF_ANALYZER_WEBGL_POINT_THRESHOLD', None)}"
+
+
+def _query_grid_data(session, band, lna, port):
+    """
+    Load one Band/LNA/Port combination in the grid structure used by ChartGenerator
+
+    Returns:
+        {ca_combo: {output_port: {'frequency': [...], 'gain_db': [...], 'count': n}}}
+    """
+    data_points = MeasurementData.objects.filter(
+        session=session,
+        cfg_band=band,
+        cfg_lna_gain_state=lna,
+        cfg_active_port_1=port
+    ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz')
+
+    # Organize into grid structure
+    grid_data = {}
+    for point in data_points:
+        ca_combo = point.debug_nplexer_bank
+        output_port = point.cfg_active_port_2
+
+        if ca_combo not in grid_data:
+            grid_data[ca_combo] = {}
+
+        if output_port not in grid_data[ca_combo]:
+            grid_data[ca_combo][output_port] = {
+                'frequency': [],
+                'gain_db': [],
+                'count': 0
+            }
+
+        grid_data[ca_combo][output_port]['frequency'].append(float(point.frequency_mhz))
+        grid_data[ca_combo][output_port]['gain_db'].append(float(point.gain_db))
+        grid_data[ca_combo][output_port]['count'] += 1
+
+    return grid_data
+
+
+def _downsample_grid_data(grid_data, target_points):
+    """
+    Reduce every trace to about target_points with LTTB (global max/min always kept)
+
+    Returns:
+        New grid dict in the same structure as _query_grid_data()
+    """
+    from utils.sparameter import SParameterAnalyzer
+
+    downsampled = {}
+    for ca_combo, ports in grid_data.items():
+        downsampled[ca_combo] = {}
+        for output_port, trace in ports.items():
+            freq, gain = SParameterAnalyzer.downsample_lttb(trace['frequency'], trace['gain_db'], target_points)
+            downsampled[ca_combo][output_port] = {
+                'frequency': freq,
+                'gain_db': gain,
+                'count': len(freq)
+            }
+    return downsampled
+
+
+def _render_combination(session, band, lna, port, image_format):
+    """
+    Render one combination as a PDF or PNG page
+
+    Pages are served from the artifact cache when the session data is
+    unchanged; only misses query the database, build a figure and render.
+
+    Returns:
+        (bytes, cache_hit)
+    """
+    from utils.chart_generator import ChartGenerator
+    from .artifact_cache import ArtifactCache
+
+    def render():
+        grid_data = _query_grid_data(session, band, lna, port)
+        fig = ChartGenerator.create_compact_grid(
+            grid_data=grid_data,
+            band=band,
+            lna_gain_state=lna,
+            input_port=port,
+            compact_size=CHART_COMPACT_SIZE,
+            render_mode='svg'
+        )
+        return ChartGenerator.render_image(
+            fig, format=image_format, width=EXPORT_IMAGE_WIDTH, height=EXPORT_IMAGE_HEIGHT,
+            pool=_get_renderer_pool()
+        )
+
+    return ArtifactCache.get_instance().get_or_render(
+        session, band, lna, port, image_format, EXPORT_IMAGE_WIDTH, EXPORT_IMAGE_HEIGHT, render
+    )
+
+
+def _render_thumbnail(session, band, lna, port):
+    """
+    Small PNG preview of one combination (CHART_THUMBNAIL_WIDTH pixels wide)
+
+    The grid is laid out at its on-screen canvas size and scaled down, so
+    it looks like the viewer chart. Served from the artifact cache.
+
+    Returns:
+        (bytes, cache_hit)
+    """
+    from utils.chart_generator import ChartGenerator
+    from .artifact_cache import ArtifactCache
+
+    canvas_width, canvas_height = ChartGenerator.COMPACT_GRID_CANVAS
+    scale = CHART_THUMBNAIL_WIDTH / canvas_width
+    height = round(canvas_height * scale)
+
+    def render():
+        grid_data = _downsample_grid_data(
+            _query_grid_data(session, band, lna, port),
+            CHART_COMPACT_SIZE[0] * CHART_POINTS_PER_PIXEL
+        )
+        fig = ChartGenerator.create_compact_grid(
+            grid_data=grid_data,
+            band=band,
+            lna_gain_state=lna,
+            input_port=port,
+            compact_size=CHART_COMPACT_SIZE,
+            render_mode='svg'
+        )
+        return _get_renderer_pool().render(
+            fig, format='png', width=canvas_width, height=canvas_height, scale=scale
+        )
+
+    return ArtifactCache.get_instance().get_or_render(
+        session, band, lna, port, 'png', CHART_THUMBNAIL_WIDTH, height, render
+    )
+
+
 def index(request):
     """Home page - CSV upload form"""
     if request.method == 'POST':
@@ -25,8 +201,22 @@ def index(request):
     else:
         form = CsvUploadForm()
 
-    recent_sessions = MeasurementSession.objects.all()[:5]
-    context = {'form': form, 'recent_sessions': recent_sessions}
+    recent_sessions = MeasurementSession.active.listed()[:5]
+    context = {'form': form, 'snp_form': SnpUploadForm(), 'recent_sessions': recent_sessions}
+    return render(request, 'rf_analyzer/index.html', context)
+
+
+def snp_upload(request):
+    """SnP upload - parse Touchstone files directly into a new session"""
+    if request.method == 'POST':
+        snp_form = SnpUploadForm(request.POST, request.FILES)
+        if snp_form.is_valid():
+            return handle_snp_upload(request, snp_form)
+    else:
+        snp_form = SnpUploadForm()
+
+    recent_sessions = MeasurementSession.active.listed()[:5]
+    context = {'form': CsvUploadForm(), 'snp_form': snp_form, 'recent_sessions': recent_sessions}
     return render(request, 'rf_analyzer/index.html', context)
 
 
@@ -51,6 +241,7 @@ def handle_csv_upload(request, form):
         parse_csv_to_database(measurement_file)
         measurement_file.is_parsed = True
         measurement_file.save()
+        finalize_ingest(session)
 
         # Check if it's an AJAX request (XMLHttpRequest)
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -76,48 +267,224 @@ def handle_csv_upload(request, form):
             }, status=400)
         else:
             form.add_error('csv_file', f'Error parsing CSV: {str(e)}')
-            return render(request, 'rf_analyzer/index.html', {'form': form})
+            return render(request, 'rf_analyzer/index.html', {'form': form, 'snp_form': SnpUploadForm()})
+
+
+def handle_snp_upload(request, form):
+    """Handle SnP file upload: parse with the converter core and bulk insert (no CSV step)"""
+    import tempfile
+    from .snp_ingest import stage_uploaded_files, ingest_snp_files
+    from .tasks import schedule_session_purge
+
+    session = MeasurementSession.objects.create(
+        name=form.cleaned_data['session_name'],
+        description=form.cleaned_data['description'],
+        user=None
+    )
+
+    try:
+        with tempfile.TemporaryDirectory(prefix='rf_snp_') as workdir:
+            paths, warnings = stage_uploaded_files(form.cleaned_data['snp_files'], workdir)
+            if not paths:
+                raise ValueError('No SnP files found in upload')
+
+            result = ingest_snp_files(
+                session, paths,
+                max_workers=getattr(settings, 'RF_ANALYZER_SNP_INGEST_WORKERS', None)
+            )
+
+        if result['rows'] == 0:
+            raise ValueError(f"No data parsed from {len(paths)} SnP files: "
+                             f"{result['errors'][0]['error'] if result['errors'] else 'empty files'}")
+
+        finalize_ingest(session)
+
+        for error in result['errors']:
+            warnings.append(f"{error['file']}: {error['error']}")
+        if warnings:
+            print(f"[SnP Upload] Session {session.id}: {len(warnings)} files skipped")
+
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            from django.urls import reverse
+            viewer_url = reverse('rf_analyzer:viewer', kwargs={'session_id': session.id})
+            return JsonResponse({
+                'success': True,
+                'redirect_url': viewer_url,
+                'session_id': session.id,
+                'files_processed': result['files_processed'],
+                'data_points': result['rows'],
+                'warnings': warnings
+            })
+        else:
+            return redirect('rf_analyzer:viewer', session_id=session.id)
+    except Exception as e:
+        # Rows may already be inserted: hide now, delete in the background
+        schedule_session_purge(session)
+
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': False,
+                'error': str(e)
+            }, status=400)
+        else:
+            form.add_error('snp_files', f'Error parsing SnP files: {str(e)}')
+            recent_sessions = MeasurementSession.active.listed()[:5]
+            context = {'form': CsvUploadForm(), 'snp_form': form, 'recent_sessions': recent_sessions}
+            return render(request, 'rf_analyzer/index.html', context)
 
 
 def parse_csv_to_database(measurement_file):
     """Parse CSV file and save data to database"""
     file_path = Path(measurement_file.file.path)
     parser = CsvParser(file_path)
-    parser.load_consolidated()
-    df = parser.data
-
-    batch_size = 1000
-    data_points = []
-
-    for index, row in df.iterrows():
-        data_point = MeasurementData(
-            session=measurement_file.session,
-            cfg_band=row['Cfg Band'],
-            cfg_lna_gain_state=row['cfg-lna_gain_state'],
-            cfg_active_port_1=row['cfg-active_port_1'],
-            cfg_active_port_2=row['cfg-active_port_2'],
-            debug_nplexer_bank=row['debug-nplexer_bank'],
-            active_rf_path=row['Active RF Path'],
-            frequency_mhz=row['Frequency'],
-            gain_db=row['Gain (dB)']
-        )
-        data_points.append(data_point)
+    parser.load_consolidated(dtypes=CSV_DTYPES)
+    return bulk_insert_dataframe(measurement_file.session, parser.data)
 
-        if len(data_points) >= batch_size:
-            MeasurementData.objects.bulk_create(data_points)
-            data_points = []
 
-    if data_points:
-        MeasurementData.objects.bulk_create(data_points)
+def _chunked_upload_status(upload):
+    """Status payload shared by the chunked upload endpoints"""
+    from django.urls import reverse
+    from .chunked_upload import received_chunks
+    from .progress_tracker import ProgressTracker
+
+    payload = {
+        'upload_id': str(upload.upload_id),
+        'session_id': upload.session_id,
+        'status': upload.status,
+        'chunk_size': upload.chunk_size,
+        'total_chunks': upload.total_chunks,
+        'received': received_chunks(upload) if upload.status == 'uploading' else [],
+        'progress': ProgressTracker(upload.session_id).get_progress() if upload.session_id else None,
+    }
+    if upload.status == 'ingested':
+        payload['redirect_url'] = reverse('rf_analyzer:viewer', kwargs={'session_id': upload.session_id})
+    elif upload.status == 'failed':
+        payload['error'] = upload.error
+    return payload
+
+
+def upload_init(request):
+    """
+    API endpoint: Start a chunked CSV upload
+
+    Creates the session and starts the ingest thread, which parses chunks as
+    they arrive. Chunks are then sent with upload_chunk() in any order.
+    Also queues the periodic expiry of abandoned uploads.
+    """
+    import math
+    from .chunked_upload import clamp_chunk_size, ensure_ingest
+    from .models import ChunkedUpload
+    from .tasks import schedule_upload_expiry
+
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+    form = ChunkedUploadInitForm(request.POST)
+    if not form.is_valid():
+        errors = '; '.join(f'{field}: {" ".join(messages)}' for field, messages in form.errors.items())
+        return JsonResponse({'success': False, 'error': errors}, status=400)
+
+    total_size = form.cleaned_data['total_size']
+    chunk_size = clamp_chunk_size(form.cleaned_data['chunk_size'])
+
+    session = MeasurementSession.objects.create(
+        name=form.cleaned_data['session_name'],
+        description=form.cleaned_data['description'],
+        user=None
+    )
+    upload = ChunkedUpload.objects.create(
+        session=session,
+        filename=form.cleaned_data['filename'],
+        total_size=total_size,
+        chunk_size=chunk_size,
+        total_chunks=math.ceil(total_size / chunk_size)
+    )
+    ensure_ingest(upload)
+    schedule_upload_expiry()
+
+    return JsonResponse({'success': True, **_chunked_upload_status(upload)})
+
+
+def upload_chunk(request, upload_id, index):
+    """
+    API endpoint: Store one chunk (PUT, raw bytes)
+
+    Re-sending a chunk is safe, so clients retry failed chunks as-is and
+    resume an interrupted upload by sending only the missing ones.
+    """
+    from .chunked_upload import write_chunk, ensure_ingest
+    from .models import ChunkedUpload
+    from .progress_tracker import ProgressTracker
+
+    if request.method != 'PUT':
+        return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id)
+    if upload.status != 'uploading':
+        return JsonResponse({'success': False, 'error': f'Upload is {upload.status}'}, status=409)
+    if upload.session_id is None:
+        return JsonResponse({'success': False, 'error': 'Session was deleted'}, status=409)
+
+    try:
+        size = write_chunk(upload, index, request)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    ensure_ingest(upload)
+
+    return JsonResponse({
+        'success': True,
+        'index': index,
+        'size': size,
+        'progress': ProgressTracker(upload.session_id).get_progress()
+    })
+
+
+def upload_status(request, upload_id):
+    """API endpoint: Received chunks and ingest progress (used to resume)"""
+    from .chunked_upload import ensure_ingest
+    from .models import ChunkedUpload
+
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id)
+    ensure_ingest(upload)
+    return JsonResponse({'success': True, **_chunked_upload_status(upload)})
+
+
+def upload_complete(request, upload_id):
+    """
+    API endpoint: Client has sent every chunk
+
+    Returns 400 with the missing chunk indices if any are absent; otherwise
+    the current status (poll upload_status until 'ingested').
+    """
+    from .chunked_upload import ensure_ingest
+    from .models import ChunkedUpload
+
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id)
+    payload = _chunked_upload_status(upload)
+
+    if upload.status == 'uploading':
+        received = set(payload['received'])
+        missing = [index for index in range(upload.total_chunks) if index not in received]
+        if missing:
+            return JsonResponse({'success': False, 'error': 'Missing chunks', 'missing': missing}, status=400)
+        ensure_ingest(upload)
+
+    return JsonResponse({'success': upload.status != 'failed', **payload})
 
 
 def viewer(request, session_id):
     """Grid viewer page"""
-    session = get_object_or_404(MeasurementSession, id=session_id)
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
 
-    bands = MeasurementData.objects.filter(session=session).values_list('cfg_band', flat=True).distinct().order_by('cfg_band')
-    lna_states = MeasurementData.objects.filter(session=session).values_list('cfg_lna_gain_state', flat=True).distinct().order_by('cfg_lna_gain_state')
-    input_ports = MeasurementData.objects.filter(session=session).values_list('cfg_active_port_1', flat=True).distinct().order_by('cfg_active_port_1')
+    # Dropdown values come from the combination index (no scan of MeasurementData)
+    facets = session.get_facets()
+    bands = facets['bands']
+    lna_states = facets['lna_states']
+    input_ports = facets['input_ports']
 
     selected_band = request.GET.get('band', bands[0] if bands else None)
     selected_lna = request.GET.get('lna', lna_states[0] if lna_states else None)
@@ -135,121 +502,279 @@ def viewer(request, session_id):
     return render(request, 'rf_analyzer/viewer.html', context)
 
 
+def _server_timing(response, timings):
+    """
+    Attach a Server-Timing header (visible in browser devtools)
+
+    Args:
+        timings: {metric: seconds}
+    """
+    response['Server-Timing'] = ', '.join(
+        f'{name};dur={seconds * 1000:.1f}' for name, seconds in timings.items()
+    )
+    return response
+
+
+def _chart_body(session, band, lna, port, kind, full_resolution=False, timings=None):
+    """
+    Response body of the chart endpoints as JSON bytes
+
+    Downsampled bodies are kept in the artifact cache (keyed by session data
+    version and _chart_variant()), so repeat views and combinations pre-built
+    by the warmup job skip the query, LTTB, figure build and serialization.
+
+    Traces are WebGL (scattergl) when the grid has more than
+    RF_ANALYZER_WEBGL_POINT_THRESHOLD points; 'render_mode' reports the choice.
+
+    Args:
+        kind: 'chart' (serialized Plotly figure) or 'buffers' (packed float32 traces)
+        full_resolution: Every measured point (not cached)
+        timings: Optional dict filled with per-step durations on a miss
+
+    Returns:
+        (bytes, cache_hit)
+    """
+    import json
+    import time
+    from utils.chart_generator import ChartGenerator
+    from .artifact_cache import ArtifactCache
+    from .chart_payload import encode_compact_grid
+
+    timings = timings if timings is not None else {}
+    webgl_threshold = getattr(settings, 'RF_ANALYZER_WEBGL_POINT_THRESHOLD', None)
+
+    def render():
+        # Query data points organized into grid structure
+        started = time.perf_counter()
+        grid_data = _query_grid_data(session, band, lna, port)
+        data_points = sum(d[p]['count'] for d in grid_data.values() for p in d)
+        timings['db'] = time.perf_counter() - started
+
+        if not full_resolution:
+            started = time.perf_counter()
+            grid_data = _downsample_grid_data(grid_data, CHART_COMPACT_SIZE[0] * CHART_POINTS_PER_PIXEL)
+            timings['lttb'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if kind == 'chart':
+            fig = ChartGenerator.create_compact_grid(
+                grid_data=grid_data,
+                band=band,
+                lna_gain_state=lna,
+                input_port=port,
+                compact_size=CHART_COMPACT_SIZE,
+                webgl_threshold=webgl_threshold
+            )
+            payload = {
+                'success': True,
+                'chart': fig.to_json(),
+                'render_mode': ChartGenerator.render_mode_of(fig),
+                'data_points': data_points,
+                'rendered_points': sum(d[p]['count'] for d in grid_data.values() for p in d),
+                'downsampled': not full_resolution
+            }
+            timings['figure'] = time.perf_counter() - started
+        else:
+            spec = ChartGenerator.create_compact_grid_spec(
+                grid_data, band, lna, port, webgl_threshold=webgl_threshold
+            )
+            encoded = encode_compact_grid(spec)
+            payload = {
+                'success': True,
+                **encoded,
+                'render_mode': 'webgl' if spec['layout']['trace_type'] == 'scattergl' else 'svg',
+                'data_points': data_points,
+                'rendered_points': sum(t['length'] for t in encoded['traces']),
+                'downsampled': not full_resolution
+            }
+            timings['pack'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        body = json.dumps(payload).encode()
+        timings['serialize'] = time.perf_counter() - started
+        return body
+
+    if full_resolution:
+        return render(), False
+
+    return ArtifactCache.get_instance().get_or_render(
+        session, band, lna, port, f'{kind}.json', *CHART_COMPACT_SIZE, render, variant=_chart_variant()
+    )
+
+
+def _chart_response(request, session_id, kind):
+    """Shared handler of the chart endpoints (parameters, cache lookup, timings)"""
+    import time
+
+    cpu_started = time.thread_time()
+    timings = {}
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
+
+    band = request.GET.get('band')
+    lna = request.GET.get('lna')
+    port = request.GET.get('port')
+    if not all([band, lna, port]):
+        return JsonResponse({'error': 'Missing parameters'}, status=400)
+
+    body, cache_hit = _chart_body(
+        session, band, lna, port, kind,
+        full_resolution=request.GET.get('full') == '1', timings=timings
+    )
+
+    response = HttpResponse(body, content_type='application/json')
+    response['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+    timings['cpu'] = time.thread_time() - cpu_started
+    return _server_timing(response, timings)
+
+
+@compress_response
+@session_conditional('chart', variant=_chart_variant)
 def get_chart_data(request, session_id):
     """
     API endpoint: Get chart data as JSON
+
+    Traces are LTTB-downsampled to the subplot pixel width;
+    pass full=1 for every measured point.
     """
-    session = get_object_or_404(MeasurementSession, id=session_id)
-    
+    return _chart_response(request, session_id, 'chart')
+
+
+@compress_response
+@session_conditional('chart-buffers', variant=_chart_variant)
+def get_chart_buffers(request, session_id):
+    """
+    API endpoint: Data-only chart payload (client assembles the Plotly figure)
+
+    Same query and LTTB step as get_chart_data, but returns grid layout
+    metadata plus trace values as base64 little-endian float32 buffers
+    instead of a serialized figure.
+    """
+    return _chart_response(request, session_id, 'buffers')
+
+
+@session_conditional('thumbnail')
+def get_chart_thumbnail(request, session_id):
+    """API endpoint: PNG preview of one combination"""
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
+
     band = request.GET.get('band')
     lna = request.GET.get('lna')
     port = request.GET.get('port')
-    
     if not all([band, lna, port]):
         return JsonResponse({'error': 'Missing parameters'}, status=400)
-    
-    # Get grid data from database
-    from utils.chart_generator import ChartGenerator
-    
-    # Query data points
-    data_points = MeasurementData.objects.filter(
-        session=session,
-        cfg_band=band,
-        cfg_lna_gain_state=lna,
-        cfg_active_port_1=port
-    ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz')
-    
-    # Organize into grid structure
-    grid_data = {}
-    for point in data_points:
-        ca_combo = point.debug_nplexer_bank
-        output_port = point.cfg_active_port_2
-        
-        if ca_combo not in grid_data:
-            grid_data[ca_combo] = {}
-        
-        if output_port not in grid_data[ca_combo]:
-            grid_data[ca_combo][output_port] = {
-                'frequency': [],
-                'gain_db': [],
-                'count': 0
-            }
-        
-        grid_data[ca_combo][output_port]['frequency'].append(float(point.frequency_mhz))
-        grid_data[ca_combo][output_port]['gain_db'].append(float(point.gain_db))
-        grid_data[ca_combo][output_port]['count'] += 1
 
-    # Generate Plotly figure
-    fig = ChartGenerator.create_compact_grid(
-        grid_data=grid_data,
-        band=band,
-        lna_gain_state=lna,
-        input_port=port,
-        compact_size=(300, 200)
-    )
-    
-    # Return as JSON
+    try:
+        image_bytes, cache_hit = _render_thumbnail(session, band, lna, port)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+    response = HttpResponse(image_bytes, content_type='image/png')
+    response['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+    return response
+
+
+def warm_chart_cache(session, band, lna, port, thumbnails=True):
+    """
+    Pre-build the cached chart bodies (and thumbnail) of one combination
+
+    Returns:
+        int: Number of artifacts built (0 if all were already cached)
+    """
+    built = 0
+    for kind in ('buffers', 'chart'):
+        built += not _chart_body(session, band, lna, port, kind)[1]
+    if thumbnails:
+        built += not _render_thumbnail(session, band, lna, port)[1]
+    return built
+
+
+def warmup_session(request, session_id):
+    """
+    API endpoint: Chart cache warmup job
+
+    POST starts the job; GET returns its progress. Cancel it with
+    cancel_task?task=warmup.
+    """
+    from .progress_tracker import ProgressTracker
+    from .tasks import schedule_session_warmup
+
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
+
+    if request.method == 'POST':
+        schedule_session_warmup(session)
+        return JsonResponse({'success': True, 'message': 'Warmup scheduled'})
+
     return JsonResponse({
         'success': True,
-        'chart': fig.to_json(),
-        'data_points': sum(d[p]['count'] for d in grid_data.values() for p in d)
+        'progress': ProgressTracker(f'warmup_{session.id}').get_progress()
     })
 
 
-def export_pdf(request, session_id):
+@compress_response
+def compare_sessions(request):
     """
-    API endpoint: Export current chart as PDF
+    API endpoint: Overlay one Band/LNA/Port combination across sessions
+
+    Query: sessions=<id>,<id>,... reference=<id> (default: first) band, lna, port
+
+    Each session's traces come from a single query; every CA/output cell is
+    interpolated onto the reference frequencies, with per-session deltas
+    against the reference and min/max envelopes. Results are cached by the
+    set of session data versions and last-modified times.
     """
-    session = get_object_or_404(MeasurementSession, id=session_id)
+    import time
+    from .comparison import COMPARE_MAX_SESSIONS, build_comparison
 
+    timings = {}
     band = request.GET.get('band')
     lna = request.GET.get('lna')
     port = request.GET.get('port')
 
+    try:
+        session_ids = list(dict.fromkeys(int(x) for x in request.GET.get('sessions', '').split(',') if x.strip()))
+        reference_id = int(request.GET.get('reference') or session_ids[0])
+    except (ValueError, IndexError):
+        return JsonResponse({'error': 'Invalid sessions parameter'}, status=400)
+
     if not all([band, lna, port]):
         return JsonResponse({'error': 'Missing parameters'}, status=400)
+    if not 2 <= len(session_ids) <= COMPARE_MAX_SESSIONS:
+        return JsonResponse({'error': f'Select 2-{COMPARE_MAX_SESSIONS} sessions'}, status=400)
+    if reference_id not in session_ids:
+        return JsonResponse({'error': 'Reference must be one of the sessions'}, status=400)
+
+    sessions_by_id = MeasurementSession.active.in_bulk(session_ids)
+    missing = [sid for sid in session_ids if sid not in sessions_by_id]
+    if missing:
+        return JsonResponse({'error': f'Session not found: {missing}'}, status=404)
+
+    started = time.perf_counter()
+    body, cache_hit = build_comparison(
+        [sessions_by_id[sid] for sid in session_ids], reference_id, band, lna, port
+    )
+    timings['compare'] = time.perf_counter() - started
 
-    # Get grid data (same as get_chart_data)
-    from utils.chart_generator import ChartGenerator
-
-    data_points = MeasurementData.objects.filter(
-        session=session,
-        cfg_band=band,
-        cfg_lna_gain_state=lna,
-        cfg_active_port_1=port
-    ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz')
+    response = HttpResponse(body, content_type='application/json')
+    response['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+    return _server_timing(response, timings)
 
-    # Organize into grid structure
-    grid_data = {}
-    for point in data_points:
-        ca_combo = point.debug_nplexer_bank
-        output_port = point.cfg_active_port_2
 
-        if ca_combo not in grid_data:
-            grid_data[ca_combo] = {}
-
-        if output_port not in grid_data[ca_combo]:
-            grid_data[ca_combo][output_port] = {
-                'frequency': [],
-                'gain_db': [],
-                'count': 0
-            }
+@session_conditional('export-pdf')
+def export_pdf(request, session_id):
+    """
+    API endpoint: Export current chart as PDF
+    """
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
 
-        grid_data[ca_combo][output_port]['frequency'].append(float(point.frequency_mhz))
-        grid_data[ca_combo][output_port]['gain_db'].append(float(point.gain_db))
-        grid_data[ca_combo][output_port]['count'] += 1
+    band = request.GET.get('band')
+    lna = request.GET.get('lna')
+    port = request.GET.get('port')
 
-    # Generate Plotly figure
-    fig = ChartGenerator.create_compact_grid(
-        grid_data=grid_data,
-        band=band,
-        lna_gain_state=lna,
-        input_port=port,
-        compact_size=(300, 200)
-    )
+    if not all([band, lna, port]):
+        return JsonResponse({'error': 'Missing parameters'}, status=400)
 
-    # Export to PDF using kaleido
-    pdf_bytes = fig.to_image(format='pdf', width=1920, height=1200)
+    # Render (or reuse) the page via the artifact cache
+    pdf_bytes, _ = _render_combination(session, band, lna, port, 'pdf')
 
     # Return PDF as downloadable file
     filename = f'chart_{band}_{lna}_{port}.pdf'
@@ -264,30 +789,24 @@ def export_full_report_pdf(request, session_id):
     API endpoint: Export full report PDF with all Band/LNA/Port combinations
     """
     import time
+    from .exporters import export_file_response
+    from .pdf_merge import StreamingPdfMerger
     from .progress_tracker import ProgressTracker
     
-    session = get_object_or_404(MeasurementSession, id=session_id)
-
-    # Get all available combinations from database
-    from django.db.models import Q
-    from utils.chart_generator import ChartGenerator
-    import io
-    from PyPDF2 import PdfMerger
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
 
     # Get unique combinations that have data
-    combinations = MeasurementData.objects.filter(
-        session=session
-    ).values('cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1').distinct().order_by(
-        'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'
-    )
+    combinations = list(session.get_combinations())
 
-    if not combinations.exists():
+    if not combinations:
         return JsonResponse({'error': 'No data available'}, status=404)
 
-    # Create PDF merger
-    merger = PdfMerger()
+    # Create PDF merger writing straight into a spooled temp file
+    output = _new_export_spool()
+    merger = StreamingPdfMerger(output)
     total_pages = 0
-    total_combinations = combinations.count()
+    cached_pages = 0
+    total_combinations = len(combinations)
 
     # Initialize progress tracker
     tracker = ProgressTracker(session_id)
@@ -304,78 +823,47 @@ def export_full_report_pdf(request, session_id):
 
     start_time = time.time()
 
-    # Generate PDF for each combination
-    for idx, combo in enumerate(combinations, 1):
-        band = combo['cfg_band']
-        lna = combo['cfg_lna_gain_state']
-        port = combo['cfg_active_port_1']
-
-        # Get grid data for this combination
-        data_points = MeasurementData.objects.filter(
-            session=session,
-            cfg_band=band,
-            cfg_lna_gain_state=lna,
-            cfg_active_port_1=port
-        ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz')
-
-        # Organize into grid structure
-        grid_data = {}
-        for point in data_points:
-            ca_combo = point.debug_nplexer_bank
-            output_port = point.cfg_active_port_2
-
-            if ca_combo not in grid_data:
-                grid_data[ca_combo] = {}
-
-            if output_port not in grid_data[ca_combo]:
-                grid_data[ca_combo][output_port] = {
-                    'frequency': [],
-                    'gain_db': [],
-                    'count': 0
-                }
-
-            grid_data[ca_combo][output_port]['frequency'].append(float(point.frequency_mhz))
-            grid_data[ca_combo][output_port]['gain_db'].append(float(point.gain_db))
-            grid_data[ca_combo][output_port]['count'] += 1
-
-        # Generate Plotly figure
-        fig = ChartGenerator.create_compact_grid(
-            grid_data=grid_data,
-            band=band,
-            lna_gain_state=lna,
-            input_port=port,
-            compact_size=(300, 200)
-        )
+    try:
+        # Generate PDF for each combination
+        for idx, combo in enumerate(combinations, 1):
+            band = combo.cfg_band
+            lna = combo.cfg_lna_gain_state
+            port = combo.cfg_active_port_1
 
-        # Export to PDF
-        pdf_bytes = fig.to_image(format='pdf', width=1920, height=1200)
+            # Render page (artifact cache skips query, figure build and kaleido when unchanged)
+            pdf_bytes, cache_hit = _render_combination(session, band, lna, port, 'pdf')
+            cached_pages += cache_hit
 
-        # Append to merger
-        pdf_stream = io.BytesIO(pdf_bytes)
-        merger.append(pdf_stream)
-        total_pages += 1
+            # Append to merger (page is written out immediately, buffer released)
+            total_pages += merger.append(pdf_bytes)
+            del pdf_bytes
 
-        # Check if task was cancelled
-        if tracker.is_cancelled():
-            print(f"[Full Report PDF] Task cancelled by user at {idx}/{total_combinations}")
-            tracker.complete(success=False, message=f'Task cancelled after processing {idx}/{total_combinations} pages')
-            return JsonResponse({'error': 'Task cancelled by user'}, status=400)
+            # Check if task was cancelled
+            if tracker.is_cancelled():
+                print(f"[Full Report PDF] Task cancelled by user at {idx}/{total_combinations}")
+                tracker.complete(success=False, message=f'Task cancelled after processing {idx}/{total_combinations} pages')
+                output.close()
+                return JsonResponse({'error': 'Task cancelled by user'}, status=400)
 
-        # Update progress tracker and log
-        current_item = f'{band} {lna} {port}'
-        tracker.update(idx, current_item)
+            # Update progress tracker and log
+            current_item = f'{band} {lna} {port}'
+            tracker.update(idx, current_item)
         
-        elapsed = time.time() - start_time
-        avg_time_per_page = elapsed / idx
-        remaining_pages = total_combinations - idx
-        estimated_remaining = avg_time_per_page * remaining_pages
-        print(f"[Full Report PDF] Progress: {idx}/{total_combinations} - {current_item} - Elapsed: {elapsed:.1f}s - ETA: {estimated_remaining:.1f}s")
-
-    # Write merged PDF to output
-    output = io.BytesIO()
-    merger.write(output)
-    merger.close()
-    output.seek(0)
+            elapsed = time.time() - start_time
+            avg_time_per_page = elapsed / idx
+            remaining_pages = total_combinations - idx
+            estimated_remaining = avg_time_per_page * remaining_pages
+            print(f"[Full Report PDF] Progress: {idx}/{total_combinations} - {current_item} - Elapsed: {elapsed:.1f}s - ETA: {estimated_remaining:.1f}s")
+
+        # Write page tree and xref, then rewind for streaming
+        merger.finish(title=f'Full Report - {session.name}')
+        output.seek(0)
+    except Exception as e:
+        # Release the partial spool and unblock progress pollers
+        output.close()
+        tracker.complete(success=False, message=f'Error: {str(e)}')
+        print(f"[Full Report PDF] Error: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
 
     # Calculate total time
     total_time = time.time() - start_time
@@ -387,76 +875,164 @@ def export_full_report_pdf(request, session_id):
     print()
     print("=" * 60)
     print(f"[Full Report PDF] Generation complete!")
-    print(f"[Full Report PDF] Total pages: {total_pages}")
+    print(f"[Full Report PDF] Total pages: {total_pages} ({cached_pages} from artifact cache)")
     print(f"[Full Report PDF] Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
     print(f"[Full Report PDF] Average time per page: {total_time/total_pages:.1f} seconds")
     print("=" * 60)
     print()
 
-    # Return as downloadable file
+    # Stream as downloadable file (spooled file is closed when the response finishes)
     filename = f'full_report_{session.name}_{total_pages}pages.pdf'
-    response = HttpResponse(output.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return export_file_response(request, output, filename, 'application/pdf')
 
-    return response
 
 
 
+def export_csv(request, session_id):
+    """
+    API endpoint: Stream all measurement data of a session as CSV
+    """
+    from .exporters import stream_measurement_csv
 
-def cancel_task(request, session_id):
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
+    data = MeasurementData.objects.filter(session=session)
+    return stream_measurement_csv(data, filename=f'{session.name}_measurement_data.csv', request=request)
+
+
+async def cancel_task(request, session_id):
     """
     API endpoint: Cancel ongoing PDF generation task
+
+    Async so that, under ASGI, the request never queues behind a running
+    sync export; the export sees the flag on its next is_cancelled() check.
+    ?task=warmup cancels the session's chart warmup job instead.
     """
     from .progress_tracker import ProgressTracker
-    
-    tracker = ProgressTracker(session_id)
-    tracker.cancel()
-    
+
+    if request.GET.get('task') == 'warmup':
+        tracker = ProgressTracker(f'warmup_{session_id}')
+    else:
+        tracker = ProgressTracker(session_id)
+    await tracker.acancel()
+
     return JsonResponse({
         'success': True,
         'message': 'Task cancellation requested'
     })
 
-def progress_stream(request, session_id):
+
+PROGRESS_FINAL_STATES = ('completed', 'failed', 'cancelled')
+PROGRESS_MAX_DURATION = 3600  # 1 hour maximum per stream
+PROGRESS_HEARTBEAT_INTERVAL = 15  # Seconds between keep-alive comments when idle
+PROGRESS_POLL_INTERVAL = 0.5  # WSGI stream: seconds between cache reads
+
+
+def _progress_event(progress_data, last_sent):
     """
-    SSE endpoint for real-time progress updates
-    Returns Server-Sent Events stream
+    SSE message for one progress read (shared by the ASGI and WSGI streams)
+
+    Returns:
+        (message or None, last_sent, finished)
     """
-    from django.http import StreamingHttpResponse
-    from .progress_tracker import ProgressTracker
     import json
+
+    if progress_data:
+        finished = progress_data['status'] in PROGRESS_FINAL_STATES
+        if progress_data != last_sent:
+            return f"data: {json.dumps(progress_data)}\n\n", progress_data, finished
+        return None, last_sent, finished
+
+    if last_sent is None:
+        # No progress data yet, send waiting message once
+        waiting = {'status': 'waiting', 'message': 'Waiting for task to start...'}
+        return f"data: {json.dumps(waiting)}\n\n", {}, False
+
+    return None, last_sent, False
+
+
+PROGRESS_STREAM_CLOSED = 'data: {"status": "done", "message": "Stream closed"}\n\n'
+
+
+async def _progress_events_async(session_id):
+    """ASGI stream: parked on a ProgressNotifier event between changes"""
+    import asyncio
+    from .progress_tracker import ProgressTracker, ProgressNotifier
+
+    tracker = ProgressTracker(session_id)
+    changed = ProgressNotifier.subscribe(tracker.cache_key)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PROGRESS_MAX_DURATION
+    last_sent = None
+
+    try:
+        while loop.time() < deadline:
+            # Clear before reading so a write landing mid-read is not missed
+            changed.clear()
+            message, last_sent, finished = _progress_event(await tracker.aget_progress(), last_sent)
+            if message:
+                yield message
+            if finished:
+                break
+
+            timeout = min(PROGRESS_HEARTBEAT_INTERVAL, max(deadline - loop.time(), 0))
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+    finally:
+        ProgressNotifier.unsubscribe(tracker.cache_key, changed)
+
+    yield PROGRESS_STREAM_CLOSED
+
+
+def _progress_events_sync(session_id):
+    """WSGI stream: polls the cache (holds one server thread per watcher)"""
     import time
+    from .progress_tracker import ProgressTracker
 
-    def event_stream():
-        """Generator function that yields SSE formatted messages"""
-        tracker = ProgressTracker(session_id)
+    tracker = ProgressTracker(session_id)
+    deadline = time.monotonic() + PROGRESS_MAX_DURATION
+    last_sent = None
+    last_yield = time.monotonic()
 
-        # Keep streaming until task completes or times out
-        max_duration = 3600  # 1 hour maximum
-        check_interval = 0.5  # Check every 0.5 seconds
-        elapsed = 0
+    while time.monotonic() < deadline:
+        message, last_sent, finished = _progress_event(tracker.get_progress(), last_sent)
+        if message:
+            yield message
+            last_yield = time.monotonic()
+        if finished:
+            break
 
-        while elapsed < max_duration:
-            progress_data = tracker.get_progress()
+        if time.monotonic() - last_yield >= PROGRESS_HEARTBEAT_INTERVAL:
+            yield ": heartbeat\n\n"
+            last_yield = time.monotonic()
+        time.sleep(PROGRESS_POLL_INTERVAL)
 
-            if progress_data:
-                # Format as SSE message
-                yield f"data: {json.dumps(progress_data)}\n\n"
+    yield PROGRESS_STREAM_CLOSED
 
-                # Check if task is complete
-                if progress_data['status'] in ['completed', 'failed']:
-                    break
-            else:
-                # No progress data yet, send waiting message
-                yield f"data: {json.dumps({'status': 'waiting', 'message': 'Waiting for task to start...'})}\n\n"
 
-            time.sleep(check_interval)
-            elapsed += check_interval
+async def progress_stream(request, session_id):
+    """
+    SSE endpoint for real-time progress updates
+    Returns Server-Sent Events stream
 
-        # Send final completion message
-        yield f"data: {json.dumps({'status': 'done', 'message': 'Stream closed'})}\n\n"
+    Under ASGI (config/asgi.py) each watcher is a coroutine parked on a
+    ProgressNotifier event rather than a worker thread, so many tabs can
+    watch progress from a single process; a comment heartbeat is sent while
+    idle, which also re-reads the cache in case the task runs in another
+    process. WSGI servers (runserver, gunicorn sync workers) would collect
+    an async iterator into a list before sending anything, so there the
+    stream is a sync generator polling the cache instead.
+    """
+    from django.http import StreamingHttpResponse
+    from .exporters import is_asgi
+
+    if is_asgi(request):
+        events = _progress_events_async(session_id)
+    else:
+        events = _progress_events_sync(session_id)
 
-    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
     response['Cache-Control'] = 'no-cache'
     response['X-Accel-Buffering'] = 'no'  # Disable nginx buffering
     return response
@@ -464,11 +1040,15 @@ def progress_stream(request, session_id):
 
 def delete_session(request, session_id):
     """Delete a measurement session"""
+    from .tasks import schedule_session_purge
+
     try:
-        session = MeasurementSession.objects.get(id=session_id)
+        session = MeasurementSession.active.get(id=session_id)
         session_name = session.name
-        session.delete()  # Cascade delete will handle related files and data
-        
+
+        # Hide immediately; data rows, files and cached artifacts are purged in the background
+        schedule_session_purge(session)
+
         if request.htmx:
             # HTMX request - return success message
             return HttpResponse(f'<div class="alert alert-success">Session "{session_name}" deleted successfully</div>')
@@ -488,7 +1068,7 @@ def update_session(request, session_id):
         return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
 
     try:
-        session = MeasurementSession.objects.get(id=session_id)
+        session = MeasurementSession.active.get(id=session_id)
 
         # Get new values from request
         new_name = request.POST.get('name', '').strip()
@@ -498,7 +1078,7 @@ def update_session(request, session_id):
         if not new_name:
             return JsonResponse({'success': False, 'error': 'Name cannot be empty'}, status=400)
 
-        # Update fields
+        # Update fields (save() refreshes updated_at, which changes chart ETags/Last-Modified)
         session.name = new_name
         session.description = new_description
         session.save()
@@ -519,28 +1099,22 @@ def export_full_report_ppt(request, session_id):
     API endpoint: Export full report PPT with all Band/LNA/Port combinations
     """
     import time
-    import tempfile
-    import shutil
+    from .exporters import export_file_response
     from .progress_tracker import ProgressTracker
     
-    session = get_object_or_404(MeasurementSession, id=session_id)
+    session = get_object_or_404(MeasurementSession.active, id=session_id)
 
     # Import PPT generator from prototype
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'prototype'))
     from utils.ppt_generator import PptGenerator
-    from utils.chart_generator import ChartGenerator
 
     # Get all available combinations from database
-    combinations = MeasurementData.objects.filter(
-        session=session
-    ).values('cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1').distinct().order_by(
-        'cfg_band', 'cfg_lna_gain_state', 'cfg_active_port_1'
-    )
+    combinations = list(session.get_combinations())
 
-    if not combinations.exists():
+    if not combinations:
         return JsonResponse({'error': 'No data available'}, status=404)
 
-    total_combinations = combinations.count()
+    total_combinations = len(combinations)
 
     # Initialize progress tracker
     tracker = ProgressTracker(session_id)
@@ -557,73 +1131,30 @@ def export_full_report_ppt(request, session_id):
 
     start_time = time.time()
 
-    # Create temporary directory for PNG files
-    temp_dir = Path(tempfile.mkdtemp(prefix='ppt_export_'))
-    
     try:
         # Initialize PPT generator (no template for now)
         ppt_gen = PptGenerator(template_path=None)
+        cached_slides = 0
         
         # Generate PNG and add slide for each combination
         for idx, combo in enumerate(combinations, 1):
-            band = combo['cfg_band']
-            lna = combo['cfg_lna_gain_state']
-            port = combo['cfg_active_port_1']
-
-            # Get grid data for this combination
-            data_points = MeasurementData.objects.filter(
-                session=session,
-                cfg_band=band,
-                cfg_lna_gain_state=lna,
-                cfg_active_port_1=port
-            ).order_by('debug_nplexer_bank', 'cfg_active_port_2', 'frequency_mhz')
-
-            # Organize into grid structure
-            grid_data = {}
-            for point in data_points:
-                ca_combo = point.debug_nplexer_bank
-                output_port = point.cfg_active_port_2
-
-                if ca_combo not in grid_data:
-                    grid_data[ca_combo] = {}
-
-                if output_port not in grid_data[ca_combo]:
-                    grid_data[ca_combo][output_port] = {
-                        'frequency': [],
-                        'gain_db': [],
-                        'count': 0
-                    }
-
-                grid_data[ca_combo][output_port]['frequency'].append(float(point.frequency_mhz))
-                grid_data[ca_combo][output_port]['gain_db'].append(float(point.gain_db))
-                grid_data[ca_combo][output_port]['count'] += 1
-
-            # Generate Plotly figure
-            fig = ChartGenerator.create_compact_grid(
-                grid_data=grid_data,
-                band=band,
-                lna_gain_state=lna,
-                input_port=port,
-                compact_size=(300, 200)
-            )
+            band = combo.cfg_band
+            lna = combo.cfg_lna_gain_state
+            port = combo.cfg_active_port_1
 
-            # Export to PNG (PPT requires PNG)
-            png_filename = f'{band}_{lna}_{port}.png'
-            png_path = temp_dir / png_filename
-            png_bytes = fig.to_image(format='png', width=1920, height=1200)
-            
-            with open(png_path, 'wb') as f:
-                f.write(png_bytes)
+            # Render PNG (PPT requires PNG) via the artifact cache and insert straight from memory
+            png_bytes, cache_hit = _render_combination(session, band, lna, port, 'png')
+            cached_slides += cache_hit
 
             # Add slide to PPT
             title = f'{band} {lna} {port} LNA Gain'
-            ppt_gen.add_slide_with_image(title, png_path)
+            ppt_gen.add_slide_with_image(title, png_bytes)
+            del png_bytes
 
             # Check if task was cancelled
             if tracker.is_cancelled():
                 print(f"[Full Report PPT] Task cancelled by user at {idx}/{total_combinations}")
                 tracker.complete(success=False, message=f'Task cancelled after processing {idx}/{total_combinations} slides')
-                shutil.rmtree(temp_dir)
                 return JsonResponse({'error': 'Task cancelled by user'}, status=400)
 
             # Update progress tracker and log
@@ -636,9 +1167,11 @@ def export_full_report_ppt(request, session_id):
             estimated_remaining = avg_time_per_slide * remaining_slides
             print(f"[Full Report PPT] Progress: {idx}/{total_combinations} - {current_item} - Elapsed: {elapsed:.1f}s - ETA: {estimated_remaining:.1f}s")
 
-        # Save PPT to temporary file
-        output_ppt_path = temp_dir / 'full_report.pptx'
-        ppt_gen.save(output_ppt_path)
+        # Save PPT to a spooled file (stays in memory when small, rolls over to disk when large)
+        output = _new_export_spool()
+        ppt_gen.save(output)
+        del ppt_gen
+        output.seek(0)
 
         # Calculate total time
         total_time = time.time() - start_time
@@ -650,30 +1183,22 @@ def export_full_report_ppt(request, session_id):
         print()
         print("=" * 60)
         print(f"[Full Report PPT] Generation complete!")
-        print(f"[Full Report PPT] Total slides: {total_combinations}")
+        print(f"[Full Report PPT] Total slides: {total_combinations} ({cached_slides} from artifact cache)")
         print(f"[Full Report PPT] Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
         print(f"[Full Report PPT] Average time per slide: {total_time/total_combinations:.1f} seconds")
         print("=" * 60)
         print()
 
-        # Read PPT file
-        with open(output_ppt_path, 'rb') as f:
-            ppt_data = f.read()
-
-        # Cleanup temporary directory
-        shutil.rmtree(temp_dir)
-
-        # Return as downloadable file
+        # Stream as downloadable file (spooled file is closed when the response finishes)
         filename = f'full_report_{session.name}_{total_combinations}slides.pptx'
-        response = HttpResponse(ppt_data, content_type='application/vnd.openxmlformats-officedocument.presentationml.presentation')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-        return response
+        return export_file_response(
+            request,
+            output,
+            filename,
+            'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+        )
 
     except Exception as e:
-        # Cleanup on error
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
         tracker.complete(success=False, message=f'Error: {str(e)}')
         print(f"[Full Report PPT] Error: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
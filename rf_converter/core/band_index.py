@@ -0,0 +1,182 @@
+"""Shared 3GPP band table and vectorized frequency-span to band lookup.
+
+BandIntervalIndex holds the band edges as NumPy arrays so that the frequency
+spans of many traces are matched against every band in one broadcast,
+instead of a Python loop over ~50 bands per trace.
+
+Example:
+    >>> index = BandIntervalIndex.default('rx')
+    >>> index.assign([2110.0, 2496.0], [2170.0, 2690.0])
+    array(['B1', 'B41'], dtype=object)
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# Complete 3GPP band configurations (MHz) - Based on TS 36.101
+# Format: 'Band': ((uplink_min, uplink_max), (downlink_min, downlink_max))
+DEFAULT_BAND_CONFIG: Dict[str, tuple] = {
+    # ==================== GSM Bands (Legacy) ====================
+    'GSM850': ((824, 849), (869, 894)),      # Cellular (Americas)
+    'GSM900': ((890, 915), (935, 960)),      # Extended GSM (Global)
+    'DCS': ((1710, 1785), (1805, 1880)),     # DCS 1800 (Europe/Asia)
+    'PCS': ((1850, 1910), (1930, 1990)),     # PCS 1900 (Americas)
+
+    # ==================== LTE FDD Bands ====================
+    'B1': ((1920, 1980), (2110, 2170)),      # IMT (Global)
+    'B2': ((1850, 1910), (1930, 1990)),      # PCS (Americas)
+    'B3': ((1710, 1785), (1805, 1880)),      # DCS (Europe/Asia)
+    'B4': ((1710, 1755), (2110, 2155)),      # AWS-1 (Americas)
+    'B5': ((824, 849), (869, 894)),          # Cellular (Americas)
+    'B7': ((2500, 2570), (2620, 2690)),      # IMT-E (Europe/Asia)
+    'B8': ((880, 915), (925, 960)),          # Extended GSM (Global)
+    'B11': ((1427.9, 1447.9), (1475.9, 1495.9)),  # Lower PDC (Japan)
+    'B12': ((699, 716), (729, 746)),         # Lower SMH (Americas)
+    'B13': ((777, 787), (746, 756)),         # Upper SMH (Americas)
+    'B14': ((788, 798), (758, 768)),         # Upper SMH (Public Safety)
+    'B17': ((704, 716), (734, 746)),         # Lower SMH (Americas)
+    'B18': ((815, 830), (860, 875)),         # Lower 800 (Japan)
+    'B19': ((830, 845), (875, 890)),         # Upper 800 (Japan)
+    'B20': ((832, 862), (791, 821)),         # Digital Dividend (Europe)
+    'B21': ((1447.9, 1462.9), (1495.9, 1510.9)),  # Upper PDC (Japan)
+    'B25': ((1850, 1915), (1930, 1995)),     # Extended PCS (Americas)
+    'B26': ((814, 849), (859, 894)),         # Extended Cellular (Americas)
+    'B28': ((703, 748), (758, 803)),         # APT (Asia-Pacific)
+    'B30': ((2305, 2315), (2350, 2360)),     # WCS (Americas)
+    'B31': ((452.5, 457.5), (462.5, 467.5)), # NMT (South America)
+    'B32': ((1452, 1496), (1452, 1496)),     # L-Band SDL (Supplemental Downlink)
+    'B65': ((1920, 2010), (2110, 2200)),     # Extended IMT (Global)
+    'B66': ((1710, 1780), (2110, 2200)),     # Extended AWS (Americas)
+    'B70': ((1695, 1710), (1995, 2020)),     # Supplementary AWS (Americas)
+    'B71': ((663, 698), (617, 652)),         # Digital Dividend (Americas)
+    'B72': ((451, 456), (461, 466)),         # PMR (Europe)
+    'B73': ((450, 455), (460, 465)),         # PMR (Asia-Pacific)
+    'B74': ((1427, 1470), (1475, 1518)),     # Lower L-Band (Global)
+    'B85': ((698, 716), (728, 746)),         # Extended Lower SMH (Americas)
+    'B87': ((410, 415), (420, 425)),         # PMR (Global)
+    'B88': ((412, 417), (422, 427)),         # PMR (Global)
+
+    # ==================== LTE TDD Bands ====================
+    # TDD bands use same frequency for uplink/downlink (time-multiplexed)
+    'B34': ((2010, 2025), (2010, 2025)),     # IMT
+    'B37': ((1910, 1930), (1910, 1930)),     # PCS
+    'B38': ((2570, 2620), (2570, 2620)),     # IMT-E
+    'B39': ((1880, 1920), (1880, 1920)),     # DCS-IMT Gap
+    'B40': ((2300, 2400), (2300, 2400)),     # S-Band (Asia)
+    'B41': ((2496, 2690), (2496, 2690)),     # BRS (Global)
+    'B42': ((3400, 3600), (3400, 3600)),     # CBRS (Global)
+    'B43': ((3600, 3800), (3600, 3800)),     # C-Band (Global)
+    'B46': ((5150, 5925), (5150, 5925)),     # U-NII (Unlicensed)
+    'B48': ((3550, 3700), (3550, 3700)),     # CBRS (Americas)
+    'B50': ((1432, 1517), (1432, 1517)),     # L-Band
+    'B51': ((1427, 1432), (1427, 1432)),     # L-Band Extension
+    'B53': ((2483.5, 2495), (2483.5, 2495)), # S-Band
+
+    # ==================== Custom/Extended Bands ====================
+    'B202': ((2483.5, 2500), (2483.5, 2500)),      # Wide-band sweep (Custom)
+}
+
+
+class BandIntervalIndex:
+    """Band frequency intervals for one direction, matched against trace spans.
+
+    A trace span [freq_min, freq_max] is assigned to a band when the band
+    covers at least ``min_coverage`` of the span. Among those, the band with
+    the highest overlap / union ratio wins (ties go to the narrower band,
+    then to LTE 'B' names over the GSM aliases they duplicate, e.g. B3 over
+    DCS), so a B1 downlink sweep maps to B1 rather than to the wider B65/B66
+    that also contain it. Zero-width spans (single frequency) match the
+    narrowest band containing them.
+
+    Attributes:
+        bands: Band names, LTE bands first, otherwise in table order
+        low: Lower band edges (MHz)
+        high: Upper band edges (MHz)
+    """
+
+    DEFAULT_MIN_COVERAGE = 0.5
+
+    _defaults: Dict[str, 'BandIntervalIndex'] = {}
+
+    def __init__(self, band_config: Optional[Dict[str, tuple]] = None, direction: str = 'rx'):
+        """Build the index.
+
+        Args:
+            band_config: {'Band': (uplink_range, downlink_range)}, default DEFAULT_BAND_CONFIG
+            direction: 'rx' for downlink ranges, 'tx' for uplink ranges
+        """
+        band_config = DEFAULT_BAND_CONFIG if band_config is None else band_config
+        self.direction = 'tx' if direction.lower() == 'tx' else 'rx'
+        slot = 0 if self.direction == 'tx' else 1
+
+        # argmax keeps the first of equal scores, so LTE names go first
+        names = sorted(band_config, key=lambda band: not band.startswith('B'))
+        self.bands = np.array(names, dtype=object)
+        edges = np.array([band_config[band][slot] for band in self.bands], dtype=np.float64).reshape(-1, 2)
+        self.low = edges[:, 0]
+        self.high = edges[:, 1]
+
+    @classmethod
+    def default(cls, direction: str = 'rx') -> 'BandIntervalIndex':
+        """Shared index over DEFAULT_BAND_CONFIG, built once per direction."""
+        key = 'tx' if direction.lower() == 'tx' else 'rx'
+        if key not in cls._defaults:
+            cls._defaults[key] = cls(DEFAULT_BAND_CONFIG, key)
+        return cls._defaults[key]
+
+    def __len__(self) -> int:
+        return len(self.bands)
+
+    def scores(self, freq_min, freq_max, min_coverage: float = DEFAULT_MIN_COVERAGE) -> np.ndarray:
+        """Match score of every span against every band.
+
+        Args:
+            freq_min: Span start per trace (MHz), scalar or array
+            freq_max: Span end per trace (MHz), scalar or array
+            min_coverage: Minimum fraction of the span a band must cover
+
+        Returns:
+            (traces, bands) array of overlap / union ratios, -inf where the
+            band does not qualify
+        """
+        freq_min = np.atleast_1d(np.asarray(freq_min, dtype=np.float64))[:, np.newaxis]
+        freq_max = np.atleast_1d(np.asarray(freq_max, dtype=np.float64))[:, np.newaxis]
+        span = freq_max - freq_min
+
+        overlap = np.minimum(freq_max, self.high) - np.maximum(freq_min, self.low)
+        union = np.maximum(freq_max, self.high) - np.minimum(freq_min, self.low)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coverage = np.where(span > 0, overlap / span, np.where(overlap >= 0, 1.0, 0.0))
+            ratio = np.where(union > 0, overlap / union, 1.0)
+
+        # Tie-break towards narrower bands without reordering distinct ratios
+        score = ratio - (self.high - self.low) * 1e-9
+        return np.where(coverage >= min_coverage, score, -np.inf)
+
+    def assign(self, freq_min, freq_max, min_coverage: float = DEFAULT_MIN_COVERAGE) -> np.ndarray:
+        """Best band per span.
+
+        Returns:
+            Object array of band names, None where no band qualifies
+        """
+        scores = self.scores(freq_min, freq_max, min_coverage)
+        result = np.full(len(scores), None, dtype=object)
+        if len(self.bands) == 0:
+            return result
+
+        best = scores.argmax(axis=1)
+        matched = np.isfinite(scores[np.arange(len(scores)), best])
+        result[matched] = self.bands[best[matched]]
+        return result
+
+    def candidates(self, freq_min, freq_max, min_coverage: float = DEFAULT_MIN_COVERAGE) -> List[List[str]]:
+        """All qualifying bands per span, best match first."""
+        scores = self.scores(freq_min, freq_max, min_coverage)
+        order = np.argsort(-scores, axis=1, kind='stable')
+        ranked = np.take_along_axis(scores, order, axis=1)
+        return [
+            self.bands[row_order[np.isfinite(row_scores)]].tolist()
+            for row_order, row_scores in zip(order, ranked)
+        ]
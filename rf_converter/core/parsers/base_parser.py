@@ -6,6 +6,8 @@ from typing import Dict, List, Optional
 import pandas as pd
 import re
 
+from ..band_index import BandIntervalIndex, DEFAULT_BAND_CONFIG
+
 
 class BaseMeasurementParser(ABC):
     """
@@ -26,6 +28,7 @@ class BaseMeasurementParser(ABC):
         """
         self.band_config = band_config or self._default_band_config()
         self.measurement_type = self.get_measurement_type()
+        self._band_indexes: Dict[str, BandIntervalIndex] = {}
 
     @staticmethod
     def _default_band_config() -> Dict[str, tuple]:
@@ -41,67 +44,10 @@ class BaseMeasurementParser(ABC):
         Usage:
         - Rx Gain measurements: Use downlink (second tuple)
         - Tx Power measurements: Use uplink (first tuple)
+
+        The table itself lives in core.band_index (shared with BandIntervalIndex)
         """
-        return {
-            # ==================== GSM Bands (Legacy) ====================
-            'GSM850': ((824, 849), (869, 894)),      # Cellular (Americas)
-            'GSM900': ((890, 915), (935, 960)),      # Extended GSM (Global)
-            'DCS': ((1710, 1785), (1805, 1880)),     # DCS 1800 (Europe/Asia)
-            'PCS': ((1850, 1910), (1930, 1990)),     # PCS 1900 (Americas)
-
-            # ==================== LTE FDD Bands ====================
-            'B1': ((1920, 1980), (2110, 2170)),      # IMT (Global)
-            'B2': ((1850, 1910), (1930, 1990)),      # PCS (Americas)
-            'B3': ((1710, 1785), (1805, 1880)),      # DCS (Europe/Asia)
-            'B4': ((1710, 1755), (2110, 2155)),      # AWS-1 (Americas)
-            'B5': ((824, 849), (869, 894)),          # Cellular (Americas)
-            'B7': ((2500, 2570), (2620, 2690)),      # IMT-E (Europe/Asia)
-            'B8': ((880, 915), (925, 960)),          # Extended GSM (Global)
-            'B11': ((1427.9, 1447.9), (1475.9, 1495.9)),  # Lower PDC (Japan)
-            'B12': ((699, 716), (729, 746)),         # Lower SMH (Americas)
-            'B13': ((777, 787), (746, 756)),         # Upper SMH (Americas)
-            'B14': ((788, 798), (758, 768)),         # Upper SMH (Public Safety)
-            'B17': ((704, 716), (734, 746)),         # Lower SMH (Americas)
-            'B18': ((815, 830), (860, 875)),         # Lower 800 (Japan)
-            'B19': ((830, 845), (875, 890)),         # Upper 800 (Japan)
-            'B20': ((832, 862), (791, 821)),         # Digital Dividend (Europe)
-            'B21': ((1447.9, 1462.9), (1495.9, 1510.9)),  # Upper PDC (Japan)
-            'B25': ((1850, 1915), (1930, 1995)),     # Extended PCS (Americas)
-            'B26': ((814, 849), (859, 894)),         # Extended Cellular (Americas)
-            'B28': ((703, 748), (758, 803)),         # APT (Asia-Pacific)
-            'B30': ((2305, 2315), (2350, 2360)),     # WCS (Americas)
-            'B31': ((452.5, 457.5), (462.5, 467.5)), # NMT (South America)
-            'B32': ((1452, 1496), (1452, 1496)),     # L-Band SDL (Supplemental Downlink)
-            'B65': ((1920, 2010), (2110, 2200)),     # Extended IMT (Global)
-            'B66': ((1710, 1780), (2110, 2200)),     # Extended AWS (Americas)
-            'B70': ((1695, 1710), (1995, 2020)),     # Supplementary AWS (Americas)
-            'B71': ((663, 698), (617, 652)),         # Digital Dividend (Americas)
-            'B72': ((451, 456), (461, 466)),         # PMR (Europe)
-            'B73': ((450, 455), (460, 465)),         # PMR (Asia-Pacific)
-            'B74': ((1427, 1470), (1475, 1518)),     # Lower L-Band (Global)
-            'B85': ((698, 716), (728, 746)),         # Extended Lower SMH (Americas)
-            'B87': ((410, 415), (420, 425)),         # PMR (Global)
-            'B88': ((412, 417), (422, 427)),         # PMR (Global)
-
-            # ==================== LTE TDD Bands ====================
-            # TDD bands use same frequency for uplink/downlink (time-multiplexed)
-            'B34': ((2010, 2025), (2010, 2025)),     # IMT
-            'B37': ((1910, 1930), (1910, 1930)),     # PCS
-            'B38': ((2570, 2620), (2570, 2620)),     # IMT-E
-            'B39': ((1880, 1920), (1880, 1920)),     # DCS-IMT Gap
-            'B40': ((2300, 2400), (2300, 2400)),     # S-Band (Asia)
-            'B41': ((2496, 2690), (2496, 2690)),     # BRS (Global)
-            'B42': ((3400, 3600), (3400, 3600)),     # CBRS (Global)
-            'B43': ((3600, 3800), (3600, 3800)),     # C-Band (Global)
-            'B46': ((5150, 5925), (5150, 5925)),     # U-NII (Unlicensed)
-            'B48': ((3550, 3700), (3550, 3700)),     # CBRS (Americas)
-            'B50': ((1432, 1517), (1432, 1517)),     # L-Band
-            'B51': ((1427, 1432), (1427, 1432)),     # L-Band Extension
-            'B53': ((2483.5, 2495), (2483.5, 2495)), # S-Band
-
-            # ==================== Custom/Extended Bands ====================
-            'B202': ((2483.5, 2500), (2483.5, 2500)),      # Wide-band sweep (Custom)
-        }
+        return dict(DEFAULT_BAND_CONFIG)
 
     # ========== Abstract Methods (Must Implement) ==========
 
@@ -164,7 +110,9 @@ class BaseMeasurementParser(ABC):
         Args:
             snp_file: Path to .s2p file
             freq_filter: Apply band-specific frequency filtering
-            auto_band: Auto-detect band from filename
+            auto_band: Auto-detect band from filename, falling back to the
+                       measured frequency span (detect_band) when the
+                       filename has no known band tag
             mapper: Optional BandMapper instance for notation translation
 
         Returns:
@@ -183,12 +131,20 @@ class BaseMeasurementParser(ABC):
         reader = SnpReader(snp_file)
         s_params_df = reader.read()
 
+        # Determine direction from measurement type
+        direction = 'tx' if self.measurement_type == 'tx_power' else 'rx'
+
+        # No band tag in the filename: detect it from the measured span
+        if auto_band and 'band' not in metadata and len(s_params_df):
+            frequency = s_params_df['frequency']
+            band = self.detect_band(frequency.min(), frequency.max(), direction)[0]
+            if band is not None:
+                metadata['band'] = band
+
         # Filter frequencies if enabled
         if freq_filter and auto_band:
             band = metadata.get('band')
             if band and band in self.band_config:
-                # Determine direction from measurement type
-                direction = 'tx' if self.measurement_type == 'tx_power' else 'rx'
                 s_params_df = self.filter_frequency(s_params_df, band, direction)
 
         # Calculate metrics (pass mapper to subclass)
@@ -264,6 +220,39 @@ class BaseMeasurementParser(ABC):
         match = re.match(r'(B\d+)', band_str)
         return match.group(1) if match else band_str
 
+    def band_index(self, direction: str = 'rx') -> BandIntervalIndex:
+        """
+        Band interval index over this parser's band_config (built once per direction)
+
+        Args:
+            direction: 'rx' for downlink ranges, 'tx' for uplink ranges
+        """
+        direction = 'tx' if direction.lower() == 'tx' else 'rx'
+        if direction not in self._band_indexes:
+            if self.band_config == DEFAULT_BAND_CONFIG:
+                self._band_indexes[direction] = BandIntervalIndex.default(direction)
+            else:
+                self._band_indexes[direction] = BandIntervalIndex(self.band_config, direction)
+        return self._band_indexes[direction]
+
+    def detect_band(self, freq_min, freq_max, direction: str = 'rx'):
+        """
+        Assign bands to measured frequency spans (MHz) in one vectorized pass
+
+        Args:
+            freq_min: Span start per trace (scalar or array)
+            freq_max: Span end per trace (scalar or array)
+            direction: 'rx' (downlink) or 'tx' (uplink)
+
+        Returns:
+            Object array of band names, None where no band covers the span
+
+        Examples:
+            >>> parser.detect_band([2110, 1805], [2170, 1880])
+            array(['B1', 'B3'], dtype=object)
+        """
+        return self.band_index(direction).assign(freq_min, freq_max)
+
     def filter_frequency(
         self,
         df: pd.DataFrame,
@@ -0,0 +1,134 @@
+"""
+Unit tests for BandIntervalIndex and span-based band detection
+
+Tests cover:
+- Band assignment from frequency spans (Rx/Tx directions)
+- Tie-breaking between overlapping bands
+- Vectorized assignment over many spans
+- parse_file() fallback for filenames without a band tag
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.band_index import BandIntervalIndex, DEFAULT_BAND_CONFIG
+from core.parsers.rx_parser import RxGainParser
+
+
+class TestBandIntervalIndex(unittest.TestCase):
+    """Test suite for BandIntervalIndex"""
+
+    def setUp(self):
+        self.index = BandIntervalIndex.default('rx')
+
+    def test_default_index_is_shared(self):
+        """Test that the default index is built once per direction"""
+        self.assertIs(BandIntervalIndex.default('rx'), self.index)
+        self.assertIsNot(BandIntervalIndex.default('tx'), self.index)
+        self.assertEqual(len(self.index), len(DEFAULT_BAND_CONFIG))
+
+    def test_assign_downlink_spans(self):
+        """Test that exact downlink sweeps map to their band, not wider supersets"""
+        result = self.index.assign([2110, 1805, 2496, 2620], [2170, 1880, 2690, 2690])
+        self.assertEqual(result.tolist(), ['B1', 'B3', 'B41', 'B7'])
+
+    def test_assign_uplink_spans(self):
+        """Test Tx direction uses uplink ranges"""
+        result = BandIntervalIndex.default('tx').assign(1920, 1980)
+        self.assertEqual(result.tolist(), ['B1'])
+
+    def test_lte_name_preferred_over_gsm_alias(self):
+        """Test identical ranges resolve to the LTE band name"""
+        self.assertEqual(self.index.assign(869, 894).tolist(), ['B5'])
+        self.assertEqual(self.index.assign(1930, 1990).tolist(), ['B2'])
+
+    def test_wide_sweep_has_no_band(self):
+        """Test that a full sweep is not forced into a single band"""
+        self.assertIsNone(self.index.assign(500, 6000)[0])
+
+    def test_single_frequency_uses_narrowest_band(self):
+        """Test zero-width span matches the narrowest containing band"""
+        self.assertEqual(self.index.assign(2015, 2015).tolist(), ['B34'])
+
+    def test_candidates_ranked(self):
+        """Test candidate list is ordered best match first"""
+        candidates = self.index.candidates([2110], [2170])[0]
+        self.assertEqual(candidates[0], 'B1')
+        self.assertIn('B65', candidates)
+        self.assertIn('B66', candidates)
+
+    def test_vectorized_matches_scalar(self):
+        """Test batch assignment equals one-at-a-time assignment"""
+        rng = np.random.default_rng(0)
+        low = rng.uniform(400, 5000, 200)
+        high = low + rng.uniform(0, 200, 200)
+
+        batch = self.index.assign(low, high)
+        single = [self.index.assign(lo, hi)[0] for lo, hi in zip(low, high)]
+        self.assertEqual(batch.tolist(), single)
+
+    def test_custom_band_config(self):
+        """Test parser with custom band_config builds its own index"""
+        parser = RxGainParser({'BX': ((100, 200), (300, 400))})
+        self.assertEqual(parser.detect_band(310, 390).tolist(), ['BX'])
+        self.assertIsNot(parser.band_index(), self.index)
+
+
+class TestParseFileBandFallback(unittest.TestCase):
+    """Test parse_file() band detection for filenames without a band tag"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.parser = RxGainParser()
+
+    def tearDown(self):
+        for file in self.temp_dir.glob("*"):
+            file.unlink()
+        self.temp_dir.rmdir()
+
+    def create_s2p(self, name, freqs_mhz):
+        """Helper to create a minimal RI-format s2p file"""
+        file_path = self.temp_dir / name
+        lines = ["# MHz S RI R 50"]
+        for freq in freqs_mhz:
+            lines.append(f"{freq} 0.1 0 3.0 0 0.01 0 0.1 0")
+        file_path.write_text("\n".join(lines) + "\n")
+        return file_path
+
+    def test_band_detected_from_span(self):
+        """Test untagged file gets band and frequency filter from its span"""
+        file_path = self.create_s2p("X_ANT1_(G0H).s2p", [2100, 2110, 2140, 2170, 2180])
+
+        df = self.parser.parse_file(file_path)
+
+        self.assertEqual(df['Cfg Band'].iloc[0], 'B1')
+        self.assertEqual(df['Frequency'].tolist(), [2110, 2140, 2170])
+
+    def test_tagged_file_unchanged(self):
+        """Test filename band tag still takes precedence"""
+        file_path = self.create_s2p("X_ANT1_B3@1_(G0H).s2p", [1800, 1805, 1880, 2140])
+
+        df = self.parser.parse_file(file_path)
+
+        self.assertEqual(df['Cfg Band'].iloc[0], 'B3')
+        self.assertEqual(df['Frequency'].tolist(), [1805, 1880])
+
+    def test_auto_band_disabled(self):
+        """Test no detection or filtering when auto_band is off"""
+        file_path = self.create_s2p("X_ANT1_(G0H).s2p", [2100, 2140, 2180])
+
+        df = self.parser.parse_file(file_path, auto_band=False)
+
+        self.assertEqual(df['Cfg Band'].iloc[0], 'Unknown')
+        self.assertEqual(len(df), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()